@@ -2,6 +2,7 @@
 
 import logging
 import sys
+from pathlib import Path
 from typing import Optional
 
 import click
@@ -249,8 +250,6 @@ def configure(ctx: click.Context) -> None:
     )
 
     # Create config file
-    from pathlib import Path
-
     config_file = Path.home() / ".aws-cloud-utilities.env"
 
     with open(config_file, "w") as f:
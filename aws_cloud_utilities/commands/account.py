@@ -1,19 +1,78 @@
 """Account management commands."""
 
 import logging
-from typing import Any, Dict, List
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
 
 import click
+import jmespath
+from botocore.config import Config as BotoConfig
+from botocore.exceptions import ClientError
 from rich.console import Console
+from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ..core.auth import AWSAuth
 from ..core.config import Config
 from ..core.exceptions import AWSError
-from ..core.utils import parallel_execute, print_output
+from ..core.utils import print_output
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Display label -> ContactInformation key for the primary account contact
+PRIMARY_CONTACT_FIELDS = (
+    ("Full Name", "FullName"),
+    ("Company Name", "CompanyName"),
+    ("Address Line 1", "AddressLine1"),
+    ("Address Line 2", "AddressLine2"),
+    ("City", "City"),
+    ("State/Province", "StateOrRegion"),
+    ("Postal Code", "PostalCode"),
+    ("Country Code", "CountryCode"),
+    ("Phone Number", "PhoneNumber"),
+    ("Website URL", "WebsiteUrl"),
+)
+
+# Upper bound on concurrent regions; CloudFormation throttles wide fan-outs
+MAX_REGION_WORKERS = 16
+
+# Adaptive retries absorb ListStacks throttling during the region fan-out
+CFN_BOTO_CONFIG = BotoConfig(retries={"mode": "adaptive", "max_attempts": 10})
+
+# Stack states considered when looking for Control Tower/Landing Zone stacks
+STACK_STATUS_FILTER = [
+    "CREATE_COMPLETE",
+    "UPDATE_COMPLETE",
+    "CREATE_FAILED",
+    "ROLLBACK_COMPLETE",
+    "UPDATE_ROLLBACK_COMPLETE",
+    "IMPORT_COMPLETE",
+    "IMPORT_ROLLBACK_COMPLETE",
+]
+
+# Projection of ListStacks pages down to the fields detection and the report use
+_STACK_SUMMARY_FIELDS = jmespath.compile(
+    "StackSummaries[].{StackName: StackName, StackStatus: StackStatus, "
+    "CreationTime: CreationTime}"
+)
+
+# Error codes that make --use-tagging-api fall back to ListStacks
+ACCESS_DENIED_CODES = ("AccessDenied", "AccessDeniedException", "UnauthorizedOperation")
+
+# Patterns that suggest Control Tower deployment
+CONTROLTOWER_PATTERNS = ("AWSControlTower", "AWS-Control-Tower", "ControlTower")
+
+# Patterns that suggest Landing Zone deployment
+LANDINGZONE_PATTERNS = ("LandingZone", "AWS-Landing-Zone", "Landing-Zone")
+
+
+# Compiled once; the re engine checks every pattern in a single pass
+_CT_MATCH = re.compile("|".join(map(re.escape, CONTROLTOWER_PATTERNS))).search
+_LZ_MATCH = re.compile("|".join(map(re.escape, LANDINGZONE_PATTERNS))).search
+
 
 @click.group(name="account")
 def account_group():
@@ -101,18 +160,12 @@ def contact_info(ctx: click.Context) -> None:
         try:
             response = account_client.get_contact_information()
             contact_info = response.get("ContactInformation", {})
+            # Field names only; the values are personal contact details
+            logger.debug("contact_info fields: %s", sorted(contact_info))
 
             primary_contact = {
-                "Full Name": contact_info.get("FullName", "Not set"),
-                "Company Name": contact_info.get("CompanyName", "Not set"),
-                "Address Line 1": contact_info.get("AddressLine1", "Not set"),
-                "Address Line 2": contact_info.get("AddressLine2", "Not set"),
-                "City": contact_info.get("City", "Not set"),
-                "State/Province": contact_info.get("StateOrRegion", "Not set"),
-                "Postal Code": contact_info.get("PostalCode", "Not set"),
-                "Country Code": contact_info.get("CountryCode", "Not set"),
-                "Phone Number": contact_info.get("PhoneNumber", "Not set"),
-                "Website URL": contact_info.get("WebsiteUrl", "Not set"),
+                label: contact_info.get(key, "Not set")
+                for label, key in PRIMARY_CONTACT_FIELDS
             }
 
             print_output(
@@ -129,36 +182,17 @@ def contact_info(ctx: click.Context) -> None:
         # Get alternate contacts
         try:
             alternate_types = ["BILLING", "OPERATIONS", "SECURITY"]
-            alternate_contacts = []
-
-            for contact_type in alternate_types:
-                try:
-                    response = account_client.get_alternate_contact(
-                        AlternateContactType=contact_type
-                    )
 
-                    alternate_contact = response.get("AlternateContact", {})
-                    alternate_contacts.append(
-                        {
-                            "Type": contact_type,
-                            "Name": alternate_contact.get("Name", "Not set"),
-                            "Title": alternate_contact.get("Title", "Not set"),
-                            "Email": alternate_contact.get("EmailAddress", "Not set"),
-                            "Phone": alternate_contact.get("PhoneNumber", "Not set"),
-                        }
-                    )
-
-                except Exception as e:
-                    logger.debug(f"Could not get {contact_type} alternate contact: {e}")
-                    alternate_contacts.append(
-                        {
-                            "Type": contact_type,
-                            "Name": "Not configured",
-                            "Title": "Not configured",
-                            "Email": "Not configured",
-                            "Phone": "Not configured",
-                        }
+            # The three lookups are independent, so issue them concurrently
+            with ThreadPoolExecutor(max_workers=len(alternate_types)) as executor:
+                alternate_contacts = list(
+                    executor.map(
+                        lambda contact_type: _get_alternate_contact(
+                            account_client, contact_type
+                        ),
+                        alternate_types,
                     )
+                )
 
             if alternate_contacts:
                 print_output(
@@ -183,86 +217,140 @@ def contact_info(ctx: click.Context) -> None:
     is_flag=True,
     help="Enable verbose output showing region-by-region progress",
 )
+@click.option(
+    "--quick",
+    is_flag=True,
+    help="Stop scanning as soon as both Control Tower and Landing Zone are found",
+)
+@click.option(
+    "--use-tagging-api",
+    is_flag=True,
+    help="List stack names via the Resource Groups Tagging API (tagged stacks only)",
+)
 @click.pass_context
-def detect_control_tower(ctx: click.Context, verbose: bool) -> None:
+def detect_control_tower(
+    ctx: click.Context, verbose: bool, quick: bool, use_tagging_api: bool
+) -> None:
     """Detect AWS Control Tower or Landing Zone deployments."""
     config: Config = ctx.obj["config"]
     aws_auth: AWSAuth = ctx.obj["aws_auth"]
 
     try:
-        # Get caller identity for context
-        caller_identity = aws_auth.get_caller_identity()
-        account_id = caller_identity.get("Account", "Unknown")
+        # Create the session up front so the lookups below can share it
+        aws_auth.ensure_session()
 
-        console.print(
-            f"[blue]Scanning account {account_id} for Control Tower/Landing Zone deployments...[/blue]"
-        )
+        # Region discovery and the caller identity are independent round trips
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            regions_future = executor.submit(
+                aws_auth.get_available_regions, "cloudformation"
+            )
 
-        # Get all regions
-        regions = aws_auth.get_available_regions("cloudformation")
+            # Get caller identity for context
+            caller_identity = aws_auth.get_caller_identity()
+            account_id = caller_identity.get("Account", "Unknown")
+
+            console.print(
+                f"[blue]Scanning account {account_id} for Control Tower/Landing Zone deployments...[/blue]"
+            )
+
+            # Get all regions
+            regions = regions_future.result()
 
         if verbose:
             console.print(
                 f"[dim]Checking {len(regions)} regions for CloudFormation stacks...[/dim]"
             )
 
-        # Function to list stacks in a region
-        def list_stacks_in_region(region: str) -> tuple[str, List[Dict[str, Any]]]:
+        # Detection flags shared by the region workers; once both are set in
+        # quick mode, the remaining pagination is abandoned
+        found = {"controltower": False, "landingzone": False}
+        found_lock = threading.Lock()
+        done = threading.Event()
+
+        # Matching stacks from every region; deque.extend is thread-safe
+        detected_stacks: Deque[Dict[str, Any]] = deque()
+
+        # Function to scan the stacks of a region, returning the stack count.
+        # Errors are returned rather than printed so only the main thread
+        # writes to the console.
+        def scan_region(region: str) -> Tuple[int, Optional[Exception]]:
             try:
-                cf_client = aws_auth.get_client("cloudformation", region_name=region)
-                paginator = cf_client.get_paginator("list_stacks")
-
-                stack_status_filter = [
-                    "CREATE_COMPLETE",
-                    "UPDATE_COMPLETE",
-                    "CREATE_FAILED",
-                    "ROLLBACK_COMPLETE",
-                    "UPDATE_ROLLBACK_COMPLETE",
-                    "IMPORT_COMPLETE",
-                    "IMPORT_ROLLBACK_COMPLETE",
-                ]
-
-                stacks = []
-                for page in paginator.paginate(StackStatusFilter=stack_status_filter):
-                    stacks.extend(page.get("StackSummaries", []))
-
-                if verbose:
-                    console.print(
-                        f"[dim]Region {region}: {len(stacks)} stacks found[/dim]"
+                stack_count = 0
+                for stacks in _region_stack_pages(
+                    aws_auth, region, use_tagging_api, done if quick else None
+                ):
+                    stack_count += len(stacks)
+                    controltower, landingzone, detected = (
+                        _detect_controltower_landingzone(stacks)
                     )
+                    for stack in detected:
+                        stack["Region"] = region
+                    detected_stacks.extend(detected)
+
+                    if controltower or landingzone:
+                        with found_lock:
+                            found["controltower"] |= controltower
+                            found["landingzone"] |= landingzone
+                            if quick and all(found.values()):
+                                done.set()
 
-                return region, stacks
+                return stack_count, None
 
             except Exception as e:
-                if verbose:
-                    console.print(f"[yellow]Region {region}: Error - {e}[/yellow]")
-                return region, []
-
-        # Get stacks from all regions in parallel
-        all_stacks = []
-        region_results = parallel_execute(
-            list_stacks_in_region,
-            regions,
-            max_workers=config.workers,
-            show_progress=not verbose,
-            description="Scanning regions for CloudFormation stacks",
-        )
+                return 0, e
 
-        # Aggregate all stacks
+        # Scan all regions in parallel
         total_stacks = 0
-        for region, stacks in region_results:
-            if stacks:
-                all_stacks.extend(stacks)
-                total_stacks += len(stacks)
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            disable=verbose,
+        ) as progress:
+            task = progress.add_task(
+                "Scanning regions for CloudFormation stacks", total=len(regions)
+            )
+            with ThreadPoolExecutor(
+                max_workers=max(
+                    1, min(config.workers, MAX_REGION_WORKERS, len(regions))
+                )
+            ) as executor:
+                futures = {
+                    executor.submit(scan_region, region): region for region in regions
+                }
 
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        continue
+                    region = futures[future]
+                    stack_count, error = future.result()
+                    total_stacks += stack_count
+                    progress.advance(task)
+
+                    if verbose:
+                        if error is None:
+                            console.print(
+                                f"[dim]Region {region}: {stack_count} stacks found[/dim]"
+                            )
+                        else:
+                            console.print(
+                                f"[yellow]Region {region}: Error - {error}[/yellow]"
+                            )
+
+                    if done.is_set():
+                        for pending in futures:
+                            pending.cancel()
+
+        if done.is_set():
+            console.print(
+                "[dim]Control Tower and Landing Zone found; stopped scanning early[/dim]"
+            )
         console.print(
             f"[dim]Total stacks found across all regions: {total_stacks}[/dim]"
         )
 
-        # Detect Control Tower and Landing Zone patterns
-        controltower_detected, landingzone_detected, detected_stacks = (
-            _detect_controltower_landingzone(all_stacks)
-        )
+        controltower_detected = found["controltower"]
+        landingzone_detected = found["landingzone"]
 
         # Prepare results
         detection_results = {
@@ -287,7 +375,7 @@ def detect_control_tower(ctx: click.Context, verbose: bool) -> None:
                 stack_details.append(
                     {
                         "Stack Name": stack.get("StackName", ""),
-                        "Status": stack.get("StackStatus", ""),
+                        "Status": stack.get("StackStatus") or "",
                         "Region": stack.get("Region", "Unknown"),
                         "Created": (
                             stack.get("CreationTime", "").strftime("%Y-%m-%d")
@@ -519,17 +607,121 @@ def validate(ctx: click.Context) -> None:
         raise click.Abort()
 
 
+def _iter_stack_pages(
+    cf_client: Any, stop: Optional[threading.Event] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield CloudFormation stack summaries one ListStacks page at a time.
+
+    Each summary is trimmed to StackName, StackStatus and CreationTime.
+
+    Args:
+        cf_client: CloudFormation client
+        stop: Optional event; pagination ends once it is set
+
+    Yields:
+        Stack summaries of each page
+    """
+    paginator = cf_client.get_paginator("list_stacks")
+    for page in paginator.paginate(StackStatusFilter=STACK_STATUS_FILTER):
+        yield _STACK_SUMMARY_FIELDS.search(page) or []
+        if stop is not None and stop.is_set():
+            return
+
+
+def _iter_tagged_stack_pages(
+    tagging_client: Any, stop: Optional[threading.Event] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield name-only stack summaries from the Resource Groups Tagging API.
+
+    Only stacks that carry at least one tag are returned, but each entry is
+    an ARN plus tags rather than a full ListStacks summary.
+
+    Args:
+        tagging_client: Resource Groups Tagging API client
+        stop: Optional event; pagination ends once it is set
+
+    Yields:
+        Stack summaries holding only ``StackName`` for each page
+    """
+    paginator = tagging_client.get_paginator("get_resources")
+    for page in paginator.paginate(ResourceTypeFilters=["cloudformation:stack"]):
+        # arn:aws:cloudformation:<region>:<account>:stack/<name>/<id>
+        yield [
+            {"StackName": mapping["ResourceARN"].split(":", 5)[5].split("/")[1]}
+            for mapping in page.get("ResourceTagMappingList", [])
+        ]
+        if stop is not None and stop.is_set():
+            return
+
+
+def _region_stack_pages(
+    aws_auth: AWSAuth,
+    region: str,
+    use_tagging_api: bool = False,
+    stop: Optional[threading.Event] = None,
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield stack summary pages for a region.
+
+    With ``use_tagging_api`` the Resource Groups Tagging API is tried first,
+    falling back to ListStacks when access to it is denied.
+
+    Args:
+        aws_auth: AWS authentication instance
+        region: Region to scan
+        use_tagging_api: Whether to list stacks via the tagging API
+        stop: Optional event; pagination ends once it is set
+
+    Yields:
+        Stack summaries of each page
+    """
+    if use_tagging_api:
+        tagging_client = aws_auth.get_client(
+            "resourcegroupstaggingapi", region_name=region
+        )
+        try:
+            yield from _iter_tagged_stack_pages(tagging_client, stop)
+            return
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in ACCESS_DENIED_CODES:
+                raise
+            logger.debug(f"Tagging API denied in {region}, using ListStacks: {e}")
+
+    cf_client = aws_auth.get_client(
+        "cloudformation", region_name=region, config=CFN_BOTO_CONFIG
+    )
+    yield from _iter_stack_pages(cf_client, stop)
+
+
+def _get_alternate_contact(account_client: Any, contact_type: str) -> Dict[str, str]:
+    """Get a single alternate contact as a display row."""
+    try:
+        response = account_client.get_alternate_contact(
+            AlternateContactType=contact_type
+        )
+    except Exception as e:
+        logger.debug(f"Could not get {contact_type} alternate contact: {e}")
+        return {
+            "Type": contact_type,
+            "Name": "Not configured",
+            "Title": "Not configured",
+            "Email": "Not configured",
+            "Phone": "Not configured",
+        }
+
+    alternate_contact = response.get("AlternateContact", {})
+    return {
+        "Type": contact_type,
+        "Name": alternate_contact.get("Name", "Not set"),
+        "Title": alternate_contact.get("Title", "Not set"),
+        "Email": alternate_contact.get("EmailAddress", "Not set"),
+        "Phone": alternate_contact.get("PhoneNumber", "Not set"),
+    }
+
+
 def _detect_controltower_landingzone(
     stacks: List[Dict[str, Any]],
 ) -> tuple[bool, bool, List[Dict[str, Any]]]:
     """Detect Control Tower and Landing Zone deployments from CloudFormation stacks."""
-
-    # Patterns that suggest Control Tower deployment
-    controltower_patterns = ["AWSControlTower", "AWS-Control-Tower", "ControlTower"]
-
-    # Patterns that suggest Landing Zone deployment
-    landingzone_patterns = ["LandingZone", "AWS-Landing-Zone", "Landing-Zone"]
-
     found_controltower = False
     found_landingzone = False
     detected_stacks = []
@@ -538,17 +730,13 @@ def _detect_controltower_landingzone(
         stack_name = stack.get("StackName", "")
 
         # Check for Control Tower patterns
-        for pattern in controltower_patterns:
-            if pattern in stack_name:
-                found_controltower = True
-                detected_stacks.append(stack)
-                break
+        if _CT_MATCH(stack_name):
+            found_controltower = True
+            detected_stacks.append(stack)
 
         # Check for Landing Zone patterns
-        for pattern in landingzone_patterns:
-            if pattern in stack_name:
-                found_landingzone = True
-                detected_stacks.append(stack)
-                break
+        if _LZ_MATCH(stack_name):
+            found_landingzone = True
+            detected_stacks.append(stack)
 
     return found_controltower, found_landingzone, detected_stacks
@@ -5,10 +5,12 @@ import json
 import logging
 import os
 import re
-from collections import defaultdict
+import tempfile
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import click
 from rich.console import Console
@@ -23,9 +25,24 @@ from ..core.utils import (
     save_to_file,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional C extension
+    orjson = None
+
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Concurrent S3 GETs when downloading Config files; the work is pure I/O
+CONFIG_DOWNLOAD_WORKERS = 32
+
+# Files fetched ahead of the one being written, bounding parsed records held
+CONFIG_FILES_IN_FLIGHT = CONFIG_DOWNLOAD_WORKERS * 2
+
+# Date embedded in Config file keys, and the characters it is made of
+CONFIG_DATE_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2})")
+_DATE_CHARS = frozenset("0123456789-")
+
 # Resource types to check for compliance
 SUPPORTED_RESOURCE_TYPES = [
     "AWS::EC2::Instance",
@@ -90,7 +107,7 @@ def awsconfig_group():
     help="Output format (default: csv)",
 )
 @click.option(
-    "--keep-temp-files", is_flag=True, help="Keep downloaded temporary JSON files"
+    "--keep-temp-files", is_flag=True, help="Save copies of the downloaded JSON files"
 )
 @click.pass_context
 def download(
@@ -516,115 +533,97 @@ def _download_config_files(
     format: str,
     keep_temp_files: bool,
 ) -> Dict[str, Any]:
-    """Download and process AWS Config files from S3."""
+    """Download and process AWS Config files from S3.
 
-    # Date pattern to match files
-    date_pattern = re.compile(r"(\d{4}-\d{2}-\d{2})")
+    Matching keys are listed first, sharded by sub-prefix, then fetched
+    concurrently and parsed straight from the response stream. Records keep
+    the listing order.
+    """
+
+    # ISO dates compare correctly as strings, so keys are range-checked
+    # without parsing; only in-range dates are validated
+    start_str = start_date.strftime("%Y-%m-%d")
+    end_str = end_date.strftime("%Y-%m-%d")
+    date_offset = _fixed_date_offset(prefix)
 
     all_records = []
+    header_fields = set()
+    total_records = 0
     processed_files = 0
     skipped_files = 0
-    temp_files = []
-
-    try:
-        # List objects in S3
-        paginator = s3_client.get_paginator("list_objects_v2")
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-
-            task = progress.add_task("Scanning S3 objects...", total=None)
-
-            for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
-                if "Contents" not in page:
-                    continue
-
-                for obj in page["Contents"]:
-                    key = obj["Key"]
-
-                    # Extract date from key
-                    match = date_pattern.search(key)
-                    if match:
-                        file_date_str = match.group(1)
-                        try:
-                            file_date = datetime.strptime(file_date_str, "%Y-%m-%d")
-                        except ValueError:
+    keys = []
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+
+        task = progress.add_task("Scanning S3 objects...", total=None)
+
+        for key in _list_config_keys(s3_client, bucket, prefix, start_str, end_str):
+            # Extract date from key, trying right after the prefix first
+            match = None
+            if date_offset is not None:
+                match = CONFIG_DATE_PATTERN.match(key, date_offset)
+            if match is None:
+                match = CONFIG_DATE_PATTERN.search(key)
+            if match:
+                file_date_str = match.group(1)
+
+                # Check if file is in date range
+                if start_str <= file_date_str <= end_str:
+                    try:
+                        datetime.strptime(file_date_str, "%Y-%m-%d")
+                    except ValueError:
+                        continue
+                    keys.append(key)
+                else:
+                    skipped_files += 1
+
+        progress.update(task, description=f"Processing {len(keys)} files...")
+
+        # CSV rows are spooled to a temp file as JSON lines while the header
+        # set is collected, so at most CONFIG_FILES_IN_FLIGHT files' records
+        # are held in memory at once
+        with tempfile.TemporaryFile("w+b") as spool:
+            if keys:
+                with ThreadPoolExecutor(
+                    max_workers=min(CONFIG_DOWNLOAD_WORKERS, len(keys))
+                ) as executor:
+                    results = _map_bounded(
+                        executor,
+                        lambda key: _fetch_config_records(
+                            s3_client, bucket, key, keep_temp_files
+                        ),
+                        keys,
+                        CONFIG_FILES_IN_FLIGHT,
+                    )
+                    for records in results:
+                        if records is None:
+                            skipped_files += 1
                             continue
 
-                        # Check if file is in date range
-                        if start_date <= file_date <= end_date:
-                            progress.update(
-                                task,
-                                description=f"Processing {os.path.basename(key)}...",
-                            )
-
-                            # Download file
-                            local_filename = (
-                                f"temp_{get_timestamp()}_{os.path.basename(key)}"
-                            )
-                            temp_files.append(local_filename)
-
-                            try:
-                                s3_client.download_file(bucket, key, local_filename)
-
-                                # Process JSON file
-                                with open(local_filename, "r", encoding="utf-8") as f:
-                                    try:
-                                        data = json.load(f)
-
-                                        # Handle both single objects and arrays
-                                        if isinstance(data, list):
-                                            for item in data:
-                                                if isinstance(item, dict):
-                                                    flattened = _flatten_json(item)
-                                                    flattened["_source_file"] = key
-                                                    flattened["_processed_date"] = (
-                                                        datetime.now().isoformat()
-                                                    )
-                                                    all_records.append(flattened)
-                                        elif isinstance(data, dict):
-                                            flattened = _flatten_json(data)
-                                            flattened["_source_file"] = key
-                                            flattened["_processed_date"] = (
-                                                datetime.now().isoformat()
-                                            )
-                                            all_records.append(flattened)
-
-                                        processed_files += 1
-
-                                    except json.JSONDecodeError as e:
-                                        logger.debug(f"JSON decode error in {key}: {e}")
-                                        skipped_files += 1
-
-                            except Exception as e:
-                                logger.debug(f"Error processing {key}: {e}")
-                                skipped_files += 1
-                        else:
-                            skipped_files += 1
+                        processed_files += 1
+                        total_records += len(records)
+                        if format != "csv":
+                            all_records.extend(records)
+                            continue
+                        for record in records:
+                            header_fields.update(record)
+                            spool.write(_dumps_json_line(record))
 
             progress.update(task, description="Writing output file...")
 
             # Write output file
             if format == "csv":
-                _write_csv_output(all_records, output_file)
+                spool.seek(0)
+                _write_csv_output(map(_loads_json, spool), header_fields, output_file)
             else:
                 _write_json_output(all_records, output_file)
 
-    finally:
-        # Clean up temp files unless requested to keep them
-        if not keep_temp_files:
-            for temp_file in temp_files:
-                try:
-                    if os.path.exists(temp_file):
-                        os.remove(temp_file)
-                except Exception as e:
-                    logger.debug(f"Could not remove temp file {temp_file}: {e}")
-
     return {
-        "total_records": len(all_records),
+        "total_records": total_records,
         "processed_files": processed_files,
         "skipped_files": skipped_files,
         "date_range": f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
@@ -632,58 +631,240 @@ def _download_config_files(
     }
 
 
+def _map_bounded(
+    executor: ThreadPoolExecutor,
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    limit: int,
+) -> Iterator[Any]:
+    """Like ``executor.map``, but with at most ``limit`` tasks submitted ahead.
+
+    Results are yielded in input order. ``executor.map`` submits every item
+    up front, so one slow early task lets all later results pile up.
+
+    Args:
+        executor: Executor to run the tasks on
+        fn: Function applied to each item
+        items: Input items
+        limit: Maximum tasks submitted but not yet yielded
+
+    Yields:
+        ``fn(item)`` for each item, in order
+    """
+    window = deque()
+    for item in items:
+        window.append(executor.submit(fn, item))
+        if len(window) >= limit:
+            yield window.popleft().result()
+    while window:
+        yield window.popleft().result()
+
+
+def _list_config_keys(
+    s3_client, bucket: str, prefix: str, start_str: str, end_str: str
+) -> List[str]:
+    """List object keys under a prefix, one sub-prefix per worker.
+
+    The first level below ``prefix`` is listed with a delimiter, then each
+    sub-prefix is paginated concurrently. Sub-prefixes whose name already
+    holds a date outside the range (e.g. ``<prefix>2023-12-31/``) are not
+    listed at all, since every key under them carries that date first.
+
+    Args:
+        s3_client: S3 client
+        bucket: Bucket name
+        prefix: Key prefix to list
+        start_str: First date in range (YYYY-MM-DD)
+        end_str: Last date in range (YYYY-MM-DD)
+
+    Returns:
+        Keys in S3 listing order
+    """
+    paginator = s3_client.get_paginator("list_objects_v2")
+
+    keys = []
+    shards = []
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter="/"):
+        keys.extend(obj["Key"] for obj in page.get("Contents", []))
+        for common_prefix in page.get("CommonPrefixes", []):
+            shard = common_prefix["Prefix"]
+            match = CONFIG_DATE_PATTERN.search(shard)
+            if match is None or start_str <= match.group(1) <= end_str:
+                shards.append(shard)
+
+    def list_shard(shard: str) -> List[str]:
+        return [
+            obj["Key"]
+            for page in paginator.paginate(Bucket=bucket, Prefix=shard)
+            for obj in page.get("Contents", [])
+        ]
+
+    if shards:
+        with ThreadPoolExecutor(
+            max_workers=min(CONFIG_DOWNLOAD_WORKERS, len(shards))
+        ) as executor:
+            for shard_keys in executor.map(list_shard, shards):
+                keys.extend(shard_keys)
+
+    # Top-level keys and shards interleave in S3's (code point) order
+    keys.sort()
+    return keys
+
+
+def _fixed_date_offset(prefix: str) -> Optional[int]:
+    """Get the offset at which a key's first date can start, if known.
+
+    When the prefix contains no date and cannot end partway through one, a
+    date found right after the prefix is the first date in the key, so it
+    can be matched at that offset instead of searching the whole key.
+
+    Args:
+        prefix: S3 key prefix being listed
+
+    Returns:
+        Prefix length, or None if keys must be searched from the start
+    """
+    if (
+        prefix
+        and prefix[-1] not in _DATE_CHARS
+        and not CONFIG_DATE_PATTERN.search(prefix)
+    ):
+        return len(prefix)
+    return None
+
+
+def _fetch_config_records(
+    s3_client, bucket: str, key: str, keep_temp_files: bool
+) -> Optional[List[Dict[str, Any]]]:
+    """Fetch one Config file from S3 and flatten its records.
+
+    Args:
+        s3_client: S3 client
+        bucket: Bucket name
+        key: Object key
+        keep_temp_files: Also save the raw file to the working directory
+
+    Returns:
+        Flattened records, or None if the file could not be read or parsed
+    """
+    try:
+        raw = s3_client.get_object(Bucket=bucket, Key=key)["Body"].read()
+        if keep_temp_files:
+            local_filename = f"temp_{get_timestamp()}_{os.path.basename(key)}"
+            with open(local_filename, "wb") as f:
+                f.write(raw)
+        data = _loads_json(raw)
+    except json.JSONDecodeError as e:
+        logger.debug(f"JSON decode error in {key}: {e}")
+        return None
+    except Exception as e:
+        logger.debug(f"Error processing {key}: {e}")
+        return None
+
+    # Handle both single objects and arrays
+    items = data if isinstance(data, list) else [data]
+    records = []
+    for item in items:
+        if isinstance(item, dict):
+            flattened = _flatten_json(item)
+            flattened["_source_file"] = key
+            flattened["_processed_date"] = datetime.now().isoformat()
+            records.append(flattened)
+    return records
+
+
 def _flatten_json(
     nested_json: Dict[str, Any], parent_key: str = "", sep: str = "."
 ) -> Dict[str, Any]:
-    """Recursively flatten a nested JSON object."""
-    items = []
-
-    for k, v in nested_json.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-
-        if isinstance(v, dict):
-            items.extend(_flatten_json(v, new_key, sep=sep).items())
-        elif isinstance(v, list):
-            for i, item in enumerate(v):
-                if isinstance(item, dict):
-                    items.extend(
-                        _flatten_json(item, f"{new_key}[{i}]", sep=sep).items()
-                    )
-                else:
-                    items.append((f"{new_key}[{i}]", item))
+    """Flatten a nested JSON object.
+
+    Walks the document with an explicit stack of iterators rather than
+    recursing, writing straight into one output dict. Keys come out in the
+    same depth-first order as a recursive walk.
+    """
+    flattened: Dict[str, Any] = {}
+    # Frames are (items iterator, key prefix, items are list entries)
+    stack = [(iter(nested_json.items()), parent_key, False)]
+
+    while stack:
+        items, prefix, in_list = stack[-1]
+        for k, v in items:
+            if in_list:
+                # List entries are indexed, and only dict entries nest further
+                new_key = f"{prefix}[{k}]"
+                if isinstance(v, dict):
+                    stack.append((iter(v.items()), new_key, False))
+                    break
+                flattened[new_key] = v
+                continue
+
+            new_key = f"{prefix}{sep}{k}" if prefix else k
+            if isinstance(v, dict):
+                stack.append((iter(v.items()), new_key, False))
+                break
+            if isinstance(v, list):
+                stack.append((enumerate(v), new_key, True))
+                break
+            flattened[new_key] = v
         else:
-            items.append((new_key, v))
+            stack.pop()
 
-    return dict(items)
+    return flattened
 
 
-def _write_csv_output(records: List[Dict[str, Any]], output_file: str) -> None:
-    """Write records to CSV file."""
-    if not records:
+def _write_csv_output(
+    records: Iterable[Dict[str, Any]], header_fields: Set[str], output_file: str
+) -> None:
+    """Write records to CSV file.
+
+    Args:
+        records: Records to write, consumed once
+        header_fields: Union of the records' keys
+        output_file: Output CSV path
+    """
+    if not header_fields:
         # Create empty CSV file
         with open(output_file, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow(["No data found"])
         return
 
-    # Get all unique field names
-    header_fields = set()
-    for record in records:
-        header_fields.update(record.keys())
-    header_fields = sorted(header_fields)
-
-    # Write CSV
+    # Write CSV with a plain writer; the schema is fixed once the header is
+    # known, so DictWriter's per-row field checks are unnecessary
+    fields = tuple(sorted(header_fields))
     with open(output_file, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=header_fields)
-        writer.writeheader()
-        for record in records:
-            writer.writerow(record)
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        writer.writerows(
+            [record.get(field, "") for field in fields] for record in records
+        )
 
 
 def _write_json_output(records: List[Dict[str, Any]], output_file: str) -> None:
     """Write records to JSON file."""
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(records, f, indent=2, default=str)
+    if orjson is None:
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(records, f, indent=2, default=str)
+        return
+
+    with open(output_file, "wb") as f:
+        f.write(orjson.dumps(records, default=str, option=orjson.OPT_INDENT_2))
+
+
+def _loads_json(data: bytes) -> Any:
+    """Parse JSON bytes, with orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    handle both the same way.
+    """
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _dumps_json_line(record: Dict[str, Any]) -> bytes:
+    """Serialize a record as one line of UTF-8 JSON."""
+    if orjson is None:
+        return json.dumps(record, default=str).encode() + b"\n"
+    return orjson.dumps(record, default=str, option=orjson.OPT_APPEND_NEWLINE)
 
 
 def _display_download_summary(
@@ -711,6 +892,7 @@ def _analyze_config_rules(
     include_metrics: bool,
 ) -> Dict[str, Any]:
     """Analyze AWS Config rules with metrics and statistics."""
+    rule_filter = rule_name.lower() if rule_name else None
 
     def analyze_region(region: str) -> Tuple[str, Dict[str, Any]]:
         """Analyze Config rules in a single region."""
@@ -744,7 +926,7 @@ def _analyze_config_rules(
                     }
 
                     # Filter by rule name if specified
-                    if rule_name and rule_name.lower() not in rule_data["name"].lower():
+                    if rule_filter and rule_filter not in rule_data["name"].lower():
                         continue
 
                     # Get compliance metrics if requested
@@ -1,19 +1,44 @@
 """Amazon Bedrock management commands."""
 
+import json
 import logging
+import threading
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import click
+from botocore.config import Config as BotoConfig
 from rich.console import Console
 
 from ..core.auth import AWSAuth
 from ..core.config import Config
-from ..core.utils import get_timestamp, parallel_execute, print_output, save_to_file
+from ..core.utils import (
+    ensure_directory,
+    get_timestamp,
+    parallel_execute,
+    print_output,
+    save_to_file,
+)
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# list-models queries every region at once; fail fast on regions without a
+# reachable Bedrock endpoint and let adaptive retries absorb throttling
+BEDROCK_REGION_BOTO_CONFIG = BotoConfig(
+    connect_timeout=5, retries={"max_attempts": 5, "mode": "adaptive"}
+)
+
+# The region scan is pure network I/O, so by default every region (up to this
+# many) is queried at once
+MAX_PARALLEL_REGIONS = 32
+
+# The foundation model catalog changes rarely, so each account and region's
+# listing is cached for a day (under the configured data directory)
+BEDROCK_CACHE_DIR = "bedrock_cache"
+FOUNDATION_MODELS_CACHE_TTL = 24 * 60 * 60
+
 
 @click.group(name="bedrock")
 def bedrock_group():
@@ -38,6 +63,16 @@ def bedrock_group():
     "--provider",
     help="Filter by model provider (e.g., amazon, anthropic, ai21, cohere)",
 )
+@click.option(
+    "--parallel-regions",
+    type=click.IntRange(min=1),
+    help=f"Number of regions to process in parallel (default: all, up to {MAX_PARALLEL_REGIONS})",
+)
+@click.option(
+    "--refresh-cache",
+    is_flag=True,
+    help="Ignore cached foundation model listings and query every region",
+)
 @click.pass_context
 def list_models(
     ctx: click.Context,
@@ -45,12 +80,18 @@ def list_models(
     output_file: Optional[str],
     model_type: str,
     provider: Optional[str],
+    parallel_regions: Optional[int],
+    refresh_cache: bool,
 ) -> None:
     """List Amazon Bedrock foundation models across regions."""
     config: Config = ctx.obj["config"]
     aws_auth: AWSAuth = ctx.obj["aws_auth"]
 
     try:
+        # Listings are per account (model access differs), so the cache is too
+        cache_dir = config.get_data_dir() / BEDROCK_CACHE_DIR
+        account_id = aws_auth.get_account_id()
+
         # Determine regions to scan
         if region:
             regions = [region]
@@ -64,50 +105,57 @@ def list_models(
                 f"[blue]Scanning {len(regions)} regions for Bedrock models...[/blue]"
             )
 
+        provider_filter = provider.lower() if provider else None
+
         # Function to list models in a region
         def list_models_in_region(region_name: str) -> List[Dict[str, Any]]:
             models_list = []
             try:
-                bedrock_client = aws_auth.get_client("bedrock", region_name=region_name)
+                bedrock_client = aws_auth.get_client(
+                    "bedrock",
+                    region_name=region_name,
+                    config=BEDROCK_REGION_BOTO_CONFIG,
+                )
 
                 # List foundation models
                 if model_type in ["foundation", "all"]:
-                    paginator = bedrock_client.get_paginator("list_foundation_models")
-
-                    for page in paginator.paginate():
-                        for model in page.get("modelSummaries", []):
-                            model_info = {
-                                "Region": region_name,
-                                "Model ID": model.get("modelId", ""),
-                                "Model Name": model.get("modelName", ""),
-                                "Provider": model.get("providerName", ""),
-                                "Type": "Foundation",
-                                "Input Modalities": ", ".join(
-                                    model.get("inputModalities", [])
-                                ),
-                                "Output Modalities": ", ".join(
-                                    model.get("outputModalities", [])
-                                ),
-                                "Response Streaming": (
-                                    "Yes"
-                                    if model.get("responseStreamingSupported")
-                                    else "No"
-                                ),
-                                "Customization": ", ".join(
-                                    model.get("customizationsSupported", [])
-                                )
-                                or "None",
-                            }
-
-                            # Apply provider filter if specified
-                            if (
-                                provider
-                                and provider.lower()
-                                not in model_info["Provider"].lower()
-                            ):
-                                continue
-
-                            models_list.append(model_info)
+                    for model in _list_foundation_models(
+                        bedrock_client,
+                        cache_dir
+                        / f"foundation_models_{account_id}_{region_name}.json",
+                        refresh_cache,
+                    ):
+                        model_info = {
+                            "Region": region_name,
+                            "Model ID": model.get("modelId", ""),
+                            "Model Name": model.get("modelName", ""),
+                            "Provider": model.get("providerName", ""),
+                            "Type": "Foundation",
+                            "Input Modalities": ", ".join(
+                                model.get("inputModalities", [])
+                            ),
+                            "Output Modalities": ", ".join(
+                                model.get("outputModalities", [])
+                            ),
+                            "Response Streaming": (
+                                "Yes"
+                                if model.get("responseStreamingSupported")
+                                else "No"
+                            ),
+                            "Customization": ", ".join(
+                                model.get("customizationsSupported", [])
+                            )
+                            or "None",
+                        }
+
+                        # Apply provider filter if specified
+                        if (
+                            provider_filter
+                            and provider_filter not in model_info["Provider"].lower()
+                        ):
+                            continue
+
+                        models_list.append(model_info)
 
                 # List custom models
                 if model_type in ["custom", "all"]:
@@ -156,7 +204,9 @@ def list_models(
         region_results = parallel_execute(
             list_models_in_region,
             regions,
-            max_workers=config.workers,
+            max_workers=parallel_regions
+            or min(MAX_PARALLEL_REGIONS, len(regions))
+            or 1,
             show_progress=len(regions) > 1,
             description="Scanning regions for Bedrock models",
         )
@@ -437,3 +487,39 @@ def regions(ctx: click.Context) -> None:
     except Exception as e:
         console.print(f"[red]Error listing Bedrock regions:[/red] {e}")
         raise click.Abort()
+
+
+def _list_foundation_models(
+    bedrock_client, cache_file: Path, refresh: bool = False
+) -> List[Dict[str, Any]]:
+    """List a region's foundation models, reusing an on-disk copy when fresh.
+
+    Args:
+        bedrock_client: Bedrock client for the region
+        cache_file: Where the region's listing is cached
+        refresh: Query the API even if the cached copy is fresh
+
+    Returns:
+        Foundation model summaries
+    """
+    if (
+        not refresh
+        and cache_file.exists()
+        and time.time() - cache_file.stat().st_mtime < FOUNDATION_MODELS_CACHE_TTL
+    ):
+        try:
+            return json.loads(cache_file.read_text())
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable model cache {cache_file}: {e}")
+
+    models = []
+    paginator = bedrock_client.get_paginator("list_foundation_models")
+    for page in paginator.paginate():
+        models.extend(page.get("modelSummaries", []))
+
+    # Write then rename so concurrent readers never see a partial file
+    ensure_directory(cache_file.parent)
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{threading.get_ident()}")
+    tmp_file.write_text(json.dumps(models, default=str))
+    tmp_file.replace(cache_file)
+    return models
@@ -2,11 +2,15 @@
 
 import json
 import logging
+import os
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import click
+from botocore.config import Config as BotoConfig
 from rich.console import Console
 
 from ..core.auth import AWSAuth
@@ -22,6 +26,14 @@ from ..core.utils import (
 logger = logging.getLogger(__name__)
 console = Console()
 
+# GetTemplate is I/O bound, so stacks within a region are fetched widely in
+# parallel; the extra adaptive retries absorb the resulting throttling
+DEFAULT_PARALLEL_STACKS = 16
+CFN_BACKUP_BOTO_CONFIG = BotoConfig(retries={"max_attempts": 10, "mode": "adaptive"})
+
+# Backup files queued per region before fetch workers wait on the writer
+STACK_WRITE_QUEUE_SIZE = 64
+
 
 @click.group(name="cloudformation")
 def cloudformation_group():
@@ -51,14 +63,15 @@ def cloudformation_group():
 @click.option(
     "--parallel-stacks",
     type=int,
-    default=2,
-    help="Number of stacks to process in parallel per region",
+    default=DEFAULT_PARALLEL_STACKS,
+    help=f"Number of stacks to process in parallel per region (default: {DEFAULT_PARALLEL_STACKS})",
 )
 @click.option(
     "--format",
     type=click.Choice(["json", "yaml"]),
     default="json",
-    help="Output format for templates and parameters",
+    help="Output format for JSON templates and parameters "
+    "(YAML templates are always saved unchanged as .yaml)",
 )
 @click.pass_context
 def backup(
@@ -386,7 +399,9 @@ def _execute_cloudformation_backup(
         parameters_count = 0
 
         try:
-            cfn_client = aws_auth.get_client("cloudformation", region_name=region)
+            cfn_client = aws_auth.get_client(
+                "cloudformation", region_name=region, config=CFN_BACKUP_BOTO_CONFIG
+            )
 
             # Get all stacks in the region
             stacks = []
@@ -403,27 +418,60 @@ def _execute_cloudformation_backup(
 
             stacks_count = len(stacks)
 
-            # Create region directory
+            # Create region directory and note what a previous run left there,
+            # so each stack's skip check is a set lookup rather than stat calls
             region_dir = output_path / region
             ensure_directory(region_dir)
+            existing_files = {entry.name for entry in os.scandir(region_dir)}
+
+            # Fetch workers hand finished files to a single writer thread, so
+            # GetTemplate waits and disk writes overlap instead of alternating
+            write_queue: queue.Queue = queue.Queue(maxsize=STACK_WRITE_QUEUE_SIZE)
+            written = {"Template": 0, "Parameters": 0}
+
+            def write_backups() -> None:
+                """Write queued backup files until the sentinel arrives."""
+                while True:
+                    item = write_queue.get()
+                    if item is None:
+                        return
+
+                    kind, stack_name, file_path, payload = item
+                    try:
+                        if isinstance(payload, str):
+                            # Template text as uploaded; write it verbatim
+                            with open(file_path, "w", encoding="utf-8") as f:
+                                f.write(payload)
+                        else:
+                            save_to_file(payload, file_path, format)
+                        written[kind] += 1
+                        logger.debug(f"{kind} saved for stack {stack_name}")
+                    except Exception as e:
+                        region_errors.append(f"{kind} for {stack_name}: {str(e)}")
 
             # Backup stacks in parallel within the region
             def backup_single_stack(stack: Dict[str, Any]) -> Tuple[bool, bool]:
-                """Backup a single stack's template and parameters."""
+                """Fetch a single stack's template and queue its backup files.
+
+                Returns whether the template and parameters were already
+                backed up; newly written files are counted by the writer.
+                """
                 stack_name = stack.get("StackName")
-                template_saved = False
-                parameters_saved = False
 
                 try:
                     # Define file paths
-                    template_file = region_dir / f"{stack_name}.{format}"
-                    params_file = region_dir / f"{stack_name}-parameters.{format}"
+                    template_name = f"{stack_name}.{format}"
+                    # Text (YAML) templates are saved as-is, whatever the format
+                    text_template_name = f"{stack_name}.yaml"
+                    params_name = f"{stack_name}-parameters.{format}"
+                    params_file = region_dir / params_name
 
                     # Check if backup already exists
                     parameters = stack.get("Parameters", [])
-                    if template_file.exists() and (
-                        not parameters or params_file.exists()
-                    ):
+                    if (
+                        template_name in existing_files
+                        or text_template_name in existing_files
+                    ) and (not parameters or params_name in existing_files):
                         logger.debug(
                             f"Stack {stack_name} in region {region} already backed up"
                         )
@@ -432,15 +480,21 @@ def _execute_cloudformation_backup(
                     # Get stack template
                     try:
                         template_response = cfn_client.get_template(
-                            StackName=stack_name
+                            StackName=stack_name, TemplateStage="Original"
                         )
                         template_body = template_response.get("TemplateBody", "")
 
+                        # Text is written verbatim as .yaml; parsed JSON in
+                        # the requested format
                         if template_body:
-                            # Save template in requested format
-                            save_to_file(template_body, template_file, format)
-                            template_saved = True
-                            logger.debug(f"Template saved for stack {stack_name}")
+                            template_file = region_dir / (
+                                text_template_name
+                                if isinstance(template_body, str)
+                                else template_name
+                            )
+                            write_queue.put(
+                                ("Template", stack_name, template_file, template_body)
+                            )
 
                     except Exception as e:
                         region_errors.append(f"Template for {stack_name}: {str(e)}")
@@ -448,40 +502,50 @@ def _execute_cloudformation_backup(
                     # Save parameters if they exist
                     if parameters:
                         try:
+                            # ParameterKey is always present in DescribeStacks
                             params_dict = {
-                                param.get("ParameterKey"): param.get("ParameterValue")
+                                param["ParameterKey"]: param.get("ParameterValue")
                                 for param in parameters
                             }
-
-                            save_to_file(params_dict, params_file, format)
-                            parameters_saved = True
-                            logger.debug(f"Parameters saved for stack {stack_name}")
+                            write_queue.put(
+                                ("Parameters", stack_name, params_file, params_dict)
+                            )
 
                         except Exception as e:
                             region_errors.append(
                                 f"Parameters for {stack_name}: {str(e)}"
                             )
 
-                    return template_saved, parameters_saved
+                    return False, False
 
                 except Exception as e:
                     region_errors.append(f"Stack {stack_name}: {str(e)}")
                     return False, False
 
-            # Execute stack backups in parallel
-            stack_results = parallel_execute(
-                backup_single_stack,
-                stacks,
-                max_workers=parallel_stacks,
-                show_progress=False,
+            writer = threading.Thread(
+                target=write_backups, name=f"cfn-backup-writer-{region}", daemon=True
             )
+            writer.start()
+            try:
+                # Execute stack backups in parallel
+                stack_results = parallel_execute(
+                    backup_single_stack,
+                    stacks,
+                    max_workers=max(1, min(parallel_stacks, len(stacks))),
+                    show_progress=False,
+                )
+            finally:
+                write_queue.put(None)
+                writer.join()
 
-            # Count results
-            for template_saved, parameters_saved in stack_results:
-                if template_saved:
+            # Count already-present backups plus newly written files
+            for template_exists, parameters_exist in stack_results:
+                if template_exists:
                     templates_count += 1
-                if parameters_saved:
+                if parameters_exist:
                     parameters_count += 1
+            templates_count += written["Template"]
+            parameters_count += written["Parameters"]
 
         except Exception as e:
             region_errors.append(f"Region {region}: {str(e)}")
@@ -1,17 +1,23 @@
 """AWS Cost optimization and analysis commands."""
 
 import csv
+import heapq
 import json
 import logging
 import statistics
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from email.utils import formatdate
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import click
 import requests
+from botocore.config import Config as BotoConfig
 from dateutil.relativedelta import relativedelta
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 from rich.progress import (
     BarColumn,
@@ -39,6 +45,29 @@ console = Console()
 PRICING_API_BASE = "https://pricing.us-east-1.amazonaws.com"
 HTTP_TIMEOUT = 30
 
+# Offer indexes change at most daily, so cached copies are reused for a day
+# (under the configured data directory) before being revalidated
+PRICING_CACHE_DIR = "pricing_cache"
+PRICING_CACHE_TTL = 24 * 60 * 60
+
+# DescribeSpotPriceHistory is called from every region at once; fail fast on
+# unreachable endpoints and let adaptive retries absorb the throttling
+SPOT_PRICING_BOTO_CONFIG = BotoConfig(
+    connect_timeout=5, retries={"max_attempts": 5, "mode": "adaptive"}
+)
+
+# Spot pricing collection is pure network I/O, so by default every region (up
+# to this many) is queried at once
+MAX_SPOT_PRICING_REGIONS = 32
+
+# A long --instance-types list is split into chunks of this many types, whose
+# price histories are paginated concurrently within each region
+SPOT_PRICE_TYPES_PER_REQUEST = 20
+SPOT_PRICE_CHUNK_WORKERS = 4
+
+# Most values EC2 accepts for a single Describe* filter
+EC2_FILTER_MAX_VALUES = 200
+
 # EBS volume types for optimization analysis
 EBS_VOLUME_TYPES = {
     "gp2": {"name": "General Purpose SSD (gp2)", "optimizable": True, "target": "gp3"},
@@ -87,9 +116,11 @@ def pricing(
     config: Config = ctx.obj["config"]
 
     try:
+        cache_dir = config.get_data_dir() / PRICING_CACHE_DIR
+
         if list_services:
             console.print("[blue]Listing available AWS services for pricing[/blue]")
-            services_data = _get_available_pricing_services()
+            services_data = _get_available_pricing_services(cache_dir=cache_dir)
 
             print_output(
                 services_data,
@@ -111,10 +142,17 @@ def pricing(
             console.print(f"[dim]Output directory: {output_path}[/dim]")
             console.print(f"[dim]Format: {format}[/dim]")
 
-            # Get pricing for specific service
-            pricing_results = _get_service_pricing(
-                service, output_path, format, config.workers
-            )
+            # Get pricing for specific service; the index, version index and
+            # offer requests all go to one host, so share a single connection
+            with _pricing_http_session(1) as session:
+                pricing_results = _get_service_pricing(
+                    service,
+                    output_path,
+                    format,
+                    config.workers,
+                    session=session,
+                    cache_dir=cache_dir,
+                )
 
         else:
             console.print("[blue]Getting pricing data for all AWS services[/blue]")
@@ -130,7 +168,7 @@ def pricing(
 
             # Get pricing for all services
             pricing_results = _get_all_services_pricing(
-                output_path, format, config.workers
+                output_path, format, config.workers, cache_dir=cache_dir
             )
 
         # Display results
@@ -424,6 +462,11 @@ def usage_metrics(
     "--output-file",
     help="Output file for consolidated spot pricing analysis (supports .json, .yaml, .csv)",
 )
+@click.option(
+    "--parallel-regions",
+    type=click.IntRange(min=1),
+    help=f"Number of regions to process in parallel (default: all, up to {MAX_SPOT_PRICING_REGIONS})",
+)
 @click.pass_context
 def spot_pricing(
     ctx: click.Context,
@@ -434,6 +477,7 @@ def spot_pricing(
     product_description: str,
     output_dir: Optional[str],
     output_file: Optional[str],
+    parallel_regions: Optional[int],
 ) -> None:
     """Collect and analyze EC2 spot pricing data across regions."""
     config: Config = ctx.obj["config"]
@@ -478,7 +522,7 @@ def spot_pricing(
             instance_types_filter,
             product_description,
             output_path,
-            config.workers,
+            parallel_regions or min(MAX_SPOT_PRICING_REGIONS, len(target_regions)) or 1,
         )
 
         # Display results summary
@@ -593,17 +637,91 @@ def spot_analysis(
         raise click.Abort()
 
 
-def _get_available_pricing_services() -> List[Dict[str, Any]]:
-    """Get list of available AWS services for pricing."""
+def _pricing_http_session(pool_size: int) -> requests.Session:
+    """Create an HTTP session whose connection pool fits the worker count.
+
+    Sharing one session lets worker threads reuse TLS connections to the
+    pricing endpoint instead of opening a new one per request.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=max(1, pool_size))
+    session.mount("https://", adapter)
+    return session
+
+
+def _fetch_pricing_document(
+    url: str,
+    session: Optional[requests.Session] = None,
+    cache_file: Optional[Path] = None,
+) -> bytes:
+    """Fetch a pricing document, reusing an on-disk copy when possible.
+
+    A cached copy younger than ``PRICING_CACHE_TTL`` is used without any
+    request. An older copy is revalidated with If-Modified-Since, and a 304
+    reply keeps it for another TTL period.
+
+    Args:
+        url: Document URL
+        session: HTTP session to reuse connections from
+        cache_file: Where to cache the document (no caching if omitted)
+
+    Returns:
+        Raw document bytes
+    """
+    headers = {}
+    if cache_file is not None and cache_file.exists():
+        mtime = cache_file.stat().st_mtime
+        if time.time() - mtime < PRICING_CACHE_TTL:
+            return cache_file.read_bytes()
+        headers["If-Modified-Since"] = formatdate(mtime, usegmt=True)
+
+    response = (session or requests).get(url, timeout=HTTP_TIMEOUT, headers=headers)
+    if response.status_code == 304:
+        cache_file.touch()
+        return cache_file.read_bytes()
+    response.raise_for_status()
+
+    if cache_file is not None:
+        # Write then rename so concurrent readers never see a partial file
+        ensure_directory(cache_file.parent)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{threading.get_ident()}")
+        tmp_file.write_bytes(response.content)
+        tmp_file.replace(cache_file)
+    return response.content
+
+
+def _get_pricing_index(
+    session: Optional[requests.Session] = None, cache_dir: Optional[Path] = None
+) -> Dict[str, Any]:
+    """Download the top-level pricing offer index."""
+    return json.loads(
+        _fetch_pricing_document(
+            f"{PRICING_API_BASE}/offers/v1.0/aws/index.json",
+            session,
+            cache_dir / "index.json" if cache_dir else None,
+        )
+    )
+
+
+def _get_available_pricing_services(
+    pricing_index: Optional[Dict[str, Any]] = None,
+    cache_dir: Optional[Path] = None,
+) -> List[Dict[str, Any]]:
+    """Get list of available AWS services for pricing.
+
+    Args:
+        pricing_index: Already-downloaded offer index (fetched if omitted)
+        cache_dir: Directory for cached pricing indexes
+
+    Returns:
+        List of service summaries sorted by name
+    """
 
     try:
         # Get the main pricing index
-        response = requests.get(
-            f"{PRICING_API_BASE}/offers/v1.0/aws/index.json", timeout=HTTP_TIMEOUT
-        )
-        response.raise_for_status()
+        if pricing_index is None:
+            pricing_index = _get_pricing_index(cache_dir=cache_dir)
 
-        pricing_index = response.json()
         services_data = []
 
         for service_code, service_info in pricing_index.get("offers", {}).items():
@@ -631,9 +749,30 @@ def _get_available_pricing_services() -> List[Dict[str, Any]]:
 
 
 def _get_service_pricing(
-    service_code: str, output_path: Path, format: str, max_workers: int
+    service_code: str,
+    output_path: Path,
+    format: str,
+    max_workers: int,
+    session: Optional[requests.Session] = None,
+    service_info: Optional[Dict[str, Any]] = None,
+    cache_dir: Optional[Path] = None,
 ) -> Dict[str, Any]:
-    """Get pricing data for a specific service."""
+    """Get pricing data for a specific service.
+
+    Args:
+        service_code: Pricing service code (e.g., AmazonEC2)
+        output_path: Directory to write pricing files to
+        format: Output format (json or summary)
+        max_workers: Maximum number of worker threads
+        session: HTTP session to reuse connections from
+        service_info: The service's entry from an already-downloaded offer
+            index, so the index is not fetched again
+        cache_dir: Directory for cached pricing indexes
+
+    Returns:
+        Result summary with files created, data size and errors
+    """
+    http = session or requests
 
     result = {
         "service_code": service_code,
@@ -645,31 +784,30 @@ def _get_service_pricing(
     }
 
     try:
-        console.print(f"[dim]Fetching pricing index for {service_code}...[/dim]")
-
-        # Get service pricing index
-        index_url = f"{PRICING_API_BASE}/offers/v1.0/aws/index.json"
-        index_response = requests.get(index_url, timeout=HTTP_TIMEOUT)
-        index_response.raise_for_status()
+        if service_info is None:
+            console.print(f"[dim]Fetching pricing index for {service_code}...[/dim]")
 
-        pricing_index = index_response.json()
+            # Get service pricing index
+            pricing_index = _get_pricing_index(session, cache_dir)
 
-        if service_code not in pricing_index.get("offers", {}):
-            raise ValueError(f"Service '{service_code}' not found in pricing index")
+            if service_code not in pricing_index.get("offers", {}):
+                raise ValueError(f"Service '{service_code}' not found in pricing index")
 
-        service_info = pricing_index["offers"][service_code]
+            service_info = pricing_index["offers"][service_code]
 
         # Get version index
         version_index_url = f"{PRICING_API_BASE}{service_info['versionIndexUrl']}"
-        version_response = requests.get(version_index_url, timeout=HTTP_TIMEOUT)
-        version_response.raise_for_status()
-
-        version_data = version_response.json()
+        version_index = _fetch_pricing_document(
+            version_index_url,
+            session,
+            cache_dir / f"{service_code}_versions.json" if cache_dir else None,
+        )
 
-        # Save version index
+        # Save the version index as served; it is parsed once for the URL
+        version_data = json.loads(version_index)
         version_file = output_path / f"pricing_{service_code}_versions.json"
-        with open(version_file, "w", encoding="utf-8") as f:
-            json.dump(version_data, f, indent=2)
+        with open(version_file, "wb") as f:
+            f.write(version_index)
 
         result["files_created"] += 1
         result["data_size"] += version_file.stat().st_size
@@ -681,20 +819,22 @@ def _get_service_pricing(
         console.print(
             f"[dim]Downloading current pricing data for {service_code}...[/dim]"
         )
-        pricing_response = requests.get(pricing_url, timeout=HTTP_TIMEOUT)
+        pricing_response = http.get(
+            pricing_url, timeout=HTTP_TIMEOUT, stream=format == "json"
+        )
         pricing_response.raise_for_status()
 
-        pricing_data = pricing_response.json()
-
         if format == "json":
-            # Save raw JSON data
+            # Stream the raw offer file to disk without decoding it
             pricing_file = (
                 output_path / f"pricing_{service_code}_{current_version}.json"
             )
-            with open(pricing_file, "w", encoding="utf-8") as f:
-                json.dump(pricing_data, f, indent=2)
+            with open(pricing_file, "wb") as f:
+                for chunk in pricing_response.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
         else:
             # Process and save summary
+            pricing_data = pricing_response.json()
             summary_data = _process_pricing_summary(service_code, pricing_data)
             pricing_file = output_path / f"pricing_{service_code}_summary.json"
             with open(pricing_file, "w", encoding="utf-8") as f:
@@ -712,7 +852,10 @@ def _get_service_pricing(
 
 
 def _get_all_services_pricing(
-    output_path: Path, format: str, max_workers: int
+    output_path: Path,
+    format: str,
+    max_workers: int,
+    cache_dir: Optional[Path] = None,
 ) -> Dict[str, Any]:
     """Get pricing data for all AWS services."""
 
@@ -726,15 +869,26 @@ def _get_all_services_pricing(
         "errors": [],
     }
 
+    session = _pricing_http_session(max_workers)
+
     try:
-        # Get list of available services
-        services_data = _get_available_pricing_services()
+        # Get list of available services, downloading the index only once
+        pricing_index = _get_pricing_index(session, cache_dir)
+        services_data = _get_available_pricing_services(pricing_index)
         result["total_services"] = len(services_data)
 
         def process_service(service_info: Dict[str, Any]) -> Dict[str, Any]:
             """Process pricing for a single service."""
             service_code = service_info["Service Code"]
-            return _get_service_pricing(service_code, output_path, format, 1)
+            return _get_service_pricing(
+                service_code,
+                output_path,
+                format,
+                1,
+                session=session,
+                service_info=pricing_index["offers"][service_code],
+                cache_dir=cache_dir,
+            )
 
         # Process services in parallel
         with Progress(
@@ -767,6 +921,8 @@ def _get_all_services_pricing(
 
     except Exception as e:
         result["errors"].append(f"Error processing all services pricing: {str(e)}")
+    finally:
+        session.close()
 
     return result
 
@@ -806,6 +962,8 @@ def _process_pricing_summary(
     summary["product_families"] = sorted(list(summary["product_families"]))
     summary["usage_types"] = sorted(list(summary["usage_types"]))
 
+    return summary
+
 
 def _get_date_ranges(months: int) -> List[Tuple[str, str]]:
     """Get date ranges for the last N months."""
@@ -1047,6 +1205,7 @@ def _analyze_ebs_volumes(
             # Get volumes
             paginator = ec2_client.get_paginator("describe_volumes")
 
+            volumes = []
             for page in paginator.paginate(Filters=filters):
                 for volume in page.get("Volumes", []):
                     # Track volumes before filtering
@@ -1059,14 +1218,27 @@ def _analyze_ebs_volumes(
                         if not tag_filter.matches(volume):
                             continue
 
-                    volume_info = _process_ebs_volume(
-                        ec2_client, volume, show_recommendations
-                    )
-                    region_result["volumes"].append(volume_info)
-                    region_result["volume_count"] += 1
+                    volumes.append(volume)
 
-                    if volume_info.get("optimizable", False):
-                        region_result["optimizable_count"] += 1
+            # Look up the attached instances' tags in bulk, not per volume
+            instance_tags = _get_instance_tags(
+                ec2_client,
+                {
+                    volume["Attachments"][0]["InstanceId"]
+                    for volume in volumes
+                    if volume.get("Attachments")
+                },
+            )
+
+            for volume in volumes:
+                volume_info = _process_ebs_volume(
+                    volume, show_recommendations, instance_tags
+                )
+                region_result["volumes"].append(volume_info)
+                region_result["volume_count"] += 1
+
+                if volume_info.get("optimizable", False):
+                    region_result["optimizable_count"] += 1
 
         except Exception as e:
             error_msg = f"Error analyzing region {region}: {str(e)}"
@@ -1127,10 +1299,54 @@ def _analyze_ebs_volumes(
     return result
 
 
+def _get_instance_tags(ec2_client, instance_ids: Set[str]) -> Dict[str, Dict[str, str]]:
+    """Get the tags of many EC2 instances with batched DescribeTags calls.
+
+    Args:
+        ec2_client: EC2 client for the instances' region
+        instance_ids: Instance IDs to look up
+
+    Returns:
+        Tags keyed by instance ID; instances without tags (or whose lookup
+        failed) are omitted
+    """
+    instance_tags: Dict[str, Dict[str, str]] = {}
+    ids = sorted(instance_ids)
+    paginator = ec2_client.get_paginator("describe_tags")
+
+    for i in range(0, len(ids), EC2_FILTER_MAX_VALUES):
+        batch = ids[i : i + EC2_FILTER_MAX_VALUES]
+        try:
+            for page in paginator.paginate(
+                Filters=[
+                    {"Name": "resource-type", "Values": ["instance"]},
+                    {"Name": "resource-id", "Values": batch},
+                ]
+            ):
+                for tag in page.get("Tags", []):
+                    tags = instance_tags.setdefault(tag["ResourceId"], {})
+                    tags[tag["Key"]] = tag["Value"]
+        except Exception as e:
+            logger.debug(f"Error getting instance tags for {len(batch)} instances: {e}")
+
+    return instance_tags
+
+
 def _process_ebs_volume(
-    ec2_client, volume: Dict[str, Any], show_recommendations: bool
+    volume: Dict[str, Any],
+    show_recommendations: bool,
+    instance_tags: Optional[Dict[str, Dict[str, str]]] = None,
 ) -> Dict[str, Any]:
-    """Process a single EBS volume for optimization analysis."""
+    """Process a single EBS volume for optimization analysis.
+
+    Args:
+        volume: Volume from DescribeVolumes
+        show_recommendations: Whether to flag optimizable volume types
+        instance_tags: Tags of attached instances, keyed by instance ID
+
+    Returns:
+        Volume summary
+    """
 
     volume_info = {
         "volume_id": volume["VolumeId"],
@@ -1159,17 +1375,7 @@ def _process_ebs_volume(
         attachment = volume["Attachments"][0]
         instance_id = attachment["InstanceId"]
         volume_info["instance_id"] = instance_id
-
-        # Get instance tags if possible
-        try:
-            instance_response = ec2_client.describe_instances(InstanceIds=[instance_id])
-            if instance_response["Reservations"]:
-                instance = instance_response["Reservations"][0]["Instances"][0]
-                if "Tags" in instance:
-                    for tag in instance["Tags"]:
-                        volume_info["instance_tags"][tag["Key"]] = tag["Value"]
-        except Exception as e:
-            logger.debug(f"Error getting instance tags for {instance_id}: {e}")
+        volume_info["instance_tags"] = dict((instance_tags or {}).get(instance_id, {}))
 
     # Check optimization opportunities
     if show_recommendations:
@@ -1178,6 +1384,8 @@ def _process_ebs_volume(
             volume_info["optimizable"] = True
             volume_info["recommended_type"] = EBS_VOLUME_TYPES[vol_type]["target"]
 
+    return volume_info
+
 
 def _display_pricing_results(config: Config, results: Dict[str, Any]) -> None:
     """Display pricing data collection results."""
@@ -1469,7 +1677,9 @@ def _collect_spot_pricing(
         }
 
         try:
-            ec2_client = aws_auth.get_client("ec2", region_name=region)
+            ec2_client = aws_auth.get_client(
+                "ec2", region_name=region, config=SPOT_PRICING_BOTO_CONFIG
+            )
 
             # Calculate time range
             end_time = datetime.utcnow()
@@ -1482,9 +1692,29 @@ def _collect_spot_pricing(
                 "ProductDescriptions": [product_description],
             }
 
-            # Add instance types filter if specified
-            if instance_types_filter:
-                request_params["InstanceTypes"] = instance_types_filter
+            # Split the instance types filter, if specified, into chunks
+            type_chunks = [
+                instance_types_filter[i : i + SPOT_PRICE_TYPES_PER_REQUEST]
+                for i in range(
+                    0, len(instance_types_filter or ()), SPOT_PRICE_TYPES_PER_REQUEST
+                )
+            ] or [None]
+
+            def price_rows(instance_types: Optional[List[str]]):
+                """Yield CSV rows for one chunk of instance types."""
+                params = dict(request_params)
+                if instance_types:
+                    params["InstanceTypes"] = instance_types
+                paginator = ec2_client.get_paginator("describe_spot_price_history")
+                for page in paginator.paginate(**params):
+                    for item in page.get("SpotPriceHistory", []):
+                        yield [
+                            region,
+                            item["InstanceType"],
+                            item["AvailabilityZone"],
+                            item["SpotPrice"],
+                            item["Timestamp"].isoformat(),
+                        ]
 
             # Create output file for this region
             output_filename = output_path / f"spot_prices_{region}.csv"
@@ -1501,21 +1731,22 @@ def _collect_spot_pricing(
                     ]
                 )
 
-                # Paginate through results
-                paginator = ec2_client.get_paginator("describe_spot_price_history")
-
-                for page in paginator.paginate(**request_params):
-                    for item in page.get("SpotPriceHistory", []):
-                        csv_writer.writerow(
-                            [
-                                region,
-                                item["InstanceType"],
-                                item["AvailabilityZone"],
-                                item["SpotPrice"],
-                                item["Timestamp"].isoformat(),
-                            ]
+                # Stream a single query straight to the file; fetch several
+                # chunks concurrently and write each as it is collected
+                with ThreadPoolExecutor(
+                    max_workers=min(SPOT_PRICE_CHUNK_WORKERS, len(type_chunks))
+                ) as executor:
+                    if len(type_chunks) == 1:
+                        chunk_rows = [price_rows(type_chunks[0])]
+                    else:
+                        chunk_rows = executor.map(
+                            lambda chunk: list(price_rows(chunk)), type_chunks
                         )
-                        region_result["records"] += 1
+
+                    for rows in chunk_rows:
+                        for row in rows:
+                            csv_writer.writerow(row)
+                            region_result["records"] += 1
 
             region_result["file_path"] = str(output_filename)
 
@@ -1591,16 +1822,21 @@ def _analyze_spot_pricing_data(
             try:
                 result["files_processed"] += 1
 
-                with open(csv_file, mode="r", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
+                with open(csv_file, mode="r", newline="", encoding="utf-8") as f:
+                    reader = csv.reader(f)
+                    header = next(reader, None)
+                    if header is None:
+                        continue
+                    region_col = header.index("Region")
+                    type_col = header.index("InstanceType")
+                    az_col = header.index("AvailabilityZone")
+                    price_col = header.index("SpotPrice")
 
                     for row in reader:
-                        region = row["Region"]
-                        instance_type = row["InstanceType"]
-                        az = row["AvailabilityZone"]
-                        spot_price = float(row["SpotPrice"])
+                        region = row[region_col]
+                        instance_type = row[type_col]
 
-                        # Apply filters
+                        # Apply filters before parsing the price
                         if region_filter and region_filter not in region:
                             continue
                         if (
@@ -1609,10 +1845,8 @@ def _analyze_spot_pricing_data(
                         ):
                             continue
 
-                        key = (region, instance_type, az)
-                        if key not in price_map:
-                            price_map[key] = []
-                        price_map[key].append(spot_price)
+                        key = (region, instance_type, row[az_col])
+                        price_map.setdefault(key, []).append(float(row[price_col]))
                         result["total_records"] += 1
 
             except Exception as e:
@@ -1625,7 +1859,7 @@ def _analyze_spot_pricing_data(
         for key, prices in price_map.items():
             if prices:  # Ensure we have data
                 stats = {
-                    "average": statistics.mean(prices),
+                    "average": statistics.fmean(prices),
                     "median": statistics.median(prices),
                     "min": min(prices),
                     "max": max(prices),
@@ -1635,13 +1869,14 @@ def _analyze_spot_pricing_data(
                 avg_prices[key] = stats["average"]
                 result["price_statistics"][f"{key[0]}_{key[1]}_{key[2]}"] = stats
 
-        # Sort by average spot price (ascending) and get top N cheapest
-        sorted_prices = sorted(avg_prices.items(), key=lambda x: x[1])
+        # Select the top N cheapest by average spot price, without sorting
+        # every AZ/type combination
+        cheapest_prices = heapq.nsmallest(top_n, avg_prices.items(), key=lambda x: x[1])
 
         # Calculate cost estimates
         hours_in_period = estimate_period * 24
 
-        for (region, instance_type, az), avg_price in sorted_prices[:top_n]:
+        for (region, instance_type, az), avg_price in cheapest_prices:
             estimated_cost = avg_price * hours_in_period
             stats = result["price_statistics"].get(f"{region}_{instance_type}_{az}", {})
 
@@ -1,9 +1,14 @@
 """AWS ECR (Elastic Container Registry) management commands."""
 
 import base64
+import functools
+import json
 import logging
+import os
+import random
 import shutil
 import subprocess
+import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -18,6 +23,7 @@ from rich.progress import (
 from ..core.auth import AWSAuth
 from ..core.config import Config
 from ..core.utils import (
+    ensure_directory,
     get_timestamp,
     print_output,
     save_to_file,
@@ -26,6 +32,30 @@ from ..core.utils import (
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Registry pulls and pushes are retried with exponential backoff and jitter,
+# but only when docker's error looks like a transient network or registry
+# problem; anything else (missing image, bad credentials) fails immediately
+DOCKER_MAX_ATTEMPTS = 4
+DOCKER_RETRY_BACKOFF = 2
+# ECR login tokens last 12 hours; copy-image records when each registry's
+# login expires, per Docker config directory (under the configured data
+# directory), and skips logging in again until it is this many seconds from
+# expiring, provided Docker still has credentials for the registry
+ECR_LOGIN_CACHE_FILE = "ecr_logins.json"
+ECR_LOGIN_EXPIRY_MARGIN = 5 * 60
+
+DOCKER_TRANSIENT_ERRORS = (
+    "timeout",
+    "connection reset",
+    "connection refused",
+    "unexpected eof",
+    "toomanyrequests",
+    "too many requests",
+    "service unavailable",
+    "internal server error",
+    "bad gateway",
+)
+
 
 @click.group(name="ecr")
 def ecr_group():
@@ -46,6 +76,11 @@ def ecr_group():
     "--create-repo", is_flag=True, help="Create ECR repository if it doesn't exist"
 )
 @click.option("--force", is_flag=True, help="Force overwrite if image already exists")
+@click.option(
+    "--force-pull",
+    is_flag=True,
+    help="Fetch the source image from its registry even if it is present locally",
+)
 @click.pass_context
 def copy_image(
     ctx: click.Context,
@@ -55,6 +90,7 @@ def copy_image(
     region: Optional[str],
     create_repo: bool,
     force: bool,
+    force_pull: bool,
 ) -> None:
     """Copy a Docker image from any registry to AWS ECR."""
     config: Config = ctx.obj["config"]
@@ -64,7 +100,7 @@ def copy_image(
         target_region = region or config.aws_region or "us-east-1"
 
         # Check if Docker is available
-        if not shutil.which("docker"):
+        if not _docker_executable():
             console.print("[red]Docker is not installed or not available in PATH[/red]")
             raise click.Abort()
 
@@ -106,26 +142,43 @@ def copy_image(
             console=console,
         ) as progress:
 
-            # Step 1: Pull source image
-            task1 = progress.add_task("Pulling source image...", total=None)
-            _pull_docker_image(source_image)
-            progress.update(task1, description="✓ Source image pulled")
-
-            # Step 2: ECR login
-            task2 = progress.add_task("Authenticating with ECR...", total=None)
-            _ecr_docker_login(ecr_client, target_region)
-            progress.update(task2, description="✓ ECR authentication successful")
+            # Step 1: ECR login
+            task1 = progress.add_task("Authenticating with ECR...", total=None)
+            _ecr_docker_login(
+                ecr_client,
+                target_region,
+                registry=ecr_repo_uri.split("/")[0],
+                cache_file=config.get_data_dir() / ECR_LOGIN_CACHE_FILE,
+            )
+            progress.update(task1, description="✓ ECR authentication successful")
 
-            # Step 3: Tag image
             target_image = f"{ecr_repo_uri}:{tag}"
-            task3 = progress.add_task("Tagging image...", total=None)
-            _tag_docker_image(source_image, target_image)
-            progress.update(task3, description="✓ Image tagged")
+            local_image = not force_pull and _image_present_locally(source_image)
+
+            if not local_image and _buildx_available():
+                # Step 2: Copy registry to registry; only the manifest and
+                # blobs ECR doesn't have yet are transferred
+                task2 = progress.add_task("Copying image to ECR...", total=None)
+                _copy_image_with_buildx(source_image, target_image)
+                progress.update(task2, description="✓ Image copied to ECR")
+            else:
+                # Step 2: Pull source image, unless the daemon already has it
+                task2 = progress.add_task("Pulling source image...", total=None)
+                if local_image:
+                    progress.update(task2, description="✓ Source image found locally")
+                else:
+                    _pull_docker_image(source_image)
+                    progress.update(task2, description="✓ Source image pulled")
 
-            # Step 4: Push to ECR
-            task4 = progress.add_task("Pushing to ECR...", total=None)
-            _push_docker_image(target_image)
-            progress.update(task4, description="✓ Image pushed to ECR")
+                # Step 3: Tag image
+                task3 = progress.add_task("Tagging image...", total=None)
+                _tag_docker_image(source_image, target_image)
+                progress.update(task3, description="✓ Image tagged")
+
+                # Step 4: Push to ECR
+                task4 = progress.add_task("Pushing to ECR...", total=None)
+                _push_docker_image(target_image)
+                progress.update(task4, description="✓ Image pushed to ECR")
 
         console.print(
             f"[green]✅ Successfully copied {source_image} to {target_image}[/green]"
@@ -568,7 +621,7 @@ def get_login(ctx: click.Context, region: Optional[str], print_command: bool) ->
             console.print("[blue]Docker login command:[/blue]")
             console.print(f"echo '{password}' | {login_command}")
         else:
-            if not shutil.which("docker"):
+            if not _docker_executable():
                 console.print(
                     "[red]Docker is not installed or not available in PATH[/red]"
                 )
@@ -580,7 +633,7 @@ def get_login(ctx: click.Context, region: Optional[str], print_command: bool) ->
             try:
                 process = subprocess.Popen(
                     [
-                        "docker",
+                        _docker_executable(),
                         "login",
                         "--username",
                         username,
@@ -612,13 +665,93 @@ def get_login(ctx: click.Context, region: Optional[str], print_command: bool) ->
         raise click.Abort()
 
 
+@functools.lru_cache(maxsize=None)
+def _docker_executable() -> Optional[str]:
+    """Resolve the docker CLI on PATH once per process.
+
+    Returns:
+        Path to the docker executable, or None if it is not installed
+    """
+    return shutil.which("docker")
+
+
+def _run_docker_with_retries(args: list[str]) -> subprocess.CompletedProcess:
+    """Run a docker registry command, retrying transient failures.
+
+    Docker's layer progress on stdout is discarded rather than piped through
+    Python; only stderr is captured, for error messages.
+
+    Args:
+        args: Command line to run
+
+    Returns:
+        Completed process
+
+    Raises:
+        subprocess.CalledProcessError: If the command fails permanently or
+            runs out of attempts
+    """
+    for attempt in range(DOCKER_MAX_ATTEMPTS):
+        try:
+            return subprocess.run(
+                args,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+        except subprocess.CalledProcessError as e:
+            stderr = (e.stderr or "").lower()
+            transient = any(error in stderr for error in DOCKER_TRANSIENT_ERRORS)
+            if not transient or attempt == DOCKER_MAX_ATTEMPTS - 1:
+                raise
+            delay = DOCKER_RETRY_BACKOFF * 2**attempt + random.uniform(0, 1)
+            logger.debug(f"docker {args[1]} failed transiently, retrying: {e}")
+            time.sleep(delay)
+
+
+def _image_present_locally(image: str) -> bool:
+    """Check whether the local Docker daemon already has an image."""
+    result = subprocess.run(
+        [_docker_executable(), "image", "inspect", image],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return result.returncode == 0
+
+
+def _buildx_available() -> bool:
+    """Check whether the Docker CLI has the buildx plugin."""
+    result = subprocess.run(
+        [_docker_executable(), "buildx", "version"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return result.returncode == 0
+
+
+def _copy_image_with_buildx(source_image: str, target_image: str) -> None:
+    """Copy an image between registries without going through the daemon."""
+    try:
+        _run_docker_with_retries(
+            [
+                _docker_executable(),
+                "buildx",
+                "imagetools",
+                "create",
+                "--tag",
+                target_image,
+                source_image,
+            ]
+        )
+    except subprocess.CalledProcessError as e:
+        raise Exception(f"Failed to copy image {source_image}: {e.stderr}")
+
+
 def _pull_docker_image(image: str) -> None:
     """Pull a Docker image."""
     try:
-        result = subprocess.run(
-            ["docker", "pull", image], check=True, capture_output=True, text=True
-        )
-        logger.debug(f"Docker pull output: {result.stdout}")
+        _run_docker_with_retries([_docker_executable(), "pull", image])
     except subprocess.CalledProcessError as e:
         raise Exception(f"Failed to pull image {image}: {e.stderr}")
 
@@ -627,7 +760,7 @@ def _tag_docker_image(source_image: str, target_image: str) -> None:
     """Tag a Docker image."""
     try:
         subprocess.run(
-            ["docker", "tag", source_image, target_image],
+            [_docker_executable(), "tag", source_image, target_image],
             check=True,
             capture_output=True,
             text=True,
@@ -639,29 +772,55 @@ def _tag_docker_image(source_image: str, target_image: str) -> None:
 def _push_docker_image(target_image: str) -> None:
     """Push a Docker image."""
     try:
-        subprocess.run(
-            ["docker", "push", target_image], check=True, capture_output=True, text=True
-        )
+        _run_docker_with_retries([_docker_executable(), "push", target_image])
     except subprocess.CalledProcessError as e:
         raise Exception(f"Failed to push image: {e.stderr}")
 
 
-def _ecr_docker_login(ecr_client, region: str) -> None:
-    """Authenticate Docker with ECR."""
+def _ecr_docker_login(
+    ecr_client,
+    region: str,
+    registry: Optional[str] = None,
+    cache_file: Optional[Path] = None,
+) -> None:
+    """Authenticate Docker with ECR.
+
+    Args:
+        ecr_client: ECR client for the registry's region
+        region: Registry region
+        registry: Registry host, used as the login cache key
+        cache_file: Where login expiry times are cached (no caching if omitted)
+    """
+    logins = {}
+    docker_config_dir = _docker_config_dir()
+    cache_key = f"{docker_config_dir}|{registry}"
+    if registry and cache_file is not None and cache_file.exists():
+        try:
+            logins = json.loads(cache_file.read_text())
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable ECR login cache {cache_file}: {e}")
+        # A logout or config reset drops the credentials before they expire
+        fresh = logins.get(cache_key, 0) > time.time() + ECR_LOGIN_EXPIRY_MARGIN
+        if fresh and _docker_has_auth(docker_config_dir, registry):
+            logger.debug(f"Reusing cached Docker login for {registry}")
+            return
+
     try:
         response = ecr_client.get_authorization_token()
         auth_data = response["authorizationData"][0]
 
+        # The token is base64 of "AWS:<password>"
         token = auth_data["authorizationToken"]
+        username, password = base64.b64decode(token).decode("utf-8").split(":", 1)
         proxy_endpoint = auth_data["proxyEndpoint"]
 
         # Execute docker login
         process = subprocess.Popen(
             [
-                "docker",
+                _docker_executable(),
                 "login",
                 "--username",
-                "AWS",
+                username,
                 "--password-stdin",
                 proxy_endpoint,
             ],
@@ -671,7 +830,7 @@ def _ecr_docker_login(ecr_client, region: str) -> None:
             text=True,
         )
 
-        stdout, stderr = process.communicate(input=token)
+        stdout, stderr = process.communicate(input=password)
 
         if process.returncode != 0:
             raise Exception(f"Docker login failed: {stderr}")
@@ -679,6 +838,42 @@ def _ecr_docker_login(ecr_client, region: str) -> None:
     except Exception as e:
         raise Exception(f"ECR authentication failed: {e}")
 
+    if registry and cache_file is not None and auth_data.get("expiresAt"):
+        logins[cache_key] = auth_data["expiresAt"].timestamp()
+        try:
+            # Write then rename so concurrent runs never see a partial file
+            ensure_directory(cache_file.parent)
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}")
+            tmp_file.write_text(json.dumps(logins))
+            tmp_file.replace(cache_file)
+        except OSError as e:
+            logger.debug(f"Could not cache ECR login: {e}")
+
+
+def _docker_config_dir() -> Path:
+    """Get the directory the docker CLI reads its config.json from."""
+    return Path(os.environ.get("DOCKER_CONFIG") or Path.home() / ".docker").resolve()
+
+
+def _docker_has_auth(docker_config_dir: Path, registry: str) -> bool:
+    """Check whether Docker's config lists credentials for a registry.
+
+    Entries under ``auths`` are present whether the credentials are stored
+    inline or in a credential store, and are removed by ``docker logout``.
+
+    Args:
+        docker_config_dir: Docker config directory
+        registry: Registry host
+
+    Returns:
+        True if the registry has an entry, False if not or unreadable
+    """
+    try:
+        auths = json.loads((docker_config_dir / "config.json").read_text())["auths"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+    return registry in auths or f"https://{registry}" in auths
+
 
 def _create_repository_if_not_exists(ecr_client, repository_name: str) -> None:
     """Create ECR repository if it doesn't exist."""
@@ -22,6 +22,9 @@ from ..core.utils import (
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Largest page IAM list calls return (the default is 100)
+IAM_MAX_PAGE_SIZE = 1000
+
 
 @click.group(name="iam")
 def iam_group():
@@ -155,7 +158,9 @@ def _process_roles(
         ) as progress:
             task = progress.add_task("Processing IAM roles...", total=None)
 
-            for page in paginator.paginate():
+            for page in paginator.paginate(
+                PaginationConfig={"PageSize": IAM_MAX_PAGE_SIZE}
+            ):
                 roles = page["Roles"]
 
                 for role in roles:
@@ -282,7 +287,9 @@ def _process_policies(
         ) as progress:
             task = progress.add_task("Processing IAM policies...", total=None)
 
-            for page in paginator.paginate(Scope=scope):
+            for page in paginator.paginate(
+                Scope=scope, PaginationConfig={"PageSize": IAM_MAX_PAGE_SIZE}
+            ):
                 policies = page["Policies"]
 
                 for policy in policies:
@@ -354,7 +361,13 @@ def list_roles(ctx: click.Context, path_prefix: Optional[str], max_items: int) -
     try:
         iam_client = aws_auth.get_client("iam")
 
-        params = {"MaxItems": max_items}
+        # Stop after max_items roles, fetched in as few pages as possible
+        params = {
+            "PaginationConfig": {
+                "MaxItems": max_items,
+                "PageSize": min(max_items, IAM_MAX_PAGE_SIZE),
+            }
+        }
         if path_prefix:
             params["PathPrefix"] = path_prefix
 
@@ -419,7 +432,10 @@ def list_policies(
     try:
         iam_client = aws_auth.get_client("iam")
 
-        params = {"Scope": scope}
+        params = {
+            "Scope": scope,
+            "PaginationConfig": {"PageSize": IAM_MAX_PAGE_SIZE},
+        }
         if only_attached:
             params["OnlyAttached"] = True
         if path_prefix:
@@ -31,6 +31,26 @@ from ..core.utils import (
 logger = logging.getLogger(__name__)
 console = Console()
 
+# ARN field for listings whose resources the Resource Groups Tagging API
+# indexes; these are tag-filtered by ARN membership instead of local tags
+TAGGING_ARN_FIELDS = {
+    ("acm", "CertificateSummaryList"): "CertificateArn",
+    ("cloudformation", "Stacks"): "StackId",
+    ("cloudwatch", "MetricAlarms"): "AlarmArn",
+    ("ecr", "Repositories"): "repositoryArn",
+    ("efs", "FileSystems"): "FileSystemArn",
+    ("elasticache", "CacheClusters"): "ARN",
+    ("elbv2", "LoadBalancers"): "LoadBalancerArn",
+    ("lambda", "Functions"): "FunctionArn",
+    ("rds", "DBClusters"): "DBClusterArn",
+    ("rds", "DBInstances"): "DBInstanceArn",
+    ("rds", "DBSnapshots"): "DBSnapshotArn",
+    ("sagemaker", "Endpoints"): "EndpointArn",
+    ("sagemaker", "NotebookInstances"): "NotebookInstanceArn",
+    ("secretsmanager", "SecretList"): "ARN",
+    ("sns", "Topics"): "TopicArn",
+}
+
 
 @click.group(name="inventory")
 def inventory_group():
@@ -655,7 +675,12 @@ def _execute_comprehensive_scan(
 
             # Apply tag filter
             if tag_filter and tag_filter.enabled and resources:
-                resources = tag_filter.filter_resources(resources)
+                arn_field = TAGGING_ARN_FIELDS.get((service, key))
+                resources = tag_filter.filter_resources(
+                    resources,
+                    arn_key=(lambda r: r.get(arn_field)) if arn_field else None,
+                    region=region,
+                )
                 logger.info(
                     f"Tag filter reduced {service}/{region} from {resources_before_filter} to {len(resources)} resources"  # noqa: E501
                 )
@@ -826,22 +851,12 @@ def _display_scan_summary(
 
 def _get_all_workspaces(client) -> List[Dict[str, Any]]:
     """Get all WorkSpaces using pagination."""
-    workspaces = []
-    next_token = None
-
-    while True:
-        params = {}
-        if next_token:
-            params["NextToken"] = next_token
-
-        response = client.describe_workspaces(**params)
-        workspaces.extend(response.get("Workspaces", []))
-
-        next_token = response.get("NextToken")
-        if not next_token:
-            break
-
-    return workspaces
+    paginator = client.get_paginator("describe_workspaces")
+    return [
+        workspace
+        for page in paginator.paginate()
+        for workspace in page.get("Workspaces", [])
+    ]
 
 
 def _get_workspace_tags(client, workspace_id: str) -> Dict[str, str]:
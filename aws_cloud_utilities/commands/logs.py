@@ -1,16 +1,28 @@
 """AWS CloudWatch Logs management and processing commands."""
 
+import functools
 import gzip
+import heapq
+import io
 import json
 import logging
+import mmap
+import os
+import random
 import re
 import shutil
-from concurrent.futures import ThreadPoolExecutor
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, nullcontext
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import click
+from botocore.config import Config as BotoConfig
 from rich.console import Console
 from rich.progress import (
     BarColumn,
@@ -20,7 +32,7 @@ from rich.progress import (
     TextColumn,
 )
 
-from ..core.auth import AWSAuth
+from ..core.auth import MAX_POOL_CONNECTIONS, AWSAuth
 from ..core.config import Config
 from ..core.utils import (
     ensure_directory,
@@ -30,6 +42,11 @@ from ..core.utils import (
     save_to_file,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional C extension
+    orjson = None
+
 logger = logging.getLogger(__name__)
 console = Console()
 
@@ -40,13 +57,57 @@ LOG_TYPE_ELB = "elb"
 LOG_TYPE_ALB = "alb"
 LOG_TYPE_ROUTE53 = "route53"
 
-# Log file patterns for detection
+# When sorting, combined lines are spilled to a temporary file as a sorted
+# run once this many bytes are buffered; the runs are then merged
+COMBINE_RUN_BYTES = 64 * 1024 * 1024
+
+# Bytes read per call when streaming log files into the combined output
+COMBINE_READ_SIZE = 1 << 20
+
+# Files smaller than this are read with a single read() rather than mapped,
+# where mmap's setup and page-fault cost outweighs the copy it saves
+COMBINE_MMAP_MIN_BYTES = 1 << 20
+
+# Most stream downloads in flight at once across all log groups, so nested
+# group and stream pools stay within the client's connection pool
+MAX_CONCURRENT_STREAM_DOWNLOADS = 32
+
+# Downloads share one logs client between group workers listing streams and
+# the stream downloads, so its pool covers both; FilterLogEvents throttles
+# readily under that load, so allow more adaptive retries
+LOGS_DOWNLOAD_BOTO_CONFIG = BotoConfig(
+    max_pool_connections=MAX_POOL_CONNECTIONS + MAX_CONCURRENT_STREAM_DOWNLOADS,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+)
+
+# Most stream names FilterLogEvents accepts in one request
+FILTER_LOG_EVENTS_MAX_STREAMS = 100
+
+# Per-stream output files kept open at once while routing filtered events
+MAX_OPEN_STREAM_FILES = 64
+
+# DescribeExportTasks polling while an S3 export runs: small exports finish
+# in seconds, large ones take many minutes, so the interval starts short and
+# grows to a cap
+EXPORT_POLL_INITIAL = 2
+EXPORT_POLL_MAX = 30
+
+# Default for how long to wait on an export task before giving up, in seconds
+EXPORT_TIMEOUT_DEFAULT = 3600
+
+# Characters replaced with "_" when naming files after log groups and streams
+UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\-_.]")
+
+# Log file patterns for detection, compiled once
 LOG_PATTERNS = {
-    LOG_TYPE_CLOUDTRAIL: r".*cloudtrail.*\.json(\.gz)?$",
-    LOG_TYPE_CLOUDFRONT: r".*cloudfront.*\.(log|json)(\.gz)?$",
-    LOG_TYPE_ELB: r".*elasticloadbalancing.*\.log(\.gz)?$",
-    LOG_TYPE_ALB: r".*app/.*\.log(\.gz)?$|.*net/.*\.log(\.gz)?$",
-    LOG_TYPE_ROUTE53: r".*route53.*\.log(\.gz)?$",
+    log_type: re.compile(pattern, re.IGNORECASE)
+    for log_type, pattern in {
+        LOG_TYPE_CLOUDTRAIL: r".*cloudtrail.*\.json(\.gz)?$",
+        LOG_TYPE_CLOUDFRONT: r".*cloudfront.*\.(log|json)(\.gz)?$",
+        LOG_TYPE_ELB: r".*elasticloadbalancing.*\.log(\.gz)?$",
+        LOG_TYPE_ALB: r".*app/.*\.log(\.gz)?$|.*net/.*\.log(\.gz)?$",
+        LOG_TYPE_ROUTE53: r".*route53.*\.log(\.gz)?$",
+    }.items()
 }
 
 
@@ -96,7 +157,9 @@ def list_groups(
         )
 
         # Get log groups data
-        log_groups_data = _get_all_log_groups(aws_auth, target_regions, include_size)
+        log_groups_data = _get_all_log_groups(
+            aws_auth, target_regions, include_size, config.workers
+        )
 
         if log_groups_data:
             print_output(
@@ -147,6 +210,22 @@ def list_groups(
     is_flag=True,
     help="Download logs from all log groups (use 'ALL' as log_group argument)",
 )
+@click.option(
+    "--export-bucket",
+    help="Export the log group to this S3 bucket and download the export "
+    "(faster for long time ranges; single log group only)",
+)
+@click.option(
+    "--filter-pattern",
+    help="CloudWatch Logs filter pattern; only matching events are downloaded",
+)
+@click.option(
+    "--export-timeout",
+    type=click.IntRange(min=1),
+    default=EXPORT_TIMEOUT_DEFAULT,
+    show_default=True,
+    help="Seconds to wait for the --export-bucket export task to finish",
+)
 @click.pass_context
 def download(
     ctx: click.Context,
@@ -155,6 +234,9 @@ def download(
     region: Optional[str],
     output_dir: Optional[str],
     all_groups: bool,
+    export_bucket: Optional[str],
+    filter_pattern: Optional[str],
+    export_timeout: int,
 ) -> None:
     """Download CloudWatch logs for a specific log group or all groups."""
     config: Config = ctx.obj["config"]
@@ -168,19 +250,34 @@ def download(
             timestamp = get_timestamp()
             output_dir = f"logs_{timestamp}"
 
+        # Export tasks copy whole log groups and can't apply a filter pattern
+        if export_bucket and filter_pattern:
+            console.print(
+                "[red]--filter-pattern can't be combined with --export-bucket[/red]"
+            )
+            raise click.Abort()
+
         output_path = Path(output_dir)
         ensure_directory(output_path)
 
         # Handle ALL groups case
         if log_group.upper() == "ALL" or all_groups:
+            if export_bucket:
+                console.print(
+                    "[red]--export-bucket supports a single log group only[/red]"
+                )
+                raise click.Abort()
+
             console.print(
                 f"[blue]Downloading logs from all log groups in region {target_region}[/blue]"
             )
             console.print(f"[dim]Looking back {days} days[/dim]")
             console.print(f"[dim]Output directory: {output_path}[/dim]")
 
-            # Get all log groups
-            logs_client = aws_auth.get_client("logs", region_name=target_region)
+            # Get all log groups, with the same client the downloads use
+            logs_client = aws_auth.get_client(
+                "logs", region_name=target_region, config=LOGS_DOWNLOAD_BOTO_CONFIG
+            )
             log_groups = _get_log_groups_list(logs_client)
 
             if not log_groups:
@@ -189,7 +286,13 @@ def download(
 
             # Download from all groups
             download_results = _download_multiple_log_groups(
-                aws_auth, target_region, log_groups, days, output_path, config.workers
+                aws_auth,
+                target_region,
+                log_groups,
+                days,
+                output_path,
+                config.workers,
+                filter_pattern=filter_pattern,
             )
 
         else:
@@ -198,9 +301,28 @@ def download(
             console.print(f"[dim]Output directory: {output_path}[/dim]")
 
             # Download from single group
-            download_results = _download_single_log_group(
-                aws_auth, target_region, log_group, days, output_path
-            )
+            if export_bucket:
+                console.print(f"[dim]Exporting via S3 bucket: {export_bucket}[/dim]")
+                download_results = _download_log_group_export(
+                    aws_auth,
+                    target_region,
+                    log_group,
+                    days,
+                    output_path,
+                    export_bucket,
+                    config.workers,
+                    export_timeout,
+                )
+            else:
+                download_results = _download_single_log_group(
+                    aws_auth,
+                    target_region,
+                    log_group,
+                    days,
+                    output_path,
+                    config.workers,
+                    filter_pattern=filter_pattern,
+                )
 
         # Display results
         _display_download_results(config, download_results)
@@ -404,7 +526,9 @@ def combine(
         console.print(f"[dim]Sort lines: {'Yes' if sort_lines else 'No'}[/dim]")
 
         # Execute combine operation
-        combine_results = _combine_log_files(folder_path, output_file, sort_lines)
+        combine_results = _combine_log_files(
+            folder_path, output_file, sort_lines, max_workers=config.workers
+        )
 
         # Display results
         results_display = {
@@ -539,9 +663,9 @@ def aggregate(
 
 
 def _get_all_log_groups(
-    aws_auth: AWSAuth, regions: List[str], include_size: bool
+    aws_auth: AWSAuth, regions: List[str], include_size: bool, max_workers: int = 4
 ) -> List[Dict[str, Any]]:
-    """Get all CloudWatch log groups across regions."""
+    """Get all CloudWatch log groups across regions, on up to ``max_workers`` threads."""
 
     def get_region_log_groups(region: str) -> Tuple[str, List[Dict[str, Any]]]:
         """Get log groups for a single region."""
@@ -553,38 +677,32 @@ def _get_all_log_groups(
 
             for page in paginator.paginate():
                 for group in page.get("logGroups", []):
+                    retention = group.get("retentionInDays", "Never")
+                    creation_time = group.get("creationTime", 0)
+
+                    # Build each row once with its display values
                     group_data = {
                         "Log Group Name": group.get("logGroupName", ""),
                         "Region": region,
-                        "Creation Time": group.get("creationTime", 0),
-                        "Retention": group.get("retentionInDays", "Never"),
-                        "Stored Bytes": group.get("storedBytes", 0),
-                        "ARN": group.get("arn", ""),
+                        "Retention": (
+                            f"{retention} days"
+                            if isinstance(retention, int)
+                            else retention
+                        ),
                     }
-
-                    # Format creation time
-                    if group_data["Creation Time"]:
-                        creation_dt = datetime.fromtimestamp(
-                            group_data["Creation Time"] / 1000
-                        )
-                        group_data["Created"] = creation_dt.strftime("%Y-%m-%d %H:%M")
-                    else:
-                        group_data["Created"] = "Unknown"
-
-                    # Format retention
-                    if isinstance(group_data["Retention"], int):
-                        group_data["Retention"] = f"{group_data['Retention']} days"
-
-                    # Format size if requested
                     if include_size:
-                        group_data["Storage Size"] = _human_readable_size(
-                            group_data["Stored Bytes"]
+                        stored_bytes = group.get("storedBytes", 0)
+                        group_data["Stored Bytes"] = stored_bytes
+                    group_data["ARN"] = group.get("arn", "")
+                    group_data["Created"] = (
+                        datetime.fromtimestamp(creation_time / 1000).strftime(
+                            "%Y-%m-%d %H:%M"
                         )
-
-                    # Remove raw values
-                    del group_data["Creation Time"]
-                    if not include_size:
-                        del group_data["Stored Bytes"]
+                        if creation_time
+                        else "Unknown"
+                    )
+                    if include_size:
+                        group_data["Storage Size"] = _human_readable_size(stored_bytes)
 
                     region_groups.append(group_data)
 
@@ -597,7 +715,7 @@ def _get_all_log_groups(
     region_results = parallel_execute(
         get_region_log_groups,
         regions,
-        max_workers=4,
+        max_workers=max_workers,
         show_progress=True,
         description="Scanning log groups",
     )
@@ -629,11 +747,28 @@ def _get_log_groups_list(logs_client) -> List[str]:
 
 
 def _download_single_log_group(
-    aws_auth: AWSAuth, region: str, log_group: str, days: int, output_path: Path
+    aws_auth: AWSAuth,
+    region: str,
+    log_group: str,
+    days: int,
+    output_path: Path,
+    max_workers: int = 4,
+    semaphore: Optional[threading.BoundedSemaphore] = None,
+    filter_pattern: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Download logs from a single log group."""
-
-    logs_client = aws_auth.get_client("logs", region_name=region)
+    """Download logs from a single log group.
+
+    Streams with events in range are fetched with FilterLogEvents in
+    batches of ``FILTER_LOG_EVENTS_MAX_STREAMS``, rather than one
+    GetLogEvents pagination per stream. Batches are downloaded concurrently
+    on up to ``max_workers`` threads sharing one client; when a ``semaphore``
+    is given, each batch holds it while running. A ``filter_pattern`` is
+    applied server-side, so non-matching events never leave CloudWatch.
+    """
+
+    logs_client = aws_auth.get_client(
+        "logs", region_name=region, config=LOGS_DOWNLOAD_BOTO_CONFIG
+    )
 
     # Calculate time range
     end_time = datetime.now()
@@ -653,6 +788,19 @@ def _download_single_log_group(
         "errors": [],
     }
 
+    def download_streams(stream_names: List[str]) -> Dict[str, Any]:
+        """Download a batch of streams, within the shared concurrency limit."""
+        with semaphore or nullcontext():
+            return _download_log_streams(
+                logs_client,
+                log_group,
+                stream_names,
+                start_timestamp,
+                end_timestamp,
+                output_path,
+                filter_pattern,
+            )
+
     try:
         # Get log streams
         paginator = logs_client.get_paginator("describe_log_streams")
@@ -665,36 +813,46 @@ def _download_single_log_group(
 
             task = progress.add_task(f"Processing {log_group}...", total=None)
 
-            for page in paginator.paginate(
-                logGroupName=log_group, orderBy="LastEventTime", descending=True
-            ):
-                for stream in page.get("logStreams", []):
-                    stream_name = stream["logStreamName"]
-
-                    # Skip streams with no events in our time range
-                    if stream.get("lastEventTime", 0) < start_timestamp:
-                        continue
-
-                    progress.update(
-                        task, description=f"Processing stream: {stream_name[:50]}..."
+            # Skip streams with no events in our time range
+            stream_names = [
+                stream["logStreamName"]
+                for page in paginator.paginate(
+                    logGroupName=log_group, orderBy="LastEventTime", descending=True
+                )
+                for stream in page.get("logStreams", [])
+                if stream.get("lastEventTime", 0) >= start_timestamp
+            ]
+
+            # Download events from each batch of streams concurrently
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_batch = {
+                    executor.submit(download_streams, batch): batch
+                    for batch in (
+                        stream_names[i : i + FILTER_LOG_EVENTS_MAX_STREAMS]
+                        for i in range(
+                            0, len(stream_names), FILTER_LOG_EVENTS_MAX_STREAMS
+                        )
                     )
+                }
 
-                    # Download events from this stream
-                    stream_result = _download_log_stream(
-                        logs_client,
-                        log_group,
-                        stream_name,
-                        start_timestamp,
-                        end_timestamp,
-                        output_path,
-                    )
+                for future in as_completed(future_to_batch):
+                    batch_result = future.result()
 
-                    result["streams_processed"] += 1
-                    result["events_downloaded"] += stream_result["events"]
-                    result["total_size"] += stream_result["size"]
+                    # A failed batch may be partly written; report it instead
+                    # of counting its streams as processed
+                    if batch_result["error"]:
+                        result["errors"].append(batch_result["error"])
+                    else:
+                        result["streams_processed"] += len(future_to_batch[future])
+                    result["events_downloaded"] += batch_result["events"]
+                    result["total_size"] += batch_result["size"]
+                    result["files_created"] += batch_result["files_created"]
 
-                    if stream_result["file_created"]:
-                        result["files_created"] += 1
+                    progress.update(
+                        task,
+                        description=f"Processed {result['streams_processed']}/"
+                        f"{len(stream_names)} streams in {log_group}...",
+                    )
 
     except Exception as e:
         error_msg = f"Error downloading from {log_group}: {str(e)}"
@@ -711,13 +869,26 @@ def _download_multiple_log_groups(
     days: int,
     output_path: Path,
     max_workers: int,
+    filter_pattern: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Download logs from multiple log groups in parallel."""
+    """Download logs from multiple log groups in parallel.
+
+    Groups and their streams are both downloaded concurrently; one semaphore
+    caps the stream downloads in flight across every group.
+    """
+    semaphore = threading.BoundedSemaphore(MAX_CONCURRENT_STREAM_DOWNLOADS)
 
     def download_group(log_group: str) -> Dict[str, Any]:
         """Download logs from a single group."""
         return _download_single_log_group(
-            aws_auth, region, log_group, days, output_path
+            aws_auth,
+            region,
+            log_group,
+            days,
+            output_path,
+            max_workers,
+            semaphore,
+            filter_pattern,
         )
 
     # Process groups in parallel
@@ -737,7 +908,7 @@ def _download_multiple_log_groups(
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = [executor.submit(download_group, group) for group in log_groups]
 
-            for future in futures:
+            for future in as_completed(futures):
                 result = future.result()
                 results.append(result)
                 progress.advance(task)
@@ -757,83 +928,341 @@ def _download_multiple_log_groups(
     return summary
 
 
-def _download_log_stream(
+def _download_log_streams(
     logs_client,
     log_group: str,
-    stream_name: str,
+    stream_names: List[str],
     start_time: int,
     end_time: int,
     output_path: Path,
+    filter_pattern: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Download events from a single log stream."""
+    """Download events from a batch of log streams with one FilterLogEvents query.
+
+    Each page's events are formatted and grouped by stream, then encoded and
+    written to that stream's file as a single bytes write. At most
+    ``MAX_OPEN_STREAM_FILES`` are kept open, closing the least recently
+    written one first.
+
+    Returns:
+        Events, bytes and files written, plus an error message if the batch
+        failed part way (None otherwise)
+    """
 
-    result = {"stream": stream_name, "events": 0, "size": 0, "file_created": False}
+    result = {"events": 0, "size": 0, "files_created": 0, "error": None}
+
+    # Sanitize filenames
+    safe_group_name = UNSAFE_FILENAME_CHARS.sub("_", log_group)
+    stream_files: Dict[str, Path] = {}
+    open_files: "OrderedDict[str, Any]" = OrderedDict()
 
     try:
-        # Sanitize filename
-        safe_group_name = re.sub(r"[^\w\-_.]", "_", log_group)
-        safe_stream_name = re.sub(r"[^\w\-_.]", "_", stream_name)
-
-        output_file = output_path / f"{safe_group_name}_{safe_stream_name}.log"
-
-        # Get log events
-        paginator = logs_client.get_paginator("get_log_events")
-
-        events = []
-        for page in paginator.paginate(
-            logGroupName=log_group,
-            logStreamName=stream_name,
-            startTime=start_time,
-            endTime=end_time,
-        ):
-            events.extend(page.get("events", []))
-
-        if events:
-            # Write events to file
-            with open(output_file, "w", encoding="utf-8") as f:
-                for event in events:
-                    timestamp = datetime.fromtimestamp(event["timestamp"] / 1000)
-                    f.write(f"{timestamp.isoformat()} {event['message']}\n")
-
-            result["events"] = len(events)
-            result["size"] = output_file.stat().st_size
-            result["file_created"] = True
+        paginator = logs_client.get_paginator("filter_log_events")
+
+        params = {
+            "logGroupName": log_group,
+            "logStreamNames": stream_names,
+            "startTime": start_time,
+            "endTime": end_time,
+        }
+        if filter_pattern:
+            params["filterPattern"] = filter_pattern
+
+        for page in paginator.paginate(**params):
+            # Format the page's events per stream, then write each in one call
+            lines_by_stream: Dict[str, List[str]] = {}
+            for event in page.get("events", []):
+                lines_by_stream.setdefault(event["logStreamName"], []).append(
+                    f"{_format_event_time(event['timestamp'])} {event['message']}\n"
+                )
+
+            for stream_name, lines in lines_by_stream.items():
+                f = open_files.get(stream_name)
+                if f is not None:
+                    open_files.move_to_end(stream_name)
+                else:
+                    # Truncate on first write, append after an eviction
+                    output_file = stream_files.get(stream_name)
+                    mode = "ab"
+                    if output_file is None:
+                        safe_stream_name = UNSAFE_FILENAME_CHARS.sub("_", stream_name)
+                        output_file = (
+                            output_path / f"{safe_group_name}_{safe_stream_name}.log"
+                        )
+                        stream_files[stream_name] = output_file
+                        mode = "wb"
+
+                    if len(open_files) >= MAX_OPEN_STREAM_FILES:
+                        open_files.popitem(last=False)[1].close()
+                    f = open_files[stream_name] = open(output_file, mode)
+
+                f.write("".join(lines).encode("utf-8"))
+                result["events"] += len(lines)
 
     except Exception as e:
-        logger.debug(f"Error downloading stream {stream_name}: {e}")
+        result["error"] = (
+            f"Error downloading {len(stream_names)} streams from {log_group}: {e}"
+        )
+        logger.warning(result["error"])
+
+    finally:
+        for f in open_files.values():
+            f.close()
+
+    result["files_created"] = len(stream_files)
+    result["size"] = sum(path.stat().st_size for path in stream_files.values())
 
     return result
 
 
+def _format_event_time(timestamp_ms: int) -> str:
+    """Format an event timestamp in local time, as ISO 8601.
+
+    Matches ``datetime.fromtimestamp(timestamp_ms / 1000).isoformat()``
+    without building a datetime per event.
+    """
+    seconds, millis = divmod(timestamp_ms, 1000)
+    formatted = _format_local_second(seconds)
+    return f"{formatted}.{millis:03d}000" if millis else formatted
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_local_second(seconds: int) -> str:
+    """Format whole Unix seconds in local time; events mostly share seconds."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(seconds))
+
+
+def _download_log_group_export(
+    aws_auth: AWSAuth,
+    region: str,
+    log_group: str,
+    days: int,
+    output_path: Path,
+    bucket: str,
+    max_workers: int = 4,
+    export_timeout: int = EXPORT_TIMEOUT_DEFAULT,
+) -> Dict[str, Any]:
+    """Download logs from a single log group through an S3 export task.
+
+    CloudWatch Logs writes the export to S3 server-side as gzipped objects,
+    one or more per stream, which are then downloaded and decompressed
+    concurrently. For long time ranges this is far faster than paging every
+    event through the Logs API. The bucket policy must allow CloudWatch Logs
+    to write to it.
+    """
+
+    logs_client = aws_auth.get_client("logs", region_name=region)
+    s3_client = aws_auth.get_client("s3", region_name=region)
+
+    # Calculate time range
+    end_time = datetime.now()
+    start_time = end_time - timedelta(days=days)
+
+    result = {
+        "log_group": log_group,
+        "region": region,
+        "days": days,
+        "streams_processed": 0,
+        "events_downloaded": 0,
+        "files_created": 0,
+        "total_size": 0,
+        "errors": [],
+    }
+
+    safe_group_name = UNSAFE_FILENAME_CHARS.sub("_", log_group)
+    destination_prefix = f"cloudwatch-exports/{safe_group_name}/{get_timestamp()}"
+
+    try:
+        with console.status(f"Exporting {log_group} to s3://{bucket}..."):
+            task_id = logs_client.create_export_task(
+                logGroupName=log_group,
+                fromTime=int(start_time.timestamp() * 1000),
+                to=int(end_time.timestamp() * 1000),
+                destination=bucket,
+                destinationPrefix=destination_prefix,
+            )["taskId"]
+            status = _wait_for_export_task(logs_client, task_id, export_timeout)
+
+        if status["code"] != "COMPLETED":
+            raise RuntimeError(
+                f"export task {task_id} {status['code']}: {status.get('message', '')}"
+            )
+
+        # Objects are written as <prefix>/<task id>/<stream name>/<part>.gz
+        task_prefix = f"{destination_prefix}/{task_id}/"
+        paginator = s3_client.get_paginator("list_objects_v2")
+        keys = [
+            obj["Key"]
+            for page in paginator.paginate(Bucket=bucket, Prefix=task_prefix)
+            for obj in page.get("Contents", [])
+            if obj["Key"].endswith(".gz")
+        ]
+
+        def download_object(key: str) -> Tuple[int, int]:
+            """Download and decompress one exported object."""
+            stream_name, _, part = key[len(task_prefix) :].rpartition("/")
+            safe_stream_name = UNSAFE_FILENAME_CHARS.sub("_", stream_name)
+            output_file = (
+                output_path
+                / f"{safe_group_name}_{safe_stream_name}_{part.removesuffix('.gz')}.log"
+            )
+
+            events = 0
+            body = s3_client.get_object(Bucket=bucket, Key=key)["Body"]
+            with gzip.GzipFile(fileobj=body) as src, open(output_file, "wb") as dst:
+                while chunk := src.read(COMBINE_READ_SIZE):
+                    events += chunk.count(b"\n")
+                    dst.write(chunk)
+            return events, output_file.stat().st_size
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+        ) as progress:
+
+            task = progress.add_task("Downloading export...", total=len(keys))
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_key = {
+                    executor.submit(download_object, key): key for key in keys
+                }
+
+                for future in as_completed(future_to_key):
+                    try:
+                        events, size = future.result()
+                        result["events_downloaded"] += events
+                        result["total_size"] += size
+                        result["files_created"] += 1
+                    except Exception as e:
+                        result["errors"].append(
+                            f"Error downloading {future_to_key[future]}: {e}"
+                        )
+                    progress.advance(task)
+
+        result["streams_processed"] = len(
+            {key[len(task_prefix) :].rpartition("/")[0] for key in keys}
+        )
+
+    except Exception as e:
+        error_msg = f"Error exporting {log_group}: {str(e)}"
+        result["errors"].append(error_msg)
+        logger.error(error_msg)
+
+    return result
+
+
+def _wait_for_export_task(
+    logs_client, task_id: str, timeout: int = EXPORT_TIMEOUT_DEFAULT
+) -> Dict[str, Any]:
+    """Poll an export task until it leaves PENDING/RUNNING, returning that status.
+
+    The interval grows by half each poll up to ``EXPORT_POLL_MAX``, with
+    jitter so concurrent waiters don't poll in lockstep.
+
+    Raises:
+        RuntimeError: If the task is still pending or running after
+            ``timeout`` seconds
+    """
+
+    deadline = time.monotonic() + timeout
+    interval = EXPORT_POLL_INITIAL
+    while True:
+        response = logs_client.describe_export_tasks(taskId=task_id)
+        status = response["exportTasks"][0]["status"]
+        if status["code"] not in ("PENDING", "RUNNING"):
+            return status
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise RuntimeError(
+                f"export task {task_id} still {status['code']} after {timeout}s; "
+                f"cancel it with: aws logs cancel-export-task --task-id {task_id}"
+            )
+        time.sleep(min(interval + random.uniform(0, interval * 0.1), remaining))
+        interval = min(interval * 1.5, EXPORT_POLL_MAX)
+
+
 def _combine_log_files(
-    folder_path: Path, output_file: str, sort_lines: bool
+    folder_path: Path, output_file: str, sort_lines: bool, max_workers: int = 4
 ) -> Dict[str, Any]:
-    """Combine multiple log files into a single file."""
+    """Combine multiple log files into a single file.
+
+    When sorting, each file's lines are sorted and merged into runs of about
+    ``COMBINE_RUN_BYTES`` that are spilled to temporary files and k-way
+    merged into the output. Files are read and written as raw bytes in
+    ``COMBINE_READ_SIZE`` chunks, without decoding.
+
+    Sorted combines read and sort files on ``max_workers`` threads, in
+    batches of at most ``max_workers * 2`` files totalling about
+    ``COMBINE_RUN_BYTES``. Pending lines are spilled before a batch that
+    would push them past the run size, so the lines held in memory stay
+    within about one run (plus Python's per-line overhead). A single file
+    larger than the run size is still read and sorted whole, so it sets the
+    peak instead.
+    """
 
     start_time = datetime.now()
 
     # Find all log files
     files = [p for p in folder_path.iterdir() if p.is_file()]
 
-    combined_lines = []
     files_processed = 0
+    total_lines = 0
 
-    for file_path in files:
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                combined_lines.extend(lines)
-                files_processed += 1
-        except Exception as e:
-            logger.warning(f"Error reading {file_path}: {e}")
+    with ExitStack() as stack:
+        out = stack.enter_context(open(output_file, "wb"))
 
-    # Sort lines if requested
-    if sort_lines:
-        combined_lines.sort()
-
-    # Write combined file
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.writelines(combined_lines)
+        if not sort_lines:
+            for file_path in files:
+                try:
+                    for block in _iter_line_blocks(file_path):
+                        total_lines += block.count(b"\n")
+                        out.write(block)
+                except Exception as e:
+                    logger.warning(f"Error reading {file_path}: {e}")
+                    continue
+                files_processed += 1
+        else:
+            # Sorted per-file lines not yet spilled, and the spilled runs
+            pending: List[List[bytes]] = []
+            pending_bytes = 0
+            spilled_runs = []
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for batch, batch_bytes in _size_batches(
+                    files, max_workers * 2, COMBINE_RUN_BYTES
+                ):
+                    if pending and pending_bytes + batch_bytes > COMBINE_RUN_BYTES:
+                        spilled = stack.enter_context(tempfile.TemporaryFile())
+                        spilled.writelines(heapq.merge(*pending))
+                        spilled.seek(0)
+                        spilled_runs.append(spilled)
+                        pending = []
+                        pending_bytes = 0
+
+                    future_to_file = {
+                        executor.submit(_read_sorted_lines, file_path): file_path
+                        for file_path in batch
+                    }
+                    for future in as_completed(future_to_file):
+                        try:
+                            lines, size = future.result()
+                        except Exception as e:
+                            logger.warning(
+                                f"Error reading {future_to_file[future]}: {e}"
+                            )
+                            continue
+
+                        files_processed += 1
+                        total_lines += len(lines)
+                        pending.append(lines)
+                        pending_bytes += size
+
+            # Merge the spilled runs with the lines still in memory
+            out.writelines(heapq.merge(*spilled_runs, *pending))
 
     # Get output file size
     output_size = Path(output_file).stat().st_size
@@ -841,12 +1270,89 @@ def _combine_log_files(
 
     return {
         "files_processed": files_processed,
-        "total_lines": len(combined_lines),
+        "total_lines": total_lines,
         "output_size": output_size,
         "processing_time": processing_time,
     }
 
 
+def _size_batches(
+    files: List[Path], max_files: int, max_bytes: int
+) -> Iterator[Tuple[List[Path], int]]:
+    """Group files into batches by count and on-disk size.
+
+    A file larger than ``max_bytes`` gets a batch of its own. Files that
+    can't be stat'ed count as empty; reading them reports the error.
+
+    Yields:
+        Tuples of the batch's files and their total size in bytes
+    """
+    batch: List[Path] = []
+    batch_bytes = 0
+    for file_path in files:
+        try:
+            size = file_path.stat().st_size
+        except OSError:
+            size = 0
+        if batch and (len(batch) >= max_files or batch_bytes + size > max_bytes):
+            yield batch, batch_bytes
+            batch, batch_bytes = [], 0
+        batch.append(file_path)
+        batch_bytes += size
+    if batch:
+        yield batch, batch_bytes
+
+
+def _read_sorted_lines(file_path: Path) -> Tuple[List[bytes], int]:
+    """Read a file's lines and sort them.
+
+    Large files are memory-mapped and split straight into lines, so their
+    contents are not first copied into an intermediate read buffer; small
+    ones are read in a single call.
+
+    Returns:
+        Tuple of the sorted lines and their total size in bytes
+    """
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        # Empty files can't be mapped
+        if not size:
+            return [], 0
+        if size < COMBINE_MMAP_MIN_BYTES:
+            lines = io.BytesIO(f.read()).readlines()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                lines = list(iter(mm.readline, b""))
+
+    # Keep an unterminated last line from running into the next one
+    if not lines[-1].endswith(b"\n"):
+        lines[-1] += b"\n"
+        size += 1
+
+    lines.sort()
+    return lines, size
+
+
+def _iter_line_blocks(file_path: Path) -> Iterator[bytes]:
+    """Read a file in fixed-size chunks, yielding blocks of whole lines.
+
+    A line split across chunks is carried over into the next block, and an
+    unterminated last line is given a newline so it can't run into the next
+    file's first line; every block therefore ends in a newline.
+    """
+    with open(file_path, "rb") as f:
+        pending = b""
+        while chunk := f.read(COMBINE_READ_SIZE):
+            end = chunk.rfind(b"\n") + 1
+            if not end:
+                pending += chunk
+                continue
+            yield pending + chunk[:end]
+            pending = chunk[end:]
+        if pending:
+            yield pending + b"\n"
+
+
 def _human_readable_size(num_bytes: int) -> str:
     """Convert bytes to human readable format."""
     if not isinstance(num_bytes, (int, float)):
@@ -1002,17 +1508,22 @@ def _detect_log_type(file_path: Path, specified_type: Optional[str]) -> Optional
 
     # Check filename patterns
     for log_type, pattern in LOG_PATTERNS.items():
-        if re.match(pattern, file_name, re.IGNORECASE):
+        if pattern.match(file_name):
             return log_type
 
     # Try content detection for ambiguous files
     try:
         content_sample = _read_file_sample(file_path, 5)
 
-        # JSON structure detection
-        if content_sample.strip().startswith("{"):
+        # JSON structure detection; only "Records" documents are recognized,
+        # so anything without that key is rejected before parsing
+        if content_sample.lstrip().startswith("{") and '"Records"' in content_sample:
             try:
-                json_data = json.loads(content_sample)
+                json_data = (
+                    orjson.loads(content_sample)
+                    if orjson is not None
+                    else json.loads(content_sample)
+                )
                 if (
                     "Records" in json_data
                     and "eventVersion" in json_data.get("Records", [{}])[0]
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import re
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
@@ -18,6 +19,37 @@ from ..core.tag_filter import TagFilter
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Case-insensitive matchers for connection-related parameter names and
+# error log lines, compiled once instead of lowercasing per keyword
+CONNECTION_PARAMETER_PATTERN = re.compile(
+    "|".join(
+        [
+            "max_connections",
+            "connect_timeout",
+            "wait_timeout",
+            "interactive_timeout",
+            "thread_cache_size",
+            "thread_stack",
+            "max_user_connections",
+        ]
+    ),
+    re.IGNORECASE,
+)
+CONNECTION_ERROR_PATTERN = re.compile(
+    "|".join(
+        [
+            "too many connections",
+            "connection refused",
+            "max_connections",
+            "aborted connection",
+            "got timeout",
+            "connection reset",
+            "user limit",
+        ]
+    ),
+    re.IGNORECASE,
+)
+
 
 class RDSManager:
     """RDS management and troubleshooting operations."""
@@ -31,9 +63,8 @@ class RDSManager:
         """
         self.config = config
         self.aws_auth = aws_auth
-        self.session = aws_auth.session
-        self.rds_client = self.session.client("rds")
-        self.cloudwatch_client = self.session.client("cloudwatch")
+        self.rds_client = aws_auth.get_client("rds")
+        self.cloudwatch_client = aws_auth.get_client("cloudwatch")
 
     def troubleshoot_mysql_connections(
         self, db_instance_identifier: str
@@ -204,18 +235,7 @@ class RDSManager:
                 connection_params = {}
                 for param in params_response.get("Parameters", []):
                     param_name = param.get("ParameterName", "")
-                    if any(
-                        keyword in param_name.lower()
-                        for keyword in [
-                            "max_connections",
-                            "connect_timeout",
-                            "wait_timeout",
-                            "interactive_timeout",
-                            "thread_cache_size",
-                            "thread_stack",
-                            "max_user_connections",
-                        ]
-                    ):
+                    if CONNECTION_PARAMETER_PATTERN.search(param_name):
                         connection_params[param_name] = {
                             "value": param.get("ParameterValue", "Not Set"),
                             "source": param.get("Source"),
@@ -269,21 +289,11 @@ class RDSManager:
             log_content = response.get("LogFileData", "")
 
             # Look for connection-related errors
-            connection_errors = []
-            for line in log_content.split("\n"):
-                if any(
-                    keyword in line.lower()
-                    for keyword in [
-                        "too many connections",
-                        "connection refused",
-                        "max_connections",
-                        "aborted connection",
-                        "got timeout",
-                        "connection reset",
-                        "user limit",
-                    ]
-                ):
-                    connection_errors.append(line.strip())
+            connection_errors = [
+                line.strip()
+                for line in log_content.split("\n")
+                if CONNECTION_ERROR_PATTERN.search(line)
+            ]
 
             return {
                 "log_file_name": log_file_name,
@@ -570,8 +580,7 @@ def list_instances(
                 f"[cyan]Tag Filter: {tag_filter.create_filter_display()}[/cyan]"
             )
 
-        session = aws_auth.session
-        rds_client = session.client("rds")
+        rds_client = aws_auth.get_client("rds")
 
         with console.status("[bold green]Fetching RDS instances..."):
             response = rds_client.describe_db_instances()
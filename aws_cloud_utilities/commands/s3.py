@@ -1,13 +1,15 @@
 """AWS S3 bucket and object management commands."""
 
+import functools
 import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import click
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
 from rich.console import Console
 from rich.progress import (
     BarColumn,
@@ -43,6 +45,20 @@ console = Console()
 ARCHIVE_STORAGE_CLASSES = ["GLACIER", "DEEP_ARCHIVE", "GLACIER_IR"]
 RESTORE_TIERS = ["Standard", "Bulk", "Expedited"]
 
+# Most queries GetMetricData accepts in one request
+GET_METRIC_DATA_MAX_QUERIES = 500
+
+# Objects up to this size are downloaded with a single GET; larger ones are
+# fetched as ranged parts of DOWNLOAD_MULTIPART_CHUNKSIZE
+DOWNLOAD_MULTIPART_THRESHOLD = 64 * 1024 * 1024
+DOWNLOAD_MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+
+# Downloads submitted per worker before waiting for one to finish
+DOWNLOADS_IN_FLIGHT_PER_WORKER = 4
+
+# Most keys DeleteObjects accepts in one request
+DELETE_OBJECTS_MAX_KEYS = 1000
+
 
 @click.group(name="s3")
 def s3_group():
@@ -421,6 +437,8 @@ def nuke_bucket(
             console.print(
                 f"\n[yellow]DRY RUN completed for bucket '{bucket_name}'[/yellow]"
             )
+        elif not nuke_results["bucket_deleted"]:
+            console.print(f"\n[red]Bucket '{bucket_name}' was not deleted[/red]")
         else:
             console.print(
                 f"\n[green]✅ Bucket '{bucket_name}' has been completely nuked![/green]"
@@ -430,6 +448,9 @@ def nuke_bucket(
         console.print(f"[red]Error nuking S3 bucket:[/red] {e}")
         raise click.Abort()
 
+    if not dry_run and not nuke_results["bucket_deleted"]:
+        raise click.Abort()
+
 
 @s3_group.command(name="bucket-details")
 @click.argument("bucket_name", required=False)
@@ -824,12 +845,6 @@ def _get_all_buckets(
                     ),
                 }
 
-                # Get size information if requested
-                if include_size:
-                    size_info = _get_bucket_size(aws_auth, bucket_name)
-                    bucket_data["Size"] = size_info["size_display"]
-                    bucket_data["Object Count"] = size_info["object_count"]
-
                 return bucket_data
 
             except Exception as e:
@@ -851,72 +866,117 @@ def _get_all_buckets(
             description="Processing buckets",
         )
 
-        # Filter out None results and return
-        return [result for result in bucket_results if result is not None]
+        # Filter out None results
+        bucket_results = [result for result in bucket_results if result is not None]
+
+        # Get size information if requested, batched per bucket region
+        if include_size:
+            buckets_by_region: Dict[str, List[Dict[str, Any]]] = {}
+            for bucket_data in bucket_results:
+                if bucket_data["Region"] != "Error":
+                    buckets_by_region.setdefault(bucket_data["Region"], []).append(
+                        bucket_data
+                    )
+
+            for bucket_region, region_buckets in buckets_by_region.items():
+                sizes = _get_bucket_sizes(
+                    aws_auth,
+                    bucket_region,
+                    [bucket_data["Bucket Name"] for bucket_data in region_buckets],
+                )
+                for bucket_data in region_buckets:
+                    size_info = sizes[bucket_data["Bucket Name"]]
+                    bucket_data["Size"] = size_info["size_display"]
+                    bucket_data["Object Count"] = size_info["object_count"]
+
+        return bucket_results
 
     except Exception as e:
         logger.error(f"Error listing buckets: {e}")
         raise
 
 
-def _get_bucket_size(aws_auth: AWSAuth, bucket_name: str) -> Dict[str, Any]:
-    """Get bucket size information from CloudWatch metrics."""
+def _get_bucket_sizes(
+    aws_auth: AWSAuth, region: str, bucket_names: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """Get bucket size information from CloudWatch metrics.
+
+    S3 storage metrics are published in each bucket's own region. All the
+    given buckets are queried together through GetMetricData, two queries
+    per bucket, in batches of ``GET_METRIC_DATA_MAX_QUERIES``.
+
+    Args:
+        aws_auth: AWS authentication instance
+        region: Region the buckets are in
+        bucket_names: Names of the buckets
+
+    Returns:
+        Size information keyed by bucket name
+    """
+    sizes = {
+        bucket_name: {
+            "size_bytes": 0,
+            "size_display": _human_readable_size(0),
+            "object_count": 0,
+        }
+        for bucket_name in bucket_names
+    }
 
     try:
-        # CloudWatch metrics for S3 buckets are in us-east-1
-        cw_client = aws_auth.get_client("cloudwatch", region_name="us-east-1")
+        cw_client = aws_auth.get_client("cloudwatch", region_name=region)
 
         # Calculate time range (2 days ago to 1 day ago for latest metrics)
         end_time = datetime.now() - timedelta(days=1)
         start_time = end_time - timedelta(days=1)
 
-        # Get bucket size metrics
-        size_response = cw_client.get_metric_statistics(
-            Namespace="AWS/S3",
-            MetricName="BucketSizeBytes",
-            Dimensions=[
-                {"Name": "BucketName", "Value": bucket_name},
-                {"Name": "StorageType", "Value": "StandardStorage"},
-            ],
-            StartTime=start_time,
-            EndTime=end_time,
-            Period=86400,  # 1 day
-            Statistics=["Average"],
-        )
-
-        # Get object count metrics
-        count_response = cw_client.get_metric_statistics(
-            Namespace="AWS/S3",
-            MetricName="NumberOfObjects",
-            Dimensions=[
-                {"Name": "BucketName", "Value": bucket_name},
-                {"Name": "StorageType", "Value": "AllStorageTypes"},
-            ],
-            StartTime=start_time,
-            EndTime=end_time,
-            Period=86400,  # 1 day
-            Statistics=["Average"],
-        )
-
-        # Extract size
-        size_bytes = 0
-        if size_response.get("Datapoints"):
-            size_bytes = int(size_response["Datapoints"][-1]["Average"])
-
-        # Extract object count
-        object_count = 0
-        if count_response.get("Datapoints"):
-            object_count = int(count_response["Datapoints"][-1]["Average"])
+        queries = []
+        query_targets = {}
+        for i, bucket_name in enumerate(bucket_names):
+            for query_id, metric_name, storage_type, key in (
+                (f"size{i}", "BucketSizeBytes", "StandardStorage", "size_bytes"),
+                (f"count{i}", "NumberOfObjects", "AllStorageTypes", "object_count"),
+            ):
+                queries.append(
+                    {
+                        "Id": query_id,
+                        "MetricStat": {
+                            "Metric": {
+                                "Namespace": "AWS/S3",
+                                "MetricName": metric_name,
+                                "Dimensions": [
+                                    {"Name": "BucketName", "Value": bucket_name},
+                                    {"Name": "StorageType", "Value": storage_type},
+                                ],
+                            },
+                            "Period": 86400,  # 1 day
+                            "Stat": "Average",
+                        },
+                    }
+                )
+                query_targets[query_id] = (bucket_name, key)
+
+        paginator = cw_client.get_paginator("get_metric_data")
+        for i in range(0, len(queries), GET_METRIC_DATA_MAX_QUERIES):
+            for page in paginator.paginate(
+                MetricDataQueries=queries[i : i + GET_METRIC_DATA_MAX_QUERIES],
+                StartTime=start_time,
+                EndTime=end_time,
+            ):
+                for result in page.get("MetricDataResults", []):
+                    # Values are newest first
+                    if result.get("Values"):
+                        bucket_name, key = query_targets[result["Id"]]
+                        sizes[bucket_name][key] = int(result["Values"][0])
 
-        return {
-            "size_bytes": size_bytes,
-            "size_display": _human_readable_size(size_bytes),
-            "object_count": object_count,
-        }
+        for size_info in sizes.values():
+            size_info["size_display"] = _human_readable_size(size_info["size_bytes"])
 
     except Exception as e:
-        logger.debug(f"Error getting size for bucket {bucket_name}: {e}")
-        return {"size_bytes": 0, "size_display": "N/A", "object_count": "N/A"}
+        logger.debug(f"Error getting sizes for buckets in {region}: {e}")
+        for size_info in sizes.values():
+            size_info.update(size_bytes=0, size_display="N/A", object_count="N/A")
+
+    return sizes
 
 
 def _create_s3_bucket(
@@ -993,9 +1053,19 @@ def _download_s3_objects(
     max_retries: int,
     max_workers: int,
 ) -> Dict[str, Any]:
-    """Download objects from S3 bucket."""
+    """Download objects from S3 bucket.
+
+    All objects go through one shared transfer manager capped at
+    ``max_workers`` concurrent requests, instead of a new manager (and
+    thread pool) per object.
+    """
 
     s3_client = aws_auth.get_client("s3", region_name=region)
+    transfer_config = TransferConfig(
+        multipart_threshold=DOWNLOAD_MULTIPART_THRESHOLD,
+        multipart_chunksize=DOWNLOAD_MULTIPART_CHUNKSIZE,
+        max_concurrency=max_workers,
+    )
 
     result = {
         "bucket_name": bucket_name,
@@ -1033,41 +1103,56 @@ def _download_s3_objects(
                 "Downloading objects...", total=len(objects_to_download)
             )
 
+            transfer_manager = create_transfer_manager(s3_client, transfer_config)
+
             def download_object(obj_info: Dict[str, Any]) -> Dict[str, Any]:
                 """Download a single object."""
                 return _download_single_object(
-                    s3_client, bucket_name, obj_info, output_path, max_retries
+                    transfer_manager, bucket_name, obj_info, output_path, max_retries
                 )
 
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = [
-                    executor.submit(download_object, obj) for obj in objects_to_download
-                ]
+            def record_download(download_result: Dict[str, Any]) -> None:
+                """Tally a finished download, deleting the object if requested."""
+                if download_result["success"]:
+                    result["objects_downloaded"] += 1
+                    result["total_size"] += download_result["size"]
+
+                    # Delete from S3 if requested
+                    if delete_after_download:
+                        delete_result = _delete_single_object(
+                            s3_client,
+                            bucket_name,
+                            download_result["key"],
+                            download_result.get("version_id"),
+                        )
+                        if delete_result["success"]:
+                            result["objects_deleted"] += 1
+                        else:
+                            result["errors"].append(delete_result["error"])
+                else:
+                    result["objects_failed"] += 1
+                    result["errors"].append(download_result["error"])
 
-                for future in as_completed(futures):
-                    download_result = future.result()
+                progress.advance(task)
 
-                    if download_result["success"]:
-                        result["objects_downloaded"] += 1
-                        result["total_size"] += download_result["size"]
+            # Submission waits on finished downloads once this many are queued,
+            # so pending futures and their results stay bounded
+            max_in_flight = max_workers * DOWNLOADS_IN_FLIGHT_PER_WORKER
 
-                        # Delete from S3 if requested
-                        if delete_after_download:
-                            delete_result = _delete_single_object(
-                                s3_client,
-                                bucket_name,
-                                download_result["key"],
-                                download_result.get("version_id"),
-                            )
-                            if delete_result["success"]:
-                                result["objects_deleted"] += 1
-                            else:
-                                result["errors"].append(delete_result["error"])
-                    else:
-                        result["objects_failed"] += 1
-                        result["errors"].append(download_result["error"])
+            with (
+                transfer_manager,
+                ThreadPoolExecutor(max_workers=max_workers) as executor,
+            ):
+                in_flight = set()
+                for obj in objects_to_download:
+                    in_flight.add(executor.submit(download_object, obj))
+                    if len(in_flight) >= max_in_flight:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            record_download(future.result())
 
-                    progress.advance(task)
+                for future in as_completed(in_flight):
+                    record_download(future.result())
 
     except Exception as e:
         result["errors"].append(f"Download operation error: {str(e)}")
@@ -1138,14 +1223,32 @@ def _get_s3_objects_list(
     return objects
 
 
+@functools.lru_cache(maxsize=None)
+def _ensure_download_dir(directory: Path) -> None:
+    """Create a download directory once per process.
+
+    Objects sharing a prefix share a directory, so only the first object
+    under each one pays for the mkdir calls.
+
+    Args:
+        directory: Directory to create, with any missing parents
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+
+
 def _download_single_object(
-    s3_client,
+    transfer_manager,
     bucket_name: str,
     obj_info: Dict[str, Any],
     output_path: Path,
     max_retries: int,
 ) -> Dict[str, Any]:
-    """Download a single object from S3."""
+    """Download a single object from S3 through a shared transfer manager.
+
+    Object versions are saved as ``<key>.<version id>`` so every version of
+    a key gets its own file. Objects without a version ID (or with the
+    ``null`` ID of unversioned objects) are saved under their key.
+    """
 
     key = obj_info["key"]
     version_id = obj_info.get("version_id")
@@ -1161,20 +1264,19 @@ def _download_single_object(
     try:
         # Create local file path
         local_path = output_path / key
-        local_path.parent.mkdir(parents=True, exist_ok=True)
+        if version_id and version_id != "null":
+            local_path = local_path.with_name(f"{local_path.name}.{version_id}")
+        _ensure_download_dir(local_path.parent)
 
         # Download with retries
         for attempt in range(max_retries + 1):
             try:
-                download_args = {
-                    "Bucket": bucket_name,
-                    "Key": key,
-                    "Filename": str(local_path),
-                }
-                if version_id:
-                    download_args["ExtraArgs"] = {"VersionId": version_id}
-
-                s3_client.download_file(**download_args)
+                transfer_manager.download(
+                    bucket_name,
+                    key,
+                    str(local_path),
+                    extra_args={"VersionId": version_id} if version_id else None,
+                ).result()
 
                 result["success"] = True
                 result["size"] = local_path.stat().st_size
@@ -1266,12 +1368,26 @@ def _nuke_s3_bucket(
             result["download_performed"] = True
             result["download_results"] = download_results
 
+            # Never delete anything that didn't make it into the backup
+            if (
+                download_results["errors"]
+                or download_results["objects_downloaded"]
+                < download_results["objects_found"]
+            ):
+                result["errors"].append(
+                    f"Backup incomplete ({download_results['objects_downloaded']} of "
+                    f"{download_results['objects_found']} objects downloaded), "
+                    "bucket was not deleted"
+                )
+                return result
+
         if not dry_run:
             # Delete all object versions and delete markers
             deletion_results = _delete_all_object_versions(
                 s3_client, bucket_name, max_workers
             )
 
+            result["errors"].extend(deletion_results.pop("errors"))
             result.update(deletion_results)
 
             # Delete the bucket itself
@@ -1574,9 +1690,118 @@ def _display_restore_results(
 def _delete_all_object_versions(
     s3_client, bucket_name: str, max_workers: int
 ) -> Dict[str, Any]:
-    """Delete all object versions from a bucket."""
-    # Simplified implementation
-    return {"objects_deleted": 0, "versions_deleted": 0, "delete_markers_deleted": 0}
+    """Delete all object versions and delete markers from a bucket.
+
+    Keys are deleted ``DELETE_OBJECTS_MAX_KEYS`` per DeleteObjects request,
+    with up to ``max_workers`` requests running at once. Each batch is sent
+    as soon as the listing fills it, so deleting overlaps with listing and
+    only the batches in flight are held in memory.
+
+    Args:
+        s3_client: S3 client for the bucket's region
+        bucket_name: Bucket to empty
+        max_workers: Maximum concurrent DeleteObjects requests
+
+    Returns:
+        Counts of deleted objects, versions and delete markers, plus errors
+    """
+    result = {
+        "objects_deleted": 0,
+        "versions_deleted": 0,
+        "delete_markers_deleted": 0,
+        "errors": [],
+    }
+
+    def record_batch(batch_result: Dict[str, Any]) -> None:
+        """Add a finished batch's counts and errors to the totals."""
+        result["versions_deleted"] += batch_result["versions_deleted"]
+        result["delete_markers_deleted"] += batch_result["delete_markers_deleted"]
+        result["errors"].extend(batch_result["errors"])
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight = set()
+        batch = []
+
+        def flush() -> None:
+            nonlocal batch, in_flight
+            if len(in_flight) >= max_workers:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    record_batch(future.result())
+            in_flight.add(
+                executor.submit(_delete_objects_batch, s3_client, bucket_name, batch)
+            )
+            batch = []
+
+        paginator = s3_client.get_paginator("list_object_versions")
+        for page in paginator.paginate(Bucket=bucket_name):
+            for version in page.get("Versions", []):
+                batch.append((version["Key"], version["VersionId"], False))
+                if len(batch) == DELETE_OBJECTS_MAX_KEYS:
+                    flush()
+            for marker in page.get("DeleteMarkers", []):
+                batch.append((marker["Key"], marker["VersionId"], True))
+                if len(batch) == DELETE_OBJECTS_MAX_KEYS:
+                    flush()
+        if batch:
+            flush()
+
+        for future in as_completed(in_flight):
+            record_batch(future.result())
+
+    result["objects_deleted"] = (
+        result["versions_deleted"] + result["delete_markers_deleted"]
+    )
+    return result
+
+
+def _delete_objects_batch(
+    s3_client, bucket_name: str, batch: List[tuple]
+) -> Dict[str, Any]:
+    """Delete a batch of object versions with a single DeleteObjects request.
+
+    Args:
+        s3_client: S3 client for the bucket's region
+        bucket_name: Bucket the versions are in
+        batch: (key, version ID, is delete marker) tuples, at most
+            ``DELETE_OBJECTS_MAX_KEYS`` of them
+
+    Returns:
+        Counts of deleted versions and delete markers, plus errors
+    """
+    result = {"versions_deleted": 0, "delete_markers_deleted": 0, "errors": []}
+
+    try:
+        response = s3_client.delete_objects(
+            Bucket=bucket_name,
+            Delete={
+                "Objects": [
+                    {"Key": key, "VersionId": version_id}
+                    for key, version_id, _ in batch
+                ],
+                "Quiet": True,
+            },
+        )
+    except Exception as e:
+        result["errors"].append(f"Failed to delete {len(batch)} objects: {str(e)}")
+        return result
+
+    # Quiet mode only reports the keys that could not be deleted
+    failed = set()
+    for error in response.get("Errors", []):
+        failed.add((error.get("Key"), error.get("VersionId")))
+        result["errors"].append(
+            f"Failed to delete {error.get('Key')}: {error.get('Message')}"
+        )
+
+    for key, version_id, is_delete_marker in batch:
+        if (key, version_id) not in failed:
+            if is_delete_marker:
+                result["delete_markers_deleted"] += 1
+            else:
+                result["versions_deleted"] += 1
+
+    return result
 
 
 def _count_bucket_contents(s3_client, bucket_name: str) -> Dict[str, Any]:
@@ -1791,7 +2016,7 @@ def _get_bucket_details(
 
     # Get bucket size and object count from CloudWatch
     try:
-        size_info = _get_bucket_size(aws_auth, bucket_name)
+        size_info = _get_bucket_sizes(aws_auth, region, [bucket_name])[bucket_name]
         bucket_details["Size"] = size_info["size_display"]
         bucket_details["Object Count"] = size_info["object_count"]
     except Exception as e:
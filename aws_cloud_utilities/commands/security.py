@@ -1,6 +1,7 @@
 """AWS security monitoring and certificate management commands."""
 
 import logging
+import time
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -270,12 +271,11 @@ def list_certificates(
                 # List certificates
                 paginator = acm_client.get_paginator("list_certificates")
 
-                for page in paginator.paginate():
-                    for cert in page.get("CertificateSummaryList", []):
-                        # Filter by status if specified
-                        if status and cert.get("Status") != status:
-                            continue
+                # Filter by status server-side if specified
+                list_params = {"CertificateStatuses": [status]} if status else {}
 
+                for page in paginator.paginate(**list_params):
+                    for cert in page.get("CertificateSummaryList", []):
                         # Get detailed certificate information
                         try:
                             cert_details = acm_client.describe_certificate(
@@ -745,8 +745,6 @@ def _get_validation_records(acm_client, certificate_arn: str) -> List[Dict[str,
 
         attempt += 1
         if attempt < max_attempts:
-            import time
-
             time.sleep(2)
 
     raise Exception("Timeout waiting for validation records")
@@ -779,8 +777,6 @@ def _create_validation_records(
 
 def _wait_for_validation(acm_client, certificate_arn: str, timeout: int) -> bool:
     """Wait for certificate validation to complete."""
-    import time
-
     start_time = time.time()
 
     while time.time() - start_time < timeout:
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -464,15 +465,20 @@ def show_execution_logs(
 
         # Get logs
         try:
-            response = logs_client.filter_log_events(
-                logGroupName=log_group,
-                startTime=start_time_ms,
-                endTime=end_time_ms,
-                filterPattern=filter_pattern,
-                limit=lines,
-            )
-
-            events = response.get("events", [])
+            # Filtered searches can return empty pages before the matches,
+            # so follow nextToken until enough events are found
+            paginator = logs_client.get_paginator("filter_log_events")
+            events = [
+                event
+                for page in paginator.paginate(
+                    logGroupName=log_group,
+                    startTime=start_time_ms,
+                    endTime=end_time_ms,
+                    filterPattern=filter_pattern,
+                    PaginationConfig={"MaxItems": lines},
+                )
+                for event in page.get("events", [])
+            ]
 
             if events:
                 console.print(f"\n[green]Found {len(events)} log events:[/green]\n")
@@ -545,8 +551,6 @@ def _wait_for_execution(
     sf_client, execution_arn: str, timeout: int
 ) -> Optional[Dict[str, Any]]:
     """Wait for Step Functions execution to complete."""
-    import time
-
     start_time = time.time()
 
     while time.time() - start_time < timeout:
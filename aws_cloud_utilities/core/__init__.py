@@ -7,6 +7,7 @@ from .html_report import (
     HTMLReportGenerator,
     ReportMetadata,
     ReportSection,
+    SafeHTML,
     create_badge,
     create_list_html,
     create_stats_grid_html,
@@ -25,6 +26,7 @@ __all__ = [
     "HTMLReportGenerator",
     "ReportMetadata",
     "ReportSection",
+    "SafeHTML",
     "create_table_html",
     "create_stats_grid_html",
     "create_badge",
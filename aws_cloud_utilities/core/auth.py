@@ -1,16 +1,25 @@
 """AWS authentication and session management."""
 
 import logging
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Dict, Optional, Tuple
 
 import boto3
 from botocore.client import Config as BotoConfig
-from botocore.exceptions import ClientError, NoCredentialsError, ProfileNotFound
+from botocore.exceptions import (
+    BotoCoreError,
+    ClientError,
+    NoCredentialsError,
+    ProfileNotFound,
+)
 
 from .exceptions import AWSError, ConfigurationError
 
 logger = logging.getLogger(__name__)
 
+# Matches the upper bound on Config.workers
+MAX_POOL_CONNECTIONS = 50
+
 
 class AWSAuth:
     """AWS authentication and session management."""
@@ -36,12 +45,19 @@ class AWSAuth:
         self.max_retries = max_retries
         self._session: Optional[boto3.Session] = None
         self._account_id: Optional[str] = None
+        self._caller_identity: Optional[Dict[str, Any]] = None
+        self._regions: Dict[str, list[str]] = {}
+        self._clients: Dict[Tuple[str, Optional[str], Optional[BotoConfig]], Any] = {}
+        self._clients_lock = threading.Lock()
 
-        # Boto3 configuration
+        # Boto3 configuration, built once and shared by every client. Adaptive
+        # retries back off client-side on throttling, and the connection pool
+        # is sized for the largest worker count so threads don't queue on it.
         self._boto_config = BotoConfig(
             connect_timeout=timeout,
             read_timeout=timeout,
-            retries={"max_attempts": max_retries},
+            retries={"max_attempts": max_retries, "mode": "adaptive"},
+            max_pool_connections=MAX_POOL_CONNECTIONS,
         )
 
     @property
@@ -70,34 +86,67 @@ class AWSAuth:
 
         return self._session
 
+    def ensure_session(self) -> boto3.Session:
+        """Create and validate the session now, if not done already.
+
+        Call this before handing the instance to worker threads, so they
+        share one session instead of racing to create it.
+
+        Returns:
+            The boto3 session
+        """
+        return self.session
+
     def _test_credentials(self) -> None:
         """Test AWS credentials by calling STS get_caller_identity."""
         try:
             sts_client = self.session.client("sts", config=self._boto_config)
             response = sts_client.get_caller_identity()
+            self._caller_identity = response
             self._account_id = response["Account"]
             logger.debug(f"AWS credentials validated for account: {self._account_id}")
-        except ClientError as e:
+        except (BotoCoreError, ClientError) as e:
             raise AWSError(f"AWS credentials validation failed: {e}")
 
-    def get_client(self, service_name: str, region_name: Optional[str] = None) -> Any:
+    def get_client(
+        self,
+        service_name: str,
+        region_name: Optional[str] = None,
+        config: Optional[BotoConfig] = None,
+    ) -> Any:
         """Get AWS service client.
 
+        Clients are cached per service, region and config, so repeated calls
+        (e.g., once per stack or per worker task) reuse the loaded service
+        model and connection pool. Boto3 clients are safe to share across
+        threads; creation is serialized because sessions are not.
+
         Args:
             service_name: AWS service name (e.g., 'ec2', 's3')
             region_name: Override region for this client
+            config: Extra botocore config merged over the default one
 
         Returns:
             Boto3 client instance
         """
-        try:
-            return self.session.client(
-                service_name,
-                region_name=region_name or self.region_name,
-                config=self._boto_config,
-            )
-        except Exception as e:
-            raise AWSError(f"Failed to create {service_name} client: {e}")
+        region_name = region_name or self.region_name
+        cache_key = (service_name, region_name, config)
+        client = self._clients.get(cache_key)
+        if client is not None:
+            return client
+
+        boto_config = self._boto_config.merge(config) if config else self._boto_config
+        with self._clients_lock:
+            client = self._clients.get(cache_key)
+            if client is None:
+                try:
+                    client = self.session.client(
+                        service_name, region_name=region_name, config=boto_config
+                    )
+                except Exception as e:
+                    raise AWSError(f"Failed to create {service_name} client: {e}")
+                self._clients[cache_key] = client
+        return client
 
     def get_resource(self, service_name: str, region_name: Optional[str] = None) -> Any:
         """Get AWS service resource.
@@ -131,32 +180,49 @@ class AWSAuth:
     def get_caller_identity(self) -> Dict[str, Any]:
         """Get caller identity information.
 
+        The identity fetched while validating the session is reused, so this
+        does not cost another STS round trip.
+
         Returns:
             Dictionary with UserId, Account, and Arn
         """
-        try:
-            sts_client = self.get_client("sts")
-            return sts_client.get_caller_identity()
-        except ClientError as e:
-            raise AWSError(f"Failed to get caller identity: {e}")
+        # Creating the session validates credentials and records the identity
+        self.ensure_session()
+        if self._caller_identity is None:
+            self._test_credentials()
+        return dict(self._caller_identity or {})
 
     def get_available_regions(self, service_name: str = "ec2") -> list[str]:
         """Get available regions for a service.
 
+        Successful lookups are cached per service for the life of this object.
+        Services without their own DescribeRegions call are limited to the
+        regions EC2 reports as enabled for the account.
+
         Args:
             service_name: AWS service name
 
         Returns:
             List of region names
         """
+        if service_name in self._regions:
+            return list(self._regions[service_name])
+
         try:
             client = self.get_client(service_name)
             if hasattr(client, "describe_regions"):
                 response = client.describe_regions()
-                return [region["RegionName"] for region in response["Regions"]]
+                regions = [region["RegionName"] for region in response["Regions"]]
             else:
-                # Fallback to session regions
-                return list(self.session.get_available_regions(service_name))
+                # Regions the service is offered in, less any this account
+                # hasn't enabled, where calls would only fail or time out
+                regions = list(self.session.get_available_regions(service_name))
+                self.get_available_regions("ec2")
+                enabled = self._regions.get("ec2")
+                if enabled:
+                    regions = [region for region in regions if region in enabled]
+            self._regions[service_name] = regions
+            return list(regions)
         except Exception as e:
             logger.warning(f"Failed to get regions for {service_name}: {e}")
             # Return common regions as fallback
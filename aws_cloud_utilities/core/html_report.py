@@ -7,13 +7,33 @@ across different AWS commands to create formatted, responsive HTML reports.
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
+from html import escape
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class SafeHTML(str):
+    """String that is already HTML markup and must not be escaped again."""
+
+
+# Precomputed class attributes for the known section types
+_SECTION_CLASSES = {
+    t: f"section-content section-{t}"
+    for t in ("default", "summary", "table", "warning", "success", "error")
+}
+_SECTION_CLASSES_HIDDEN = {t: v + " hidden" for t, v in _SECTION_CLASSES.items()}
+
+
+def _to_html(value: Any) -> str:
+    """Render a cell value as HTML, escaping it unless it is SafeHTML."""
+    if isinstance(value, SafeHTML):
+        return value
+    return escape(str(value), quote=False)
+
+
+@dataclass(slots=True)
 class ReportSection:
     """Represents a section in the HTML report."""
 
@@ -24,7 +44,7 @@ class ReportSection:
     expanded: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportMetadata:
     """Metadata for the HTML report."""
 
@@ -358,6 +378,44 @@ class HTMLReportGenerator:
     </script>
     """
 
+    # Footer shown at the bottom of every report
+    FOOTER_TEMPLATE = """
+        <div class="footer">
+            Generated by AWS Cloud Utilities -
+            <a href="https://github.com/jon-the-dev/aws-cloud-tools" style="color: #667eea; text-decoration: none;">
+                View on GitHub
+            </a>
+        </div>
+        """
+
+    # Static document fragments, built once at class load since they hold no
+    # per-report data. The title is the only dynamic value in <head>.
+    _HEAD_START = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>"""
+    _HEAD_END = f"""</title>
+    {CSS_TEMPLATE}
+</head>
+<body>
+    <div class="container">
+        """
+    _CONTENT_START = """
+        <div class="content">
+            """
+    _CONTENT_END = """
+        </div>
+        """
+    _TAIL = f"""
+        {FOOTER_TEMPLATE}
+    </div>
+    {JS_TEMPLATE}
+</body>
+</html>
+"""
+
     def __init__(self, metadata: ReportMetadata):
         """Initialize the HTML report generator.
 
@@ -462,59 +520,80 @@ class HTMLReportGenerator:
             HTML string for the section
         """
         section_id = f"section-{index}"
-        section_class = f"section-content section-{section.section_type}"
-
-        if section.collapsible and not section.expanded:
-            section_class += " hidden"
+        hidden = section.collapsible and not section.expanded
+        section_class = (_SECTION_CLASSES_HIDDEN if hidden else _SECTION_CLASSES).get(
+            section.section_type
+        )
+        if section_class is None:
+            section_class = f"section-content section-{section.section_type}"
+            if hidden:
+                section_class += " hidden"
 
+        parts = ['\n        <div class="section">\n']
         if section.collapsible:
-            header = f"""
-            <div class="section-header" onclick="toggleSection('{section_id}')">
-                <div class="section-title">{section.title}</div>
-                <div class="toggle-icon {'collapsed' if not section.expanded else ''}" id="{section_id}-icon">▼</div>
-            </div>
-            """
+            parts += [
+                '            <div class="section-header" onclick="toggleSection(\'',
+                section_id,
+                "')\">\n",
+                '                <div class="section-title">',
+                section.title,
+                "</div>\n",
+                '                <div class="toggle-icon ',
+                "collapsed" if not section.expanded else "",
+                '" id="',
+                section_id,
+                '-icon">▼</div>\n',
+                "            </div>\n",
+            ]
         else:
-            header = f"""
-            <div class="section-header">
-                <div class="section-title">{section.title}</div>
-            </div>
-            """
-
-        html = f"""
-        <div class="section">
-            {header}
-            <div class="{section_class}" id="{section_id}">
-                {section.content}
-            </div>
-        </div>
-        """
-        return html
+            parts += [
+                '            <div class="section-header">\n',
+                '                <div class="section-title">',
+                section.title,
+                "</div>\n",
+                "            </div>\n",
+            ]
+        parts += [
+            '            <div class="',
+            section_class,
+            '" id="',
+            section_id,
+            '">\n',
+            "                ",
+            section.content,
+            "\n            </div>\n",
+            "        </div>\n        ",
+        ]
+        return "".join(parts)
 
     def _generate_content(self) -> str:
         """Generate the main content HTML."""
-        sections_html = []
-        for i, section in enumerate(self.sections):
-            sections_html.append(self._generate_section(section, i))
+        return "".join(self._iter_content())
 
-        html = f"""
-        <div class="content">
-            {''.join(sections_html)}
-        </div>
-        """
-        return html
+    def _iter_content(self) -> Iterator[str]:
+        """Yield the main content HTML one section at a time."""
+        yield self._CONTENT_START
+        for i, section in enumerate(self.sections):
+            yield self._generate_section(section, i)
+        yield self._CONTENT_END
 
     def _generate_footer(self) -> str:
         """Generate the report footer HTML."""
-        html = """
-        <div class="footer">
-            Generated by AWS Cloud Utilities -
-            <a href="https://github.com/jon-the-dev/aws-cloud-tools" style="color: #667eea; text-decoration: none;">
-                View on GitHub
-            </a>
-        </div>
+        return self.FOOTER_TEMPLATE
+
+    def iter_chunks(self) -> Iterator[str]:
+        """Yield the HTML document in chunks, one section at a time.
+
+        Yields:
+            Consecutive pieces of the complete HTML document
         """
-        return html
+        yield self._HEAD_START
+        yield self.metadata.title
+        yield self._HEAD_END
+        yield self._generate_header()
+        yield self._generate_metadata()
+        yield from self._iter_content()
+        yield self._TAIL
 
     def generate(self) -> str:
         """Generate the complete HTML report.
@@ -522,26 +601,7 @@ class HTMLReportGenerator:
         Returns:
             Complete HTML document as a string
         """
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{self.metadata.title}</title>
-    {self.CSS_TEMPLATE}
-</head>
-<body>
-    <div class="container">
-        {self._generate_header()}
-        {self._generate_metadata()}
-        {self._generate_content()}
-        {self._generate_footer()}
-    </div>
-    {self.JS_TEMPLATE}
-</body>
-</html>
-"""
-        return html
+        return "".join(self.iter_chunks())
 
     def save(self, filepath: Union[str, Path]) -> None:
         """Save the report to an HTML file.
@@ -554,9 +614,11 @@ class HTMLReportGenerator:
         # Ensure parent directory exists
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        # Generate and save HTML
-        html_content = self.generate()
-        filepath.write_text(html_content, encoding="utf-8")
+        # Stream chunks so peak memory is bounded by the largest section;
+        # newline="" keeps "\n" as is, so the file matches generate() on
+        # every platform
+        with filepath.open("w", encoding="utf-8", newline="", buffering=1 << 20) as f:
+            f.writelines(self.iter_chunks())
 
         logger.info(f"HTML report saved to {filepath}")
 
@@ -566,9 +628,11 @@ class HTMLReportGenerator:
 
 def create_table_html(
     headers: List[str], rows: List[List[Any]], table_id: Optional[str] = None
-) -> str:
+) -> SafeHTML:
     """Create an HTML table from headers and rows.
 
+    Cell values are HTML-escaped unless they are SafeHTML (e.g. a badge).
+
     Args:
         headers: List of column headers
         rows: List of rows, where each row is a list of cell values
@@ -577,29 +641,23 @@ def create_table_html(
     Returns:
         HTML string for the table
     """
-    table_attrs = f'id="{table_id}"' if table_id else ""
-
-    header_html = "".join([f"<th>{header}</th>" for header in headers])
-    rows_html = []
+    parts = ["\n    <table ", f'id="{table_id}"' if table_id else "", ">\n"]
+    parts.append("        <thead>\n            <tr>")
+    for header in headers:
+        parts += ("<th>", _to_html(header), "</th>")
+    parts.append("</tr>\n        </thead>\n        <tbody>\n            ")
 
     for row in rows:
-        cells_html = "".join([f"<td>{cell}</td>" for cell in row])
-        rows_html.append(f"<tr>{cells_html}</tr>")
-
-    html = f"""
-    <table {table_attrs}>
-        <thead>
-            <tr>{header_html}</tr>
-        </thead>
-        <tbody>
-            {''.join(rows_html)}
-        </tbody>
-    </table>
-    """
-    return html
+        parts.append("<tr>")
+        for cell in row:
+            parts += ("<td>", _to_html(cell), "</td>")
+        parts.append("</tr>")
 
+    parts.append("\n        </tbody>\n    </table>\n    ")
+    return SafeHTML("".join(parts))
 
-def create_stats_grid_html(stats: Dict[str, Union[str, int, float]]) -> str:
+
+def create_stats_grid_html(stats: Dict[str, Union[str, int, float]]) -> SafeHTML:
     """Create a statistics grid display.
 
     Args:
@@ -608,24 +666,23 @@ def create_stats_grid_html(stats: Dict[str, Union[str, int, float]]) -> str:
     Returns:
         HTML string for the stats grid
     """
-    stat_cards = []
+    parts = ['\n    <div class="stats-grid">\n']
     for label, value in stats.items():
-        stat_cards.append(f"""
-            <div class="stat-card">
-                <div class="stat-label">{label}</div>
-                <div class="stat-value">{value}</div>
-            </div>
-            """)
-
-    html = f"""
-    <div class="stats-grid">
-        {''.join(stat_cards)}
-    </div>
-    """
-    return html
+        parts += (
+            '            <div class="stat-card">\n',
+            '                <div class="stat-label">',
+            _to_html(label),
+            "</div>\n",
+            '                <div class="stat-value">',
+            _to_html(value),
+            "</div>\n",
+            "            </div>\n",
+        )
+    parts.append("    </div>\n    ")
+    return SafeHTML("".join(parts))
 
 
-def create_badge(text: str, badge_type: str = "primary") -> str:
+def create_badge(text: str, badge_type: str = "primary") -> SafeHTML:
     """Create a badge HTML element.
 
     Args:
@@ -635,10 +692,10 @@ def create_badge(text: str, badge_type: str = "primary") -> str:
     Returns:
         HTML string for the badge
     """
-    return f'<span class="badge badge-{badge_type}">{text}</span>'
+    return SafeHTML(f'<span class="badge badge-{badge_type}">{_to_html(text)}</span>')
 
 
-def create_list_html(items: List[str], ordered: bool = False) -> str:
+def create_list_html(items: List[str], ordered: bool = False) -> SafeHTML:
     """Create an HTML list from items.
 
     Args:
@@ -649,5 +706,8 @@ def create_list_html(items: List[str], ordered: bool = False) -> str:
         HTML string for the list
     """
     list_tag = "ol" if ordered else "ul"
-    items_html = "".join([f"<li>{item}</li>" for item in items])
-    return f"<{list_tag}>{items_html}</{list_tag}>"
+    parts = [f"<{list_tag}>"]
+    for item in items:
+        parts += ("<li>", _to_html(item), "</li>")
+    parts.append(f"</{list_tag}>")
+    return SafeHTML("".join(parts))
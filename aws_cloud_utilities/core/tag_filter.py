@@ -1,7 +1,10 @@
 """Tag filtering utilities for AWS resources."""
 
 import logging
-from typing import Any, Dict, List, Optional, Set
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 
 import click
 from botocore.exceptions import ClientError
@@ -10,10 +13,45 @@ from .auth import AWSAuth
 
 logger = logging.getLogger(__name__)
 
+# Most resource types GetResources accepts in a single ResourceTypeFilters
+MAX_RESOURCE_TYPE_FILTERS = 100
+
+# Largest ResourcesPerPage GetResources accepts
+GET_RESOURCES_PAGE_SIZE = 100
+
+# How long, and for how many queries, Tagging API results are reused
+ARN_CACHE_TTL = 60
+ARN_CACHE_MAXSIZE = 128
+
+# Separates the resource type from the resource id in an ARN's last segment
+_RESOURCE_TYPE_SEP = re.compile(r"[/:]")
+
+
+def _arn_resource_type(arn: str) -> str:
+    """Get the Tagging API resource type ("service:type") from an ARN.
+
+    Args:
+        arn: Resource ARN
+
+    Returns:
+        Resource type such as "ec2:instance", or just the service when the
+        ARN has no resource-type segment (e.g., S3 buckets, SNS topics)
+    """
+    parts = arn.split(":", 5)
+    service = parts[2] if len(parts) > 2 else ""
+    resource = parts[5] if len(parts) > 5 else ""
+    resource_type = _RESOURCE_TYPE_SEP.split(resource, 1)
+    return f"{service}:{resource_type[0]}" if len(resource_type) > 1 else service
+
 
 class TagFilter:
     """Utility class for filtering AWS resources by tags."""
 
+    # Tagging API results shared by every instance for ARN_CACHE_TTL seconds,
+    # keyed by (aws_auth, tag key, tag value, region, sorted resource types)
+    _arn_cache: Dict[Tuple, Tuple[float, Dict[str, Set[str]]]] = {}
+    _arn_cache_lock = threading.Lock()
+
     def __init__(
         self,
         tag_key: Optional[str] = None,
@@ -31,10 +69,23 @@ class TagFilter:
         self.tag_value = tag_value
         self.aws_auth = aws_auth
         self.enabled = bool(tag_key)
+        # Memoized prefilter results keyed by (region, resource types)
+        self._prefiltered: Dict[Tuple, Optional[FrozenSet[str]]] = {}
+        self._prefilter_locks: Dict[Tuple, threading.Lock] = {}
+        self._prefilter_lock = threading.Lock()
 
     def matches(self, resource: Dict[str, Any]) -> bool:
         """Check if a resource matches the tag filter.
 
+        AWS resources can have tags in different formats:
+        - Tags field as a list of dicts: [{"Key": "Environment", "Value": "Production"}]
+        - Tags field as a dict: {"Environment": "Production"}
+        - TagList field (WorkSpaces, RDS, etc.)
+        - Flattened "tag:<key>" entries (EC2 instances often have this)
+
+        The filter key is looked up directly in whichever format is present,
+        without building an intermediate tag dictionary.
+
         Args:
             resource: AWS resource dictionary
 
@@ -44,37 +95,8 @@ class TagFilter:
         if not self.enabled:
             return True
 
-        # Try different common tag formats in AWS resources
-        tags = self._extract_tags(resource)
-
-        if not tags:
-            return False
-
-        # Check if the tag key exists and matches the value (if specified)
-        for key, value in tags.items():
-            if key == self.tag_key:
-                if self.tag_value is None:
-                    return True  # Key exists, value not specified
-                return value == self.tag_value
-
-        return False
-
-    def _extract_tags(self, resource: Dict[str, Any]) -> Dict[str, str]:
-        """Extract tags from a resource in various formats.
-
-        AWS resources can have tags in different formats:
-        - List of dicts: [{"Key": "Environment", "Value": "Production"}]
-        - Dict: {"Environment": "Production"}
-        - Tags field: resource["Tags"]
-        - TagList field: resource["TagList"]
-
-        Args:
-            resource: AWS resource dictionary
-
-        Returns:
-            Dictionary of tag key-value pairs
-        """
-        tags = {}
+        tag_key = self.tag_key
+        tag_value = self.tag_value
 
         # Check for Tags field (most common)
         if "Tags" in resource:
@@ -83,39 +105,63 @@ class TagFilter:
             # Handle list of dicts format
             if isinstance(tags_data, list):
                 for tag in tags_data:
-                    if isinstance(tag, dict):
-                        if "Key" in tag and "Value" in tag:
-                            tags[tag["Key"]] = tag["Value"]
-                        elif "key" in tag and "value" in tag:
-                            tags[tag["key"]] = tag["value"]
+                    if not isinstance(tag, dict):
+                        continue
+                    if "Key" in tag and "Value" in tag:
+                        key, value = tag["Key"], tag["Value"]
+                    elif "key" in tag and "value" in tag:
+                        key, value = tag["key"], tag["value"]
+                    else:
+                        continue
+                    if key == tag_key:
+                        return tag_value is None or value == tag_value
+                return False
 
             # Handle dict format
-            elif isinstance(tags_data, dict):
-                tags = tags_data
+            if isinstance(tags_data, dict) and tag_key in tags_data:
+                return tag_value is None or tags_data[tag_key] == tag_value
+            return False
 
         # Check for TagList field (WorkSpaces, RDS, etc.)
-        elif "TagList" in resource:
+        if "TagList" in resource:
             tag_list = resource["TagList"]
             if isinstance(tag_list, list):
                 for tag in tag_list:
-                    if isinstance(tag, dict) and "Key" in tag and "Value" in tag:
-                        tags[tag["Key"]] = tag["Value"]
+                    if (
+                        isinstance(tag, dict)
+                        and tag.get("Key") == tag_key
+                        and "Value" in tag
+                    ):
+                        return tag_value is None or tag["Value"] == tag_value
+            return False
 
-        # Check for direct tag keys in resource (EC2 instances often have this)
-        elif "tag_name" in resource or "Name" in resource:
-            # Some resources have flattened tag structure
-            for key, value in resource.items():
-                if key.startswith("tag:") or key.startswith("Tag:"):
-                    clean_key = key.split(":", 1)[1]
-                    tags[clean_key] = value
+        # Check for direct tag keys in resource (flattened tag structure)
+        if "tag_name" in resource or "Name" in resource:
+            for prefix in ("tag:", "Tag:"):
+                flat_key = prefix + tag_key
+                if flat_key in resource:
+                    return tag_value is None or resource[flat_key] == tag_value
 
-        return tags
+        return False
 
-    def filter_resources(self, resources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def filter_resources(
+        self,
+        resources: List[Dict[str, Any]],
+        arn_key: Optional[Callable[[Dict[str, Any]], Optional[str]]] = None,
+        region: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
         """Filter a list of resources by tags.
 
+        When ``arn_key`` is given and an AWS auth instance is available, the
+        matching ARNs are fetched server-side once per region and each
+        resource is kept by set membership. Resources without an ARN, or
+        regions where the Tagging API is unavailable, fall back to
+        :meth:`matches`.
+
         Args:
             resources: List of AWS resource dictionaries
+            arn_key: Callable returning a resource's ARN (or None)
+            region: AWS region the resources were listed from
 
         Returns:
             Filtered list of resources
@@ -123,62 +169,174 @@ class TagFilter:
         if not self.enabled:
             return resources
 
-        return [resource for resource in resources if self.matches(resource)]
+        arns = (
+            self.prefilter_arns(region=region)
+            if arn_key is not None and self.aws_auth
+            else None
+        )
+        if arns is None:
+            return [resource for resource in resources if self.matches(resource)]
+
+        filtered = []
+        for resource in resources:
+            arn = arn_key(resource)
+            if arn:
+                if arn in arns:
+                    filtered.append(resource)
+            elif self.matches(resource):
+                filtered.append(resource)
+        return filtered
+
+    def prefilter_arns(
+        self,
+        resource_type_filters: Optional[List[str]] = None,
+        region: Optional[str] = None,
+    ) -> Optional[FrozenSet[str]]:
+        """Get the ARNs matching the tag filter, memoized per region and types.
+
+        Concurrent callers for the same region share a single query.
+
+        Args:
+            resource_type_filters: List of resource types to filter (e.g., ["ec2:instance", "rds:db"])
+            region: AWS region to query
+
+        Returns:
+            Frozen set of matching ARNs, or None if the Tagging API could not
+            be queried and callers should filter client-side
+        """
+        if not self.enabled or not self.aws_auth:
+            return None
+
+        cache_key = (region, tuple(resource_type_filters or ()))
+        with self._prefilter_lock:
+            key_lock = self._prefilter_locks.setdefault(cache_key, threading.Lock())
+
+        with key_lock:
+            if cache_key not in self._prefiltered:
+                try:
+                    arns = frozenset().union(
+                        *self._query_resource_arns(
+                            resource_type_filters, region
+                        ).values()
+                    )
+                except ClientError as e:
+                    logger.warning(
+                        f"Tagging API unavailable in {region or 'default region'}, "
+                        f"filtering client-side: {e}"
+                    )
+                    arns = None
+                self._prefiltered[cache_key] = arns
+            return self._prefiltered[cache_key]
 
     def get_resource_arns_by_tag(
         self,
         resource_type_filters: Optional[List[str]] = None,
         region: Optional[str] = None,
-    ) -> Set[str]:
+    ) -> Dict[str, Set[str]]:
         """Get resource ARNs using AWS Resource Groups Tagging API.
 
         This is more efficient for large-scale filtering as it queries server-side.
+        All resource types are requested together, in batches of
+        ``MAX_RESOURCE_TYPE_FILTERS``, rather than one call per type.
 
         Args:
             resource_type_filters: List of resource types to filter (e.g., ["ec2:instance", "rds:db"])
             region: AWS region to query
 
         Returns:
-            Set of resource ARNs that match the tag filter
-
-        Raises:
-            AWSError: If unable to query Resource Groups Tagging API
+            Matching ARNs grouped by resource type (e.g., "ec2:instance")
         """
         if not self.enabled or not self.aws_auth:
-            return set()
+            return {}
 
         try:
-            client = self.aws_auth.get_client(
-                "resourcegroupstaggingapi", region_name=region
-            )
-
-            # Build tag filters
-            tag_filters = [{"Key": self.tag_key}]
-            if self.tag_value:
-                tag_filters[0]["Values"] = [self.tag_value]
-
-            # Query parameters
-            params = {"TagFilters": tag_filters}
-            if resource_type_filters:
-                params["ResourceTypeFilters"] = resource_type_filters
+            resource_arns = self._query_resource_arns(resource_type_filters, region)
+            # Copy so callers can't mutate the shared cached sets
+            return {rtype: set(arns) for rtype, arns in resource_arns.items()}
+        except ClientError as e:
+            logger.warning(f"Error querying Resource Groups Tagging API: {e}")
+            # Return empty result to fall back to client-side filtering
+            return {}
 
-            # Paginate through results
-            resource_arns = set()
-            paginator = client.get_paginator("get_resources")
+    def _query_resource_arns(
+        self,
+        resource_type_filters: Optional[List[str]],
+        region: Optional[str],
+    ) -> Dict[str, Set[str]]:
+        """Query the Resource Groups Tagging API through the shared TTL cache.
 
-            for page in paginator.paginate(**params):
-                for resource in page.get("ResourceTagMappingList", []):
-                    resource_arns.add(resource["ResourceARN"])
+        Only successful results are cached; ClientError propagates.
+        """
+        cache_key = (
+            self.aws_auth,
+            self.tag_key,
+            self.tag_value,
+            region,
+            tuple(sorted(resource_type_filters or ())),
+        )
+        cache = TagFilter._arn_cache
+        now = time.monotonic()
+        with TagFilter._arn_cache_lock:
+            cached = cache.get(cache_key)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+
+        resource_arns = self._fetch_resource_arns(resource_type_filters, region)
+
+        with TagFilter._arn_cache_lock:
+            if len(cache) >= ARN_CACHE_MAXSIZE:
+                # Drop expired entries, then the oldest if still full
+                for key in [k for k, (expires, _) in cache.items() if expires <= now]:
+                    del cache[key]
+                if len(cache) >= ARN_CACHE_MAXSIZE:
+                    del cache[next(iter(cache))]
+            cache[cache_key] = (now + ARN_CACHE_TTL, resource_arns)
+        return resource_arns
+
+    def _fetch_resource_arns(
+        self,
+        resource_type_filters: Optional[List[str]],
+        region: Optional[str],
+    ) -> Dict[str, Set[str]]:
+        """Query the Resource Groups Tagging API, letting ClientError propagate."""
+        client = self.aws_auth.get_client(
+            "resourcegroupstaggingapi", region_name=region
+        )
+        paginator = client.get_paginator("get_resources")
+
+        # Build tag filters
+        tag_filters = [{"Key": self.tag_key}]
+        if self.tag_value:
+            tag_filters[0]["Values"] = [self.tag_value]
 
-            logger.info(
-                f"Found {len(resource_arns)} resources with tag {self.tag_key}={self.tag_value or '*'}"
+        # One paginated query per batch of types (a single query if unfiltered)
+        type_batches = [
+            resource_type_filters[i : i + MAX_RESOURCE_TYPE_FILTERS]
+            for i in range(
+                0, len(resource_type_filters or ()), MAX_RESOURCE_TYPE_FILTERS
             )
-            return resource_arns
+        ] or [None]
 
-        except ClientError as e:
-            logger.warning(f"Error querying Resource Groups Tagging API: {e}")
-            # Return empty set to fall back to client-side filtering
-            return set()
+        resource_arns: Dict[str, Set[str]] = {}
+        count = 0
+        for type_batch in type_batches:
+            params = {"TagFilters": tag_filters}
+            if type_batch:
+                params["ResourceTypeFilters"] = type_batch
+
+            for page in paginator.paginate(
+                **params,
+                PaginationConfig={"PageSize": GET_RESOURCES_PAGE_SIZE},
+            ):
+                for resource in page.get("ResourceTagMappingList", []):
+                    arn = resource["ResourceARN"]
+                    resource_arns.setdefault(_arn_resource_type(arn), set()).add(arn)
+                    count += 1
+
+        logger.info(
+            f"Found {count} resources with tag {self.tag_key}={self.tag_value or '*'}"
+        )
+        return resource_arns
 
     def create_filter_display(self) -> str:
         """Create a display string for the current filter.
@@ -1,7 +1,11 @@
 """Common utilities for AWS Cloud Utilities."""
 
+import csv
+import functools
+import io
 import json
 import logging
+import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
@@ -9,6 +13,7 @@ from typing import Any, Dict, List, Optional, Union
 
 import boto3
 import yaml
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -20,6 +25,21 @@ from .exceptions import AWSError
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Shared config for the standalone clients created in this module
+BOTO_CONFIG = BotoConfig(retries={"max_attempts": 10, "mode": "adaptive"})
+
+
+@functools.lru_cache(maxsize=None)
+def _get_session() -> boto3.Session:
+    """Get the boto3 session shared by the standalone helpers in this module.
+
+    Credentials are resolved once, instead of on every helper call.
+
+    Returns:
+        Shared boto3 session
+    """
+    return boto3.Session()
+
 
 def get_aws_account_id() -> str:
     """Get the current AWS account ID.
@@ -31,16 +51,36 @@ def get_aws_account_id() -> str:
         AWSError: If unable to get account ID
     """
     try:
-        sts_client = boto3.client("sts")
+        sts_client = _get_session().client("sts", config=BOTO_CONFIG)
         response = sts_client.get_caller_identity()
         return response["Account"]
     except ClientError as e:
         raise AWSError(f"Failed to get AWS account ID: {e}")
 
 
+@functools.lru_cache(maxsize=None)
+def _describe_regions(service_name: str) -> tuple[str, ...]:
+    """Look up regions for a service once per process.
+
+    Args:
+        service_name: AWS service name
+
+    Returns:
+        Tuple of region names
+    """
+    session = _get_session()
+    client = session.client(service_name, config=BOTO_CONFIG)
+    if hasattr(client, "describe_regions"):
+        response = client.describe_regions()
+        return tuple(region["RegionName"] for region in response["Regions"])
+    return tuple(session.get_available_regions(service_name))
+
+
 def get_all_regions(service_name: str = "ec2") -> List[str]:
     """Get all available AWS regions for a service.
 
+    Results are cached per service for the lifetime of the process.
+
     Args:
         service_name: AWS service name
 
@@ -48,13 +88,7 @@ def get_all_regions(service_name: str = "ec2") -> List[str]:
         List of region names
     """
     try:
-        client = boto3.client(service_name)
-        if hasattr(client, "describe_regions"):
-            response = client.describe_regions()
-            return [region["RegionName"] for region in response["Regions"]]
-        else:
-            session = boto3.Session()
-            return list(session.get_available_regions(service_name))
+        return list(_describe_regions(service_name))
     except Exception as e:
         logger.warning(f"Failed to get regions for {service_name}: {e}")
         # Return common regions as fallback
@@ -96,13 +130,8 @@ def format_output(
         return yaml.dump(data, default_flow_style=False)
     elif output_format == "csv":
         if isinstance(data, list) and data and isinstance(data[0], dict):
-            import csv
-            import io
-
             output = io.StringIO()
-            writer = csv.DictWriter(output, fieldnames=data[0].keys())
-            writer.writeheader()
-            writer.writerows(data)
+            _write_csv_rows(output, data)
             return output.getvalue()
         else:
             return str(data)
@@ -140,6 +169,13 @@ def print_output(
     if title:
         console.print(f"\n[bold blue]{title}[/bold blue]")
 
+    if output_format == "json" and not console.is_terminal:
+        # Piped output needs no highlighting; stream it instead of building
+        # the whole string and having rich parse it back
+        json.dump(data, sys.stdout, indent=2, default=str, ensure_ascii=False)
+        sys.stdout.write("\n")
+        return
+
     formatted_output = format_output(data, output_format, headers)
 
     if output_format == "table":
@@ -244,6 +280,22 @@ def parallel_execute(
     return results
 
 
+def _write_csv_rows(f: Any, rows: List[Dict[str, Any]]) -> None:
+    """Write dictionaries as CSV, with a column for every key in any row.
+
+    Rows are written as plain lists in one writerows call rather than through
+    DictWriter, which checks each row for unexpected keys.
+
+    Args:
+        f: Text stream to write to
+        rows: Rows to write; missing keys are left blank
+    """
+    fields = list(dict.fromkeys(key for row in rows for key in row))
+    writer = csv.writer(f)
+    writer.writerow(fields)
+    writer.writerows([row.get(field, "") for field in fields] for row in rows)
+
+
 def save_to_file(
     data: Any, filepath: Union[str, Path], file_format: str = "json"
 ) -> None:
@@ -257,18 +309,15 @@ def save_to_file(
     filepath = Path(filepath)
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(filepath, "w", encoding="utf-8") as f:
+    newline = "" if file_format == "csv" else None
+    with open(filepath, "w", encoding="utf-8", newline=newline) as f:
         if file_format == "json":
             json.dump(data, f, indent=2, default=str)
         elif file_format == "yaml":
             yaml.dump(data, f, default_flow_style=False)
         elif file_format == "csv":
             if isinstance(data, list) and data and isinstance(data[0], dict):
-                import csv
-
-                writer = csv.DictWriter(f, fieldnames=data[0].keys())
-                writer.writeheader()
-                writer.writerows(data)
+                _write_csv_rows(f, data)
             else:
                 f.write(str(data))
         else:
@@ -0,0 +1,160 @@
+"""Tests for account command helpers."""
+
+import threading
+from unittest.mock import Mock
+
+from botocore.exceptions import ClientError
+from click.testing import CliRunner
+
+from aws_cloud_utilities.commands.account import (
+    _detect_controltower_landingzone,
+    _iter_stack_pages,
+    _region_stack_pages,
+    account_group,
+)
+from aws_cloud_utilities.core.auth import AWSAuth
+from aws_cloud_utilities.core.config import Config
+
+
+class TestDetectControlTowerLandingZone:
+    """Unit tests for _detect_controltower_landingzone."""
+
+    def test_detects_both(self):
+        """Control Tower and Landing Zone stacks are flagged."""
+        stacks = [
+            {"StackName": "StackSet-AWSControlTowerBP-BASELINE-CLOUDTRAIL"},
+            {"StackName": "my-app"},
+            {"StackName": "AWS-Landing-Zone-Baseline"},
+        ]
+
+        ct, lz, detected = _detect_controltower_landingzone(stacks)
+
+        assert ct is True
+        assert lz is True
+        assert [s["StackName"] for s in detected] == [
+            "StackSet-AWSControlTowerBP-BASELINE-CLOUDTRAIL",
+            "AWS-Landing-Zone-Baseline",
+        ]
+
+    def test_detects_nothing(self):
+        """Unrelated stacks produce no detections."""
+        ct, lz, detected = _detect_controltower_landingzone(
+            [{"StackName": "network"}, {}]
+        )
+
+        assert (ct, lz, detected) == (False, False, [])
+
+    def test_patterns_match_anywhere_in_the_name(self):
+        """Patterns are found mid-name and hyphens are matched literally."""
+        ct, lz, detected = _detect_controltower_landingzone(
+            [{"StackName": "my-ControlTower-hooks"}, {"StackName": "Landing_Zone"}]
+        )
+
+        assert (ct, lz) == (True, False)
+        assert detected == [{"StackName": "my-ControlTower-hooks"}]
+
+
+class TestIterStackPages:
+    """Unit tests for _iter_stack_pages."""
+
+    def _client(self, pages):
+        cf_client = Mock()
+        cf_client.get_paginator.return_value.paginate.return_value = iter(pages)
+        return cf_client
+
+    def test_yields_every_page(self):
+        """Without a stop event all pages are consumed and trimmed."""
+        pages = [
+            {"StackSummaries": [{"StackName": "a", "StackId": "arn"}]},
+            {"StackSummaries": []},
+        ]
+
+        assert list(_iter_stack_pages(self._client(pages))) == [
+            [{"StackName": "a", "StackStatus": None, "CreationTime": None}],
+            [],
+        ]
+
+    def test_stops_once_event_is_set(self):
+        """Pagination ends after the page during which the event was set."""
+        stop = threading.Event()
+        stop.set()
+        pages = [{"StackSummaries": [{"StackName": "a"}]}, {"StackSummaries": []}]
+
+        assert list(_iter_stack_pages(self._client(pages), stop)) == [
+            [{"StackName": "a", "StackStatus": None, "CreationTime": None}]
+        ]
+
+
+class TestDetectControlTowerCommand:
+    """CLI tests for account detect-control-tower."""
+
+    def test_reports_detected_stacks_with_region(self):
+        """Detected stacks are listed with the region they were found in."""
+        config = Mock(spec=Config)
+        config.workers = 2
+        config.aws_output_format = "json"
+
+        cf_client = Mock()
+        cf_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "StackSummaries": [
+                    {"StackName": "AWSControlTowerBP-BASELINE", "StackStatus": "X"},
+                    {"StackName": "app"},
+                ]
+            }
+        ]
+        aws_auth = Mock(spec=AWSAuth)
+        aws_auth.get_caller_identity.return_value = {"Account": "123456789012"}
+        aws_auth.get_available_regions.return_value = ["us-east-1"]
+        aws_auth.get_client.return_value = cf_client
+
+        result = CliRunner().invoke(
+            account_group,
+            ["detect-control-tower"],
+            obj={"config": config, "aws_auth": aws_auth},
+        )
+
+        assert result.exit_code == 0, result.output
+        assert '"Total Stacks Analyzed": 2' in result.output
+        assert '"Region": "us-east-1"' in result.output
+
+
+class TestRegionStackPages:
+    """Unit tests for _region_stack_pages."""
+
+    def test_tagging_api_yields_names_from_arns(self):
+        """Stack names are parsed out of tagging API ARNs."""
+        tagging_client = Mock()
+        tagging_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "ResourceTagMappingList": [
+                    {
+                        "ResourceARN": "arn:aws:cloudformation:us-east-1:123456789012:"
+                        "stack/AWSControlTowerBP-BASELINE/abc-123"
+                    }
+                ]
+            }
+        ]
+        aws_auth = Mock(spec=AWSAuth)
+        aws_auth.get_client.return_value = tagging_client
+
+        pages = list(_region_stack_pages(aws_auth, "us-east-1", use_tagging_api=True))
+
+        assert pages == [[{"StackName": "AWSControlTowerBP-BASELINE"}]]
+
+    def test_falls_back_to_list_stacks_when_denied(self):
+        """An access-denied tagging API call falls back to ListStacks."""
+        tagging_client = Mock()
+        tagging_client.get_paginator.return_value.paginate.side_effect = ClientError(
+            {"Error": {"Code": "AccessDeniedException"}}, "GetResources"
+        )
+        cf_client = Mock()
+        cf_client.get_paginator.return_value.paginate.return_value = [
+            {"StackSummaries": [{"StackName": "app"}]}
+        ]
+        aws_auth = Mock(spec=AWSAuth)
+        aws_auth.get_client.side_effect = [tagging_client, cf_client]
+
+        pages = list(_region_stack_pages(aws_auth, "us-east-1", use_tagging_api=True))
+
+        assert [[s["StackName"] for s in page] for page in pages] == [["app"]]
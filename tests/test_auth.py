@@ -0,0 +1,80 @@
+"""Tests for AWS authentication helpers."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import EndpointConnectionError
+
+from aws_cloud_utilities.core.auth import AWSAuth
+from aws_cloud_utilities.core.exceptions import AWSError
+
+
+def _session_with_sts(sts_client):
+    session = MagicMock()
+    session.client.return_value = sts_client
+    return session
+
+
+def test_caller_identity_reuses_validation_call():
+    """get_caller_identity does not call STS again after session validation."""
+    sts_client = MagicMock()
+    sts_client.get_caller_identity.return_value = {
+        "Account": "123456789012",
+        "Arn": "arn:aws:iam::123456789012:user/test",
+        "UserId": "AIDATEST",
+    }
+
+    with patch("boto3.Session", return_value=_session_with_sts(sts_client)):
+        auth = AWSAuth()
+        first = auth.get_caller_identity()
+        second = auth.get_caller_identity()
+
+    assert first["Account"] == "123456789012"
+    assert first == second
+    assert sts_client.get_caller_identity.call_count == 1
+
+
+def test_connection_errors_surface_as_aws_error():
+    """Botocore transport errors are reported as AWSError."""
+    sts_client = MagicMock()
+    sts_client.get_caller_identity.side_effect = EndpointConnectionError(
+        endpoint_url="https://sts.amazonaws.com"
+    )
+
+    with patch("boto3.Session", return_value=_session_with_sts(sts_client)):
+        with pytest.raises(AWSError):
+            AWSAuth().get_caller_identity()
+
+
+def test_get_client_is_cached_per_service_and_region():
+    """Repeated get_client calls reuse the same client."""
+    session = _session_with_sts(MagicMock())
+    session.client.side_effect = lambda service, **kwargs: MagicMock(name=service)
+
+    with patch("boto3.Session", return_value=session):
+        auth = AWSAuth(region_name="us-east-1")
+        first = auth.get_client("cloudformation")
+        again = auth.get_client("cloudformation", region_name="us-east-1")
+        other = auth.get_client("cloudformation", region_name="eu-west-1")
+
+    assert first is again
+    assert first is not other
+
+
+def test_service_regions_are_limited_to_enabled_regions():
+    """Regions from endpoint data are intersected with EC2's enabled regions."""
+    ec2_client = MagicMock()
+    ec2_client.describe_regions.return_value = {
+        "Regions": [{"RegionName": "us-east-1"}, {"RegionName": "eu-west-1"}]
+    }
+    clients = {"ec2": ec2_client, "sts": MagicMock()}
+    session = _session_with_sts(MagicMock())
+    session.client.side_effect = lambda service, **kwargs: clients.get(
+        service, MagicMock(spec=[])
+    )
+    session.get_available_regions.return_value = ["me-south-1", "us-east-1"]
+
+    with patch("boto3.Session", return_value=session):
+        regions = AWSAuth(region_name="us-east-1").get_available_regions("bedrock")
+
+    assert regions == ["us-east-1"]
@@ -0,0 +1,223 @@
+"""Tests for AWS Config download processing."""
+
+import csv
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from aws_cloud_utilities.commands import awsconfig
+from aws_cloud_utilities.commands.awsconfig import (
+    _download_config_files,
+    _fixed_date_offset,
+    _flatten_json,
+    _list_config_keys,
+    _map_bounded,
+)
+
+
+def _s3_client(objects):
+    """Build a mock S3 client serving the given key -> JSON payload mapping."""
+
+    def paginate(Bucket, Prefix, Delimiter=None):
+        contents, common_prefixes = [], []
+        for key in sorted(objects):
+            if not key.startswith(Prefix):
+                continue
+            rest = key[len(Prefix) :]
+            if Delimiter and Delimiter in rest:
+                common = Prefix + rest.split(Delimiter, 1)[0] + Delimiter
+                if {"Prefix": common} not in common_prefixes:
+                    common_prefixes.append({"Prefix": common})
+            else:
+                contents.append({"Key": key})
+        return [{"Contents": contents, "CommonPrefixes": common_prefixes}]
+
+    client = Mock()
+    client.get_paginator.return_value.paginate.side_effect = paginate
+    client.get_object.side_effect = lambda Bucket, Key: {
+        "Body": io.BytesIO(objects[Key].encode())
+    }
+    return client
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run a test with and without the optional orjson speedup."""
+    if request.param == "json":
+        monkeypatch.setattr(awsconfig, "orjson", None)
+    elif awsconfig.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+@pytest.mark.usefixtures("json_backend")
+class TestDownloadConfigFiles:
+    """Unit tests for _download_config_files."""
+
+    def test_fetches_in_range_files_in_listing_order(self, tmp_path):
+        """In-range files are parsed from S3 and written in key order."""
+        objects = {
+            "cfg/2024-01-01/a.json": json.dumps({"id": "a", "tags": {"env": "x"}}),
+            "cfg/2024-01-02/b.json": json.dumps([{"id": "b"}, {"id": "c"}]),
+            "cfg/2024-01-03/bad.json": "not json",
+            "cfg/2023-12-31/old.json": json.dumps({"id": "old"}),
+        }
+        output_file = tmp_path / "out.json"
+
+        summary = _download_config_files(
+            _s3_client(objects),
+            "bucket",
+            "cfg/",
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 3),
+            str(output_file),
+            "json",
+            False,
+        )
+
+        records = json.loads(output_file.read_text())
+        assert [r["id"] for r in records] == ["a", "b", "c"]
+        assert records[0]["tags.env"] == "x"
+        assert records[0]["_source_file"] == "cfg/2024-01-01/a.json"
+        assert summary["total_records"] == 3
+        assert summary["processed_files"] == 2
+        assert summary["skipped_files"] == 1
+
+    def test_csv_output_has_union_header(self, tmp_path):
+        """CSV rows are written with the sorted union of all record keys."""
+        objects = {
+            "cfg/2024-01-01/a.json": json.dumps({"id": "a", "x": 1}),
+            "cfg/2024-01-02/b.json": json.dumps({"id": "b", "y": True}),
+        }
+        output_file = tmp_path / "out.csv"
+
+        _download_config_files(
+            _s3_client(objects),
+            "bucket",
+            "cfg/",
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 2),
+            str(output_file),
+            "csv",
+            False,
+        )
+
+        with open(output_file, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert list(rows[0]) == ["_processed_date", "_source_file", "id", "x", "y"]
+        assert [(r["id"], r["x"], r["y"]) for r in rows] == [
+            ("a", "1", ""),
+            ("b", "", "True"),
+        ]
+
+
+class TestMapBounded:
+    """Unit tests for the bounded, ordered executor map."""
+
+    def test_submits_at_most_limit_ahead(self):
+        """Tasks are submitted only as earlier results are consumed."""
+        submitted = []
+
+        def fn(item):
+            submitted.append(item)
+            return item * 10
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = _map_bounded(executor, fn, range(10), 3)
+            first = next(results)
+            ahead = len(submitted)
+            rest = list(results)
+
+        assert first == 0
+        assert ahead <= 3
+        assert [first] + rest == [i * 10 for i in range(10)]
+
+
+class TestListConfigKeys:
+    """Unit tests for _list_config_keys."""
+
+    def test_lists_shards_and_prunes_out_of_range_dates(self):
+        """Dated sub-prefixes outside the range are never listed."""
+        objects = {
+            key: "{}"
+            for key in (
+                "cfg/2023-12-31/old.json",
+                "cfg/2024-01-01/a.json",
+                "cfg/2024-01-01/nested/b.json",
+                "cfg/misc/2024-01-02.json",
+                "cfg/top-2024-01-01.json",
+            )
+        }
+        client = _s3_client(objects)
+
+        keys = _list_config_keys(client, "bucket", "cfg/", "2024-01-01", "2024-01-02")
+
+        assert keys == [
+            "cfg/2024-01-01/a.json",
+            "cfg/2024-01-01/nested/b.json",
+            "cfg/misc/2024-01-02.json",
+            "cfg/top-2024-01-01.json",
+        ]
+        listed = [
+            c.kwargs["Prefix"]
+            for c in client.get_paginator.return_value.paginate.call_args_list
+        ]
+        assert "cfg/2023-12-31/" not in listed
+
+
+class TestFixedDateOffset:
+    """Unit tests for _fixed_date_offset."""
+
+    @pytest.mark.parametrize(
+        "prefix,expected",
+        [
+            ("cfg/", 4),
+            ("", None),
+            ("cfg/2024-01-01/", None),
+            ("cfg/2024", None),
+            ("cfg-", None),
+        ],
+    )
+    def test_offset_only_when_no_date_can_precede(self, prefix, expected):
+        """The fast path is used only when the prefix cannot hold a date."""
+        assert _fixed_date_offset(prefix) == expected
+
+
+class TestFlattenJson:
+    """Unit tests for _flatten_json."""
+
+    def test_flattens_nested_dicts_and_lists_in_order(self):
+        """Nested keys are dotted, list entries indexed, order preserved."""
+        data = {
+            "a": 1,
+            "b": {"c": {"d": 2}, "e": 3},
+            "f": [{"g": 4}, 5, [6]],
+            "h": {},
+            "i": 7,
+        }
+
+        flattened = _flatten_json(data)
+
+        assert list(flattened.items()) == [
+            ("a", 1),
+            ("b.c.d", 2),
+            ("b.e", 3),
+            ("f[0].g", 4),
+            ("f[1]", 5),
+            ("f[2]", [6]),
+            ("i", 7),
+        ]
+
+    def test_handles_deep_nesting(self):
+        """Nesting beyond the recursion limit is flattened."""
+        data = leaf = {}
+        for _ in range(5000):
+            leaf["n"] = {}
+            leaf = leaf["n"]
+        leaf["v"] = 1
+
+        assert list(_flatten_json(data).values()) == [1]
@@ -0,0 +1,85 @@
+"""Tests for Bedrock command helpers."""
+
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+from aws_cloud_utilities.commands import bedrock
+
+
+def _bedrock_client(models):
+    """Build a mock Bedrock client listing the given model summaries."""
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {"modelSummaries": models}
+    ]
+    return client
+
+
+class TestListFoundationModels:
+    """Unit tests for the cached foundation model listing."""
+
+    def test_listing_is_cached(self, tmp_path):
+        """A fresh cached listing is reused without calling the API."""
+        cache_file = tmp_path / "foundation_models_us-east-1.json"
+        models = [{"modelId": "amazon.titan", "providerName": "Amazon"}]
+
+        first = bedrock._list_foundation_models(_bedrock_client(models), cache_file)
+        client = _bedrock_client([])
+        second = bedrock._list_foundation_models(client, cache_file)
+
+        assert first == second == models
+        client.get_paginator.assert_not_called()
+
+    def test_stale_or_refreshed_listing_is_refetched(self, tmp_path):
+        """Expired caches and --refresh-cache both query the API."""
+        cache_file = tmp_path / "foundation_models_us-east-1.json"
+        cache_file.write_text("[]")
+        models = [{"modelId": "amazon.titan"}]
+
+        assert (
+            bedrock._list_foundation_models(
+                _bedrock_client(models), cache_file, refresh=True
+            )
+            == models
+        )
+
+        stale = time.time() - bedrock.FOUNDATION_MODELS_CACHE_TTL - 1
+        os.utime(cache_file, (stale, stale))
+        assert bedrock._list_foundation_models(_bedrock_client([]), cache_file) == []
+
+
+class TestListModelsOptions:
+    """CLI option validation for list-models."""
+
+    def test_parallel_regions_must_be_positive(self):
+        """A zero worker count is rejected by click, not by the executor."""
+        result = CliRunner().invoke(
+            bedrock.bedrock_group,
+            ["list-models", "--parallel-regions", "0"],
+            obj={"config": MagicMock(), "aws_auth": MagicMock()},
+        )
+
+        assert result.exit_code == 2
+        assert "--parallel-regions" in result.output
+
+    def test_model_cache_is_per_account(self, tmp_path):
+        """Foundation model listings are cached per account and region."""
+        config = MagicMock()
+        config.get_data_dir.return_value = tmp_path
+        aws_auth = MagicMock()
+        aws_auth.get_account_id.return_value = "111122223333"
+
+        with patch.object(
+            bedrock, "_list_foundation_models", return_value=[]
+        ) as mock_list:
+            CliRunner().invoke(
+                bedrock.bedrock_group,
+                ["list-models", "--region", "us-east-1"],
+                obj={"config": config, "aws_auth": aws_auth},
+            )
+
+        cache_file = mock_list.call_args.args[1]
+        assert cache_file.name == "foundation_models_111122223333_us-east-1.json"
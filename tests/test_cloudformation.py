@@ -0,0 +1,73 @@
+"""Tests for CloudFormation backup."""
+
+import json
+from unittest.mock import MagicMock
+
+from aws_cloud_utilities.commands.cloudformation import _execute_cloudformation_backup
+
+
+def _backup_summary():
+    return {
+        "total_stacks": 0,
+        "total_templates": 0,
+        "total_parameters": 0,
+        "regions_summary": {},
+        "errors": [],
+    }
+
+
+class TestExecuteCloudFormationBackup:
+    """Unit tests for _execute_cloudformation_backup."""
+
+    def test_writes_templates_and_parameters(self, tmp_path):
+        """Fetched templates and parameters are written and counted."""
+        stacks = [
+            {"StackName": "text", "StackStatus": "CREATE_COMPLETE"},
+            {
+                "StackName": "parsed",
+                "StackStatus": "CREATE_COMPLETE",
+                "Parameters": [{"ParameterKey": "Env", "ParameterValue": "prod"}],
+            },
+            {"StackName": "existing", "StackStatus": "CREATE_COMPLETE"},
+            {"StackName": "existing-yaml", "StackStatus": "CREATE_COMPLETE"},
+            {"StackName": "failed", "StackStatus": "ROLLBACK_COMPLETE"},
+        ]
+        templates = {"text": "Resources: {}\n", "parsed": {"Resources": {}}}
+        cfn_client = MagicMock()
+        cfn_client.get_paginator.return_value.paginate.return_value = [
+            {"Stacks": stacks}
+        ]
+        cfn_client.get_template.side_effect = lambda StackName, **kwargs: {
+            "TemplateBody": templates[StackName]
+        }
+        aws_auth = MagicMock()
+        aws_auth.get_client.return_value = cfn_client
+        (tmp_path / "us-east-1").mkdir()
+        (tmp_path / "us-east-1" / "existing.json").write_text("{}")
+        (tmp_path / "us-east-1" / "existing-yaml.yaml").write_text("Resources: {}\n")
+        summary = _backup_summary()
+
+        _execute_cloudformation_backup(
+            aws_auth,
+            ["us-east-1"],
+            tmp_path,
+            ["CREATE_COMPLETE"],
+            1,
+            4,
+            summary,
+            "json",
+        )
+
+        region_dir = tmp_path / "us-east-1"
+        assert (region_dir / "text.yaml").read_text() == "Resources: {}\n"
+        assert not (region_dir / "text.json").exists()
+        assert json.loads((region_dir / "parsed.json").read_text()) == {"Resources": {}}
+        assert json.loads((region_dir / "parsed-parameters.json").read_text()) == {
+            "Env": "prod"
+        }
+        assert summary["regions_summary"]["us-east-1"] == {
+            "stacks": 4,
+            "templates": 4,
+            "parameters": 1,
+        }
+        assert summary["errors"] == []
@@ -0,0 +1,241 @@
+"""Tests for cost optimization pricing helpers."""
+
+import json
+import os
+import time
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+from aws_cloud_utilities.commands import costops
+
+
+def _response(payload):
+    """Build a mock HTTP response carrying a JSON payload."""
+    response = MagicMock()
+    response.json.return_value = payload
+    response.content = json.dumps(payload).encode()
+    response.iter_content.return_value = [response.content]
+    return response
+
+
+class TestGetAllServicesPricing:
+    """Unit tests for _get_all_services_pricing."""
+
+    def test_offer_index_is_downloaded_once(self, tmp_path):
+        """Services reuse the shared index and HTTP session."""
+        index = {
+            "offers": {
+                code: {"offerName": code, "versionIndexUrl": f"/{code}/index.json"}
+                for code in ("SvcA", "SvcB")
+            }
+        }
+        versions = {"versions": {"v1": {"offerVersionUrl": "/offer.json"}}}
+        session = MagicMock()
+        session.get.side_effect = lambda url, **kwargs: _response(
+            index
+            if url.endswith("/aws/index.json")
+            else versions if url.endswith("/index.json") else {"products": {}}
+        )
+
+        with patch.object(costops, "_pricing_http_session", return_value=session):
+            result = costops._get_all_services_pricing(tmp_path, "summary", 2)
+
+        urls = [c.args[0] for c in session.get.call_args_list]
+        assert sum(url.endswith("/aws/index.json") for url in urls) == 1
+        assert result["services_processed"] == 2
+        session.close.assert_called_once()
+
+    def test_json_format_writes_offer_body_unchanged(self, tmp_path):
+        """Raw offer files are streamed to disk as served."""
+        versions = {"versions": {"v1": {"offerVersionUrl": "/offer.json"}}}
+        offer = _response({"products": {}})
+        offer.iter_content.return_value = [b'{"products":', b" {}}"]
+        session = MagicMock()
+        session.get.side_effect = lambda url, **kwargs: (
+            _response(versions) if url.endswith("/index.json") else offer
+        )
+
+        result = costops._get_service_pricing(
+            "SvcA",
+            tmp_path,
+            "json",
+            1,
+            session=session,
+            service_info={"versionIndexUrl": "/SvcA/index.json"},
+        )
+
+        assert not result["errors"]
+        assert (tmp_path / "pricing_SvcA_v1.json").read_bytes() == b'{"products": {}}'
+        assert json.loads((tmp_path / "pricing_SvcA_versions.json").read_text()) == (
+            versions
+        )
+        offer.json.assert_not_called()
+
+
+class TestFetchPricingDocument:
+    """Unit tests for the on-disk pricing cache."""
+
+    def test_fresh_cache_skips_request(self, tmp_path):
+        """A cached copy within the TTL is returned without a request."""
+        cache_file = tmp_path / "index.json"
+        cache_file.write_bytes(b"{}")
+        session = MagicMock()
+
+        assert (
+            costops._fetch_pricing_document("https://x/index.json", session, cache_file)
+            == b"{}"
+        )
+        session.get.assert_not_called()
+
+    def test_stale_cache_is_revalidated(self, tmp_path):
+        """A stale copy is revalidated and kept on 304 Not Modified."""
+        cache_file = tmp_path / "index.json"
+        cache_file.write_bytes(b"{}")
+        stale = time.time() - costops.PRICING_CACHE_TTL - 60
+        os.utime(cache_file, (stale, stale))
+        session = MagicMock()
+        session.get.return_value.status_code = 304
+
+        data = costops._fetch_pricing_document(
+            "https://x/index.json", session, cache_file
+        )
+
+        assert data == b"{}"
+        assert "If-Modified-Since" in session.get.call_args.kwargs["headers"]
+        assert cache_file.stat().st_mtime > stale
+
+    def test_download_populates_cache(self, tmp_path):
+        """A fresh download is written to the cache file."""
+        cache_file = tmp_path / "sub" / "index.json"
+        session = MagicMock()
+        session.get.return_value = _response({"offers": {}})
+        session.get.return_value.status_code = 200
+
+        costops._fetch_pricing_document("https://x/index.json", session, cache_file)
+
+        assert json.loads(cache_file.read_bytes()) == {"offers": {}}
+
+
+class TestGetInstanceTags:
+    """Unit tests for batched EBS instance tag lookups."""
+
+    def test_tags_are_fetched_in_filter_sized_batches(self):
+        """Instance IDs are sent 200 per DescribeTags call."""
+        ec2_client = MagicMock()
+        paginate = ec2_client.get_paginator.return_value.paginate
+        paginate.return_value = [
+            {"Tags": [{"ResourceId": "i-000", "Key": "Name", "Value": "web"}]}
+        ]
+        instance_ids = {f"i-{n:03}" for n in range(250)}
+
+        tags = costops._get_instance_tags(ec2_client, instance_ids)
+
+        batches = [c.kwargs["Filters"][1]["Values"] for c in paginate.call_args_list]
+        assert [len(batch) for batch in batches] == [200, 50]
+        assert set().union(*batches) == instance_ids
+        assert tags == {"i-000": {"Name": "web"}}
+
+    def test_volume_uses_prefetched_instance_tags(self):
+        """Attached volumes take their instance tags from the lookup."""
+        volume = {
+            "VolumeId": "vol-1",
+            "VolumeType": "gp2",
+            "Size": 8,
+            "State": "in-use",
+            "Attachments": [{"InstanceId": "i-1"}],
+        }
+
+        info = costops._process_ebs_volume(volume, True, {"i-1": {"Env": "prod"}})
+
+        assert info["instance_id"] == "i-1"
+        assert info["instance_tags"] == {"Env": "prod"}
+        assert info["recommended_type"] == "gp3"
+
+
+class TestAnalyzeSpotPricingData:
+    """Unit tests for _analyze_spot_pricing_data."""
+
+    def test_cheapest_instances_and_filters(self, tmp_path):
+        """Rows are filtered, grouped per AZ and ranked by average price."""
+        (tmp_path / "spot_prices_us-east-1.csv").write_text(
+            "Region,InstanceType,AvailabilityZone,SpotPrice,Timestamp\n"
+            "us-east-1,m5.large,us-east-1a,0.04,t\n"
+            "us-east-1,m5.large,us-east-1a,0.06,t\n"
+            "us-east-1,m5.large,us-east-1b,0.03,t\n"
+            "us-east-1,c5.large,us-east-1a,not-a-price,t\n"
+        )
+
+        result = costops._analyze_spot_pricing_data(
+            tmp_path, top_n=5, instance_type_filter="m5"
+        )
+
+        assert result["errors"] == []
+        assert result["total_records"] == 3
+        assert [
+            (c["availability_zone"], c["average_price_per_hour"], c["sample_count"])
+            for c in result["cheapest_instances"]
+        ] == [("us-east-1b", 0.03, 1), ("us-east-1a", 0.05, 2)]
+        assert result["cheapest_instances"][1]["min_price"] == 0.04
+
+
+class TestCollectSpotPricing:
+    """Unit tests for _collect_spot_pricing."""
+
+    def test_instance_types_are_chunked(self, tmp_path):
+        """Long type lists are queried 20 types at a time into one CSV."""
+
+        def paginate(**params):
+            return [
+                {
+                    "SpotPriceHistory": [
+                        {
+                            "InstanceType": params["InstanceTypes"][0],
+                            "AvailabilityZone": "us-east-1a",
+                            "SpotPrice": "0.01",
+                            "Timestamp": datetime(2024, 1, 1),
+                        }
+                    ]
+                }
+            ]
+
+        aws_auth = MagicMock()
+        paginator = aws_auth.get_client.return_value.get_paginator.return_value
+        paginator.paginate.side_effect = paginate
+        types = [f"m5.type{n}" for n in range(45)]
+
+        with patch.object(
+            costops,
+            "parallel_execute",
+            lambda fn, items, **kw: [fn(item) for item in items],
+        ):
+            result = costops._collect_spot_pricing(
+                aws_auth, ["us-east-1"], 1, types, "Linux/UNIX", tmp_path, 1
+            )
+
+        assert sorted(
+            len(c.kwargs["InstanceTypes"]) for c in paginator.paginate.call_args_list
+        ) == [5, 20, 20]
+        assert result["total_records"] == 3
+        lines = (tmp_path / "spot_prices_us-east-1.csv").read_text().splitlines()
+        assert [line.split(",")[1] for line in lines[1:]] == [
+            "m5.type0",
+            "m5.type20",
+            "m5.type40",
+        ]
+
+
+class TestSpotPricingOptions:
+    """CLI option validation for spot-pricing."""
+
+    def test_parallel_regions_must_be_positive(self):
+        """A negative worker count is rejected by click, not by the executor."""
+        result = CliRunner().invoke(
+            costops.costops_group,
+            ["spot-pricing", "--parallel-regions", "-1"],
+            obj={"config": MagicMock(), "aws_auth": MagicMock()},
+        )
+
+        assert result.exit_code == 2
+        assert "--parallel-regions" in result.output
@@ -0,0 +1,145 @@
+"""Tests for ECR command helpers."""
+
+import base64
+import json
+import subprocess
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from aws_cloud_utilities.commands import ecr
+
+
+def _failure(stderr):
+    return subprocess.CalledProcessError(1, ["docker", "pull"], stderr=stderr)
+
+
+class TestRunDockerWithRetries:
+    """Unit tests for _run_docker_with_retries."""
+
+    def test_transient_failures_are_retried(self):
+        """Network errors are retried with growing delays until success."""
+        done = subprocess.CompletedProcess(["docker", "pull"], 0, stdout="ok")
+        with (
+            patch.object(
+                ecr.subprocess,
+                "run",
+                side_effect=[_failure("net/http: TLS handshake timeout"), done],
+            ) as run,
+            patch.object(ecr.time, "sleep") as sleep,
+        ):
+            assert ecr._run_docker_with_retries(["docker", "pull", "img"]) is done
+
+        assert run.call_count == 2
+        assert (
+            ecr.DOCKER_RETRY_BACKOFF
+            <= sleep.call_args.args[0]
+            < (ecr.DOCKER_RETRY_BACKOFF + 1)
+        )
+
+    def test_permanent_failures_are_not_retried(self):
+        """Errors such as a missing image fail on the first attempt."""
+        with (
+            patch.object(
+                ecr.subprocess, "run", side_effect=_failure("manifest unknown")
+            ) as run,
+            patch.object(ecr.time, "sleep") as sleep,
+        ):
+            with pytest.raises(subprocess.CalledProcessError):
+                ecr._run_docker_with_retries(["docker", "pull", "img"])
+
+        assert run.call_count == 1
+        sleep.assert_not_called()
+
+    def test_attempts_are_bounded(self):
+        """A persistent transient error gives up after the last attempt."""
+        with (
+            patch.object(
+                ecr.subprocess, "run", side_effect=_failure("connection reset by peer")
+            ) as run,
+            patch.object(ecr.time, "sleep"),
+        ):
+            with pytest.raises(subprocess.CalledProcessError):
+                ecr._run_docker_with_retries(["docker", "push", "img"])
+
+        assert run.call_count == ecr.DOCKER_MAX_ATTEMPTS
+
+
+class TestEcrDockerLogin:
+    """Unit tests for the cached ECR docker login."""
+
+    REGISTRY = "123456789012.dkr.ecr.us-east-1.amazonaws.com"
+
+    def _ecr_client(self, expires_in):
+        ecr_client = MagicMock()
+        ecr_client.get_authorization_token.return_value = {
+            "authorizationData": [
+                {
+                    "authorizationToken": base64.b64encode(b"AWS:secret").decode(),
+                    "proxyEndpoint": f"https://{self.REGISTRY}",
+                    "expiresAt": datetime.now(timezone.utc)
+                    + timedelta(seconds=expires_in),
+                }
+            ]
+        }
+        return ecr_client
+
+    @pytest.fixture(autouse=True)
+    def docker_config(self, tmp_path, monkeypatch):
+        """Point docker at a config that holds this registry's credentials."""
+        config_dir = tmp_path / "docker"
+        config_dir.mkdir()
+        (config_dir / "config.json").write_text(
+            json.dumps({"auths": {self.REGISTRY: {}}})
+        )
+        monkeypatch.setenv("DOCKER_CONFIG", str(config_dir))
+        return config_dir
+
+    def _login(self, ecr_client, cache_file):
+        with patch.object(ecr.subprocess, "Popen") as popen:
+            popen.return_value.communicate.return_value = ("", "")
+            popen.return_value.returncode = 0
+            ecr._ecr_docker_login(
+                ecr_client, "us-east-1", self.REGISTRY, cache_file=cache_file
+            )
+        return popen
+
+    def test_login_is_reused_until_near_expiry(self, tmp_path):
+        """A cached login skips AWS and docker until it nearly expires."""
+        cache_file = tmp_path / ecr.ECR_LOGIN_CACHE_FILE
+
+        popen = self._login(self._ecr_client(12 * 3600), cache_file)
+        popen.return_value.communicate.assert_called_once_with(input="secret")
+
+        ecr_client = self._ecr_client(12 * 3600)
+        assert self._login(ecr_client, cache_file).call_count == 0
+        ecr_client.get_authorization_token.assert_not_called()
+
+    def test_expiring_login_is_refreshed(self, tmp_path):
+        """Logins within the expiry margin are renewed."""
+        cache_file = tmp_path / ecr.ECR_LOGIN_CACHE_FILE
+        self._login(self._ecr_client(60), cache_file)
+
+        assert self._login(self._ecr_client(60), cache_file).call_count == 1
+
+    def test_logged_out_registry_logs_in_again(self, tmp_path, docker_config):
+        """A cached login is not reused once docker has no credentials."""
+        cache_file = tmp_path / ecr.ECR_LOGIN_CACHE_FILE
+        self._login(self._ecr_client(12 * 3600), cache_file)
+
+        (docker_config / "config.json").write_text(json.dumps({"auths": {}}))
+
+        assert self._login(self._ecr_client(12 * 3600), cache_file).call_count == 1
+
+    def test_login_is_cached_per_docker_config(self, tmp_path, monkeypatch):
+        """A login made under one DOCKER_CONFIG is not reused under another."""
+        cache_file = tmp_path / ecr.ECR_LOGIN_CACHE_FILE
+        self._login(self._ecr_client(12 * 3600), cache_file)
+
+        other = tmp_path / "other-docker"
+        other.mkdir()
+        (other / "config.json").write_text(json.dumps({"auths": {self.REGISTRY: {}}}))
+        monkeypatch.setenv("DOCKER_CONFIG", str(other))
+
+        assert self._login(self._ecr_client(12 * 3600), cache_file).call_count == 1
@@ -0,0 +1,63 @@
+"""Tests for the HTML report generator."""
+
+from aws_cloud_utilities.core.html_report import (
+    HTMLReportGenerator,
+    ReportMetadata,
+    SafeHTML,
+    create_badge,
+    create_list_html,
+    create_stats_grid_html,
+    create_table_html,
+)
+
+
+def _make_report() -> HTMLReportGenerator:
+    report = HTMLReportGenerator(ReportMetadata(title="Test Report"))
+    report.add_section("Summary", "<p>summary</p>", section_type="summary")
+    report.add_section("Details", "<p>details</p>", collapsible=True, expanded=False)
+    return report
+
+
+def test_generate_contains_sections():
+    """Generated document contains static assets and every section."""
+    html = _make_report().generate()
+
+    assert html.startswith("<!DOCTYPE html>")
+    assert "<title>Test Report</title>" in html
+    assert "<style>" in html and "toggleSection" in html
+    assert 'class="section-content section-summary" id="section-0"' in html
+    assert 'class="section-content section-default hidden" id="section-1"' in html
+    assert html.rstrip().endswith("</html>")
+
+
+def test_save_matches_generate(tmp_path):
+    """Saved file is byte-identical to the generated document."""
+    report = _make_report()
+    path = tmp_path / "reports" / "report.html"
+
+    report.save(path)
+
+    assert path.read_bytes() == report.generate().encode("utf-8")
+
+
+def test_table_escapes_plain_cells_but_not_badges():
+    """Plain cell text is escaped while helper-built markup is kept."""
+    table = create_table_html(
+        ["Name", "Status"], [["<b>bucket</b> & co", create_badge("OK", "success")]]
+    )
+
+    assert "<td>&lt;b&gt;bucket&lt;/b&gt; &amp; co</td>" in table
+    assert '<td><span class="badge badge-success">OK</span></td>' in table
+    assert isinstance(table, SafeHTML)
+
+
+def test_list_and_stats_grid():
+    """List items and stat cards are rendered in order."""
+    assert (
+        create_list_html(["a", "b<"], ordered=True)
+        == "<ol><li>a</li><li>b&lt;</li></ol>"
+    )
+
+    grid = create_stats_grid_html({"Total": 3})
+    assert '<div class="stat-label">Total</div>' in grid
+    assert '<div class="stat-value">3</div>' in grid
@@ -0,0 +1,430 @@
+"""Tests for CloudWatch Logs command helpers."""
+
+import gzip
+import io
+import time
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from aws_cloud_utilities.commands import logs
+
+
+def _logs_auth(streams, events):
+    """Build a mock AWSAuth whose logs client serves the given streams."""
+    now_ms = int(time.time() * 1000)
+    paginators = {
+        "describe_log_streams": MagicMock(),
+        "filter_log_events": MagicMock(),
+    }
+    paginators["describe_log_streams"].paginate.return_value = [
+        {
+            "logStreams": [
+                {"logStreamName": name, "lastEventTime": now_ms - age}
+                for name, age in streams
+            ]
+        }
+    ]
+    paginators["filter_log_events"].paginate.side_effect = lambda **kw: [
+        {
+            "events": [
+                dict(event, logStreamName=name)
+                for name in kw["logStreamNames"]
+                for event in events.get(name, [])
+            ]
+        }
+    ]
+    client = MagicMock()
+    client.get_paginator.side_effect = paginators.__getitem__
+    aws_auth = MagicMock()
+    aws_auth.get_client.return_value = client
+    return aws_auth, paginators
+
+
+class TestCombineLogFiles:
+    """Unit tests for _combine_log_files."""
+
+    def _write_logs(self, folder):
+        folder.mkdir()
+        (folder / "a.log").write_text("2024-01-03 c\n2024-01-01 a\n")
+        (folder / "b.log").write_text("2024-01-02 b\n2024-01-04 d")
+        (folder / "c.log").write_text("2024-01-00 z\n")
+
+    def test_lines_are_merged_in_order(self, tmp_path, monkeypatch):
+        """Sorted runs spilled to disk merge into one ordered file."""
+        self._write_logs(tmp_path / "in")
+        monkeypatch.setattr(logs, "COMBINE_RUN_BYTES", 16)
+        output = tmp_path / "combined.log"
+
+        result = logs._combine_log_files(tmp_path / "in", str(output), True)
+
+        assert output.read_text().splitlines() == [
+            "2024-01-00 z",
+            "2024-01-01 a",
+            "2024-01-02 b",
+            "2024-01-03 c",
+            "2024-01-04 d",
+        ]
+        assert result["files_processed"] == 3
+        assert result["total_lines"] == 5
+
+    def test_unsorted_combine_keeps_file_order(self, tmp_path):
+        """Without sorting, each file's lines are copied as-is."""
+        self._write_logs(tmp_path / "in")
+        output = tmp_path / "combined.log"
+
+        result = logs._combine_log_files(tmp_path / "in", str(output), False)
+
+        assert sorted(output.read_text().splitlines()) == sorted(
+            [
+                "2024-01-03 c",
+                "2024-01-01 a",
+                "2024-01-02 b",
+                "2024-01-04 d",
+                "2024-01-00 z",
+            ]
+        )
+        assert result["total_lines"] == 5
+
+    def test_lines_split_across_read_chunks(self, tmp_path, monkeypatch):
+        """Lines straddling chunk boundaries are reassembled intact."""
+        self._write_logs(tmp_path / "in")
+        monkeypatch.setattr(logs, "COMBINE_READ_SIZE", 5)
+        output = tmp_path / "combined.log"
+
+        logs._combine_log_files(tmp_path / "in", str(output), True)
+
+        assert output.read_bytes() == (
+            b"2024-01-00 z\n2024-01-01 a\n2024-01-02 b\n2024-01-03 c\n2024-01-04 d\n"
+        )
+
+    def test_batches_are_bounded_by_count_and_size(self, tmp_path):
+        """Batches close at the file count or byte limit; big files go alone."""
+        sizes = {"a": 4, "b": 4, "c": 20, "d": 1, "e": 1, "f": 1}
+        files = []
+        for name, size in sizes.items():
+            path = tmp_path / name
+            path.write_bytes(b"x" * size)
+            files.append(path)
+
+        batches = list(logs._size_batches(files, 2, 10))
+
+        assert [([p.name for p in batch], size) for batch, size in batches] == [
+            (["a", "b"], 8),
+            (["c"], 20),
+            (["d", "e"], 2),
+            (["f"], 1),
+        ]
+
+
+class TestDownloadSingleLogGroup:
+    """Unit tests for _download_single_log_group."""
+
+    def test_downloads_recent_streams(self, tmp_path):
+        """Each stream in range is written to its own file."""
+        day_ms = 24 * 60 * 60 * 1000
+        event = {"timestamp": int(time.time() * 1000), "message": "hello"}
+        aws_auth, paginators = _logs_auth(
+            [("a", 0), ("b", 0), ("old", 30 * day_ms)],
+            {"a": [event], "b": [event, event], "old": [event]},
+        )
+
+        result = logs._download_single_log_group(
+            aws_auth, "us-east-1", "/app", 1, tmp_path, max_workers=2
+        )
+
+        assert result["streams_processed"] == 2
+        assert result["events_downloaded"] == 3
+        assert result["files_created"] == 2
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "_app_a.log",
+            "_app_b.log",
+        ]
+        assert paginators["filter_log_events"].paginate.call_count == 1
+
+    def test_streams_are_batched_per_filter_call(self, tmp_path, monkeypatch):
+        """Stream names are sent in FilterLogEvents-sized batches."""
+        monkeypatch.setattr(logs, "FILTER_LOG_EVENTS_MAX_STREAMS", 2)
+        aws_auth, paginators = _logs_auth([(name, 0) for name in "abcde"], {})
+
+        result = logs._download_single_log_group(
+            aws_auth, "us-east-1", "/app", 1, tmp_path
+        )
+
+        paginate = paginators["filter_log_events"].paginate
+        assert sorted(
+            len(c.kwargs["logStreamNames"]) for c in paginate.call_args_list
+        ) == [1, 2, 2]
+        assert result["streams_processed"] == 5
+        assert result["files_created"] == 0
+
+    def test_filter_pattern_is_sent_server_side(self, tmp_path):
+        """A filter pattern is passed on to FilterLogEvents."""
+        aws_auth, paginators = _logs_auth([("a", 0)], {})
+
+        logs._download_single_log_group(
+            aws_auth, "us-east-1", "/app", 1, tmp_path, filter_pattern="ERROR"
+        )
+
+        paginate = paginators["filter_log_events"].paginate
+        assert paginate.call_args.kwargs["filterPattern"] == "ERROR"
+
+    def test_failed_batches_are_reported(self, tmp_path, monkeypatch):
+        """A failed batch is reported as an error, not as processed streams."""
+        monkeypatch.setattr(logs, "FILTER_LOG_EVENTS_MAX_STREAMS", 2)
+        aws_auth, paginators = _logs_auth([(name, 0) for name in "abc"], {})
+        paginate = paginators["filter_log_events"].paginate
+        ok = paginate.side_effect
+
+        def fail_first_batch(**kw):
+            if "a" in kw["logStreamNames"]:
+                raise RuntimeError("throttled")
+            return ok(**kw)
+
+        paginate.side_effect = fail_first_batch
+
+        result = logs._download_single_log_group(
+            aws_auth, "us-east-1", "/app", 1, tmp_path
+        )
+
+        assert result["streams_processed"] == 1
+        assert len(result["errors"]) == 1
+        assert "2 streams from /app: throttled" in result["errors"][0]
+
+
+class TestDownloadLogStreams:
+    """Unit tests for _download_log_streams."""
+
+    def test_evicted_files_are_reopened_for_append(self, tmp_path, monkeypatch):
+        """Streams interleaved across pages keep every event with one open file."""
+        monkeypatch.setattr(logs, "MAX_OPEN_STREAM_FILES", 1)
+        client = MagicMock()
+        client.get_paginator.return_value.paginate.return_value = [
+            {
+                "events": [
+                    {"logStreamName": name, "timestamp": 0, "message": f"{name}{i}"}
+                    for name in ("a", "b")
+                ]
+            }
+            for i in range(2)
+        ]
+
+        result = logs._download_log_streams(client, "/app", ["a", "b"], 0, 1, tmp_path)
+
+        assert result["events"] == 4
+        assert result["files_created"] == 2
+        for name in ("a", "b"):
+            lines = (tmp_path / f"_app_{name}.log").read_text().splitlines()
+            assert [line.split(" ", 1)[1] for line in lines] == [f"{name}0", f"{name}1"]
+
+
+class TestDownloadMultipleLogGroups:
+    """Unit tests for _download_multiple_log_groups."""
+
+    def test_summarizes_every_group(self, tmp_path):
+        """Streams from all groups are downloaded and totalled."""
+        event = {"timestamp": int(time.time() * 1000), "message": "hello"}
+        aws_auth, _ = _logs_auth([("a", 0), ("b", 0)], {"a": [event], "b": [event]})
+
+        summary = logs._download_multiple_log_groups(
+            aws_auth, "us-east-1", ["/one", "/two", "/three"], 1, tmp_path, 2
+        )
+
+        assert summary["groups_processed"] == 3
+        assert summary["total_streams"] == 6
+        assert summary["total_files"] == 6
+        assert len(list(tmp_path.iterdir())) == 6
+
+
+class TestDownloadLogGroupExport:
+    """Unit tests for _download_log_group_export."""
+
+    def test_export_objects_are_downloaded_and_decompressed(
+        self, tmp_path, monkeypatch
+    ):
+        """Completed export objects are fetched and written per stream part."""
+        monkeypatch.setattr(logs, "EXPORT_POLL_INITIAL", 0)
+        logs_client = MagicMock()
+        logs_client.create_export_task.return_value = {"taskId": "t1"}
+        logs_client.describe_export_tasks.side_effect = [
+            {"exportTasks": [{"status": {"code": "RUNNING"}}]},
+            {"exportTasks": [{"status": {"code": "COMPLETED"}}]},
+        ]
+
+        s3_client = MagicMock()
+
+        def list_objects(Bucket, Prefix):
+            return [
+                {
+                    "Contents": [
+                        {"Key": f"{Prefix}2024/01/01/abc/000000.gz"},
+                        {"Key": f"{Prefix}other/000000.gz"},
+                        {"Key": f"{Prefix}aws-logs-write-test"},
+                    ]
+                }
+            ]
+
+        s3_client.get_paginator.return_value.paginate.side_effect = list_objects
+        s3_client.get_object.side_effect = lambda Bucket, Key: {
+            "Body": io.BytesIO(gzip.compress(b"l1\nl2\n"))
+        }
+        aws_auth = MagicMock()
+        aws_auth.get_client.side_effect = lambda service, region_name=None: {
+            "logs": logs_client,
+            "s3": s3_client,
+        }[service]
+
+        result = logs._download_log_group_export(
+            aws_auth, "us-east-1", "/app", 1, tmp_path, "bucket"
+        )
+
+        assert result["errors"] == []
+        assert result["streams_processed"] == 2
+        assert result["files_created"] == 2
+        assert result["events_downloaded"] == 4
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "_app_2024_01_01_abc_000000.log",
+            "_app_other_000000.log",
+        ]
+        assert (tmp_path / "_app_other_000000.log").read_bytes() == b"l1\nl2\n"
+
+    def test_stuck_export_times_out_with_task_id(self, monkeypatch):
+        """A task still running at the deadline raises, naming the task."""
+        monkeypatch.setattr(logs, "EXPORT_POLL_INITIAL", 0)
+        clock = iter(range(0, 1000, 10))
+        monkeypatch.setattr(logs.time, "monotonic", lambda: next(clock))
+        logs_client = MagicMock()
+        logs_client.describe_export_tasks.return_value = {
+            "exportTasks": [{"status": {"code": "PENDING"}}]
+        }
+
+        with pytest.raises(RuntimeError, match="t1 still PENDING after 30s"):
+            logs._wait_for_export_task(logs_client, "t1", timeout=30)
+
+    def test_any_other_status_is_terminal(self):
+        """Statuses other than PENDING/RUNNING end the wait."""
+        logs_client = MagicMock()
+        logs_client.describe_export_tasks.return_value = {
+            "exportTasks": [{"status": {"code": "PENDING_CANCEL"}}]
+        }
+
+        status = logs._wait_for_export_task(logs_client, "t1")
+
+        assert status["code"] == "PENDING_CANCEL"
+        assert logs_client.describe_export_tasks.call_count == 1
+
+    def test_failed_export_is_reported(self, tmp_path):
+        """A failed export task is recorded as an error."""
+        logs_client = MagicMock()
+        logs_client.create_export_task.return_value = {"taskId": "t1"}
+        logs_client.describe_export_tasks.return_value = {
+            "exportTasks": [{"status": {"code": "FAILED", "message": "denied"}}]
+        }
+        aws_auth = MagicMock()
+        aws_auth.get_client.return_value = logs_client
+
+        result = logs._download_log_group_export(
+            aws_auth, "us-east-1", "/app", 1, tmp_path, "bucket"
+        )
+
+        assert len(result["errors"]) == 1
+        assert "FAILED" in result["errors"][0]
+
+
+class TestGetAllLogGroups:
+    """Unit tests for _get_all_log_groups."""
+
+    def test_rows_have_display_values(self):
+        """Rows carry formatted retention, size and creation time."""
+        client = MagicMock()
+        client.get_paginator.return_value.paginate.return_value = [
+            {
+                "logGroups": [
+                    {
+                        "logGroupName": "/app",
+                        "retentionInDays": 30,
+                        "storedBytes": 2048,
+                        "arn": "arn:app",
+                        "creationTime": 0,
+                    }
+                ]
+            }
+        ]
+        aws_auth = MagicMock()
+        aws_auth.get_client.return_value = client
+
+        rows = logs._get_all_log_groups(aws_auth, ["us-east-1"], True)
+
+        assert rows == [
+            {
+                "Log Group Name": "/app",
+                "Region": "us-east-1",
+                "Retention": "30 days",
+                "Stored Bytes": 2048,
+                "ARN": "arn:app",
+                "Created": "Unknown",
+                "Storage Size": logs._human_readable_size(2048),
+            }
+        ]
+        assert (
+            "Stored Bytes"
+            not in logs._get_all_log_groups(aws_auth, ["us-east-1"], False)[0]
+        )
+
+
+class TestReadSortedLines:
+    """Unit tests for _read_sorted_lines."""
+
+    @pytest.mark.parametrize("mmap_min_bytes", [0, 1 << 20])
+    def test_sorts_and_terminates_lines(self, tmp_path, monkeypatch, mmap_min_bytes):
+        """Mapped and directly read files give the same sorted lines."""
+        monkeypatch.setattr(logs, "COMBINE_MMAP_MIN_BYTES", mmap_min_bytes)
+        path = tmp_path / "a.log"
+        path.write_bytes(b"b\nc\na")
+
+        assert logs._read_sorted_lines(path) == ([b"a\n", b"b\n", b"c\n"], 6)
+
+    def test_empty_file(self, tmp_path):
+        """Empty files yield no lines."""
+        path = tmp_path / "empty.log"
+        path.write_bytes(b"")
+
+        assert logs._read_sorted_lines(path) == ([], 0)
+
+
+class TestFormatEventTime:
+    """Unit tests for _format_event_time."""
+
+    @pytest.mark.parametrize("timestamp_ms", [0, 1700000000000, 1700000000123])
+    def test_matches_datetime_isoformat(self, timestamp_ms):
+        """Output matches datetime.fromtimestamp(...).isoformat()."""
+        assert logs._format_event_time(timestamp_ms) == (
+            datetime.fromtimestamp(timestamp_ms / 1000).isoformat()
+        )
+
+
+class TestDetectLogType:
+    """Unit tests for _detect_log_type content sniffing."""
+
+    def test_records_documents_are_detected(self, tmp_path):
+        """CloudTrail and CloudFront Records documents are recognized."""
+        trail = tmp_path / "a.json"
+        trail.write_text('{"Records": [{"eventVersion": "1.08"}]}\n')
+        other = tmp_path / "b.json"
+        other.write_text('{"Records": [{"foo": 1}]}\n')
+
+        assert logs._detect_log_type(trail, None) == logs.LOG_TYPE_CLOUDTRAIL
+        assert logs._detect_log_type(other, None) == logs.LOG_TYPE_CLOUDFRONT
+
+    def test_json_without_records_is_not_parsed(self, tmp_path, monkeypatch):
+        """JSON lacking a Records key is rejected before parsing."""
+        path = tmp_path / "c.json"
+        path.write_text('{"message": "hello"}\n')
+        loads = MagicMock()
+        monkeypatch.setattr(logs.json, "loads", loads)
+        if logs.orjson is not None:
+            monkeypatch.setattr(logs.orjson, "loads", loads)
+
+        assert logs._detect_log_type(path, None) is None
+        loads.assert_not_called()
@@ -1,11 +1,13 @@
 """Tests for S3 bucket-details command enhancements (issue #185)."""
 
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from click.testing import CliRunner
 
+from aws_cloud_utilities.commands import s3
 from aws_cloud_utilities.commands.s3 import _get_all_bucket_details, s3_group
 from aws_cloud_utilities.core.auth import AWSAuth
 from aws_cloud_utilities.core.config import Config
@@ -198,3 +200,314 @@ class TestBucketDetailsCommand:
 
         mock_gabd.assert_called_once()
         assert result.exit_code == 0
+
+
+# ---------------------------------------------------------------------------
+# Helper: _get_bucket_sizes
+# ---------------------------------------------------------------------------
+
+
+class TestGetBucketSizes:
+    """Unit tests for batched CloudWatch bucket size lookups."""
+
+    def _auth(self, cw_client):
+        auth = Mock(spec=AWSAuth)
+        auth.get_client.return_value = cw_client
+        return auth
+
+    def test_maps_results_back_to_buckets(self):
+        """Each bucket gets its newest size and object count."""
+        cw_client = MagicMock()
+        cw_client.get_paginator.return_value.paginate.return_value = [
+            {
+                "MetricDataResults": [
+                    {"Id": "size0", "Values": [2048.0, 1024.0]},
+                    {"Id": "count0", "Values": [3.0]},
+                    {"Id": "size1", "Values": []},
+                    {"Id": "count1", "Values": []},
+                ]
+            }
+        ]
+        auth = self._auth(cw_client)
+
+        sizes = s3._get_bucket_sizes(auth, "eu-west-1", ["a", "b"])
+
+        auth.get_client.assert_called_once_with("cloudwatch", region_name="eu-west-1")
+        assert sizes["a"]["size_bytes"] == 2048
+        assert sizes["a"]["object_count"] == 3
+        assert sizes["b"]["size_bytes"] == 0
+        assert sizes["b"]["object_count"] == 0
+
+    def test_queries_are_batched(self, monkeypatch):
+        """Queries are split into GetMetricData-sized requests."""
+        monkeypatch.setattr(s3, "GET_METRIC_DATA_MAX_QUERIES", 4)
+        cw_client = MagicMock()
+        paginate = cw_client.get_paginator.return_value.paginate
+        paginate.return_value = []
+
+        s3._get_bucket_sizes(self._auth(cw_client), "us-east-1", ["a", "b", "c"])
+
+        assert [
+            len(c.kwargs["MetricDataQueries"]) for c in paginate.call_args_list
+        ] == [4, 2]
+
+    def test_errors_mark_sizes_unavailable(self):
+        """A failed lookup reports N/A for every bucket."""
+        cw_client = MagicMock()
+        cw_client.get_paginator.side_effect = Exception("boom")
+
+        sizes = s3._get_bucket_sizes(self._auth(cw_client), "us-east-1", ["a"])
+
+        assert sizes["a"] == {
+            "size_bytes": 0,
+            "size_display": "N/A",
+            "object_count": "N/A",
+        }
+
+
+# ---------------------------------------------------------------------------
+# Helper: _download_s3_objects
+# ---------------------------------------------------------------------------
+
+
+class TestDownloadS3Objects:
+    """Unit tests for downloads through a shared transfer manager."""
+
+    def _download(self, tmp_path, objects, max_workers):
+        """Run _download_s3_objects against a mock transfer manager."""
+
+        def download(bucket, key, filename, extra_args=None):
+            Path(filename).write_bytes(b"x")
+            return Mock()
+
+        manager = MagicMock()
+        manager.__enter__.return_value = manager
+        manager.download.side_effect = download
+        auth = Mock(spec=AWSAuth)
+
+        with (
+            patch.object(s3, "_get_s3_objects_list", return_value=objects),
+            patch.object(
+                s3, "create_transfer_manager", return_value=manager
+            ) as mock_create,
+        ):
+            result = s3._download_s3_objects(
+                auth,
+                "bkt",
+                "us-east-1",
+                tmp_path,
+                None,
+                True,
+                False,
+                None,
+                1000,
+                0,
+                max_workers,
+            )
+        return result, manager, mock_create
+
+    def test_objects_share_one_transfer_manager(self, tmp_path):
+        """Every object is fetched by a single capped transfer manager."""
+        objects = [
+            {"key": "a.txt", "version_id": None, "size": 1},
+            {"key": "dir/b.txt", "version_id": "v2", "size": 1},
+        ]
+
+        result, manager, mock_create = self._download(tmp_path, objects, 3)
+
+        mock_create.assert_called_once()
+        assert mock_create.call_args.args[1].max_request_concurrency == 3
+        extra_args = {
+            c.args[1]: c.kwargs["extra_args"] for c in manager.download.call_args_list
+        }
+        assert extra_args == {"a.txt": None, "dir/b.txt": {"VersionId": "v2"}}
+        assert result["objects_downloaded"] == 2
+        assert result["total_size"] == 2
+        assert result["errors"] == []
+
+    def test_in_flight_downloads_are_bounded(self, tmp_path, monkeypatch):
+        """Every object is recorded when submission has to wait on results."""
+        monkeypatch.setattr(s3, "DOWNLOADS_IN_FLIGHT_PER_WORKER", 1)
+        objects = [{"key": f"obj{i}", "version_id": None, "size": 1} for i in range(7)]
+
+        result, manager, _ = self._download(tmp_path, objects, 2)
+
+        assert manager.download.call_count == 7
+        assert result["objects_downloaded"] == 7
+        assert result["objects_failed"] == 0
+
+    def test_versions_get_their_own_files(self, tmp_path):
+        """Each version of a key is saved to a version-qualified path."""
+        objects = [
+            {"key": "dir/a.txt", "version_id": "v1", "size": 1},
+            {"key": "dir/a.txt", "version_id": "v2", "size": 1},
+            {"key": "dir/b.txt", "version_id": "null", "size": 1},
+        ]
+
+        result, _, _ = self._download(tmp_path, objects, 2)
+
+        assert sorted(p.name for p in (tmp_path / "dir").iterdir()) == [
+            "a.txt.v1",
+            "a.txt.v2",
+            "b.txt",
+        ]
+        assert result["objects_downloaded"] == 3
+
+    def test_directories_are_created_once(self, tmp_path):
+        """Objects under the same prefix share one directory creation."""
+        objects = [
+            {"key": f"logs/{name}", "version_id": None, "size": 1}
+            for name in ("a", "b", "c")
+        ]
+
+        with patch.object(
+            Path, "mkdir", autospec=True, side_effect=Path.mkdir
+        ) as mkdir:
+            result, _, _ = self._download(tmp_path, objects, 2)
+
+        assert [c.args[0] for c in mkdir.call_args_list] == [tmp_path / "logs"]
+        assert result["objects_downloaded"] == 3
+
+
+# ---------------------------------------------------------------------------
+# Helper: _delete_all_object_versions
+# ---------------------------------------------------------------------------
+
+
+class TestDeleteAllObjectVersions:
+    """Unit tests for batched, concurrent bucket emptying."""
+
+    def _client(self, pages, errors=()):
+        client = MagicMock()
+        client.get_paginator.return_value.paginate.return_value = pages
+        client.delete_objects.return_value = {"Errors": list(errors)}
+        return client
+
+    def test_versions_and_markers_are_deleted_in_batches(self, monkeypatch):
+        """Versions and delete markers are sent in DeleteObjects-sized batches."""
+        monkeypatch.setattr(s3, "DELETE_OBJECTS_MAX_KEYS", 2)
+        client = self._client(
+            [
+                {
+                    "Versions": [
+                        {"Key": "a", "VersionId": "1"},
+                        {"Key": "b", "VersionId": "1"},
+                    ],
+                    "DeleteMarkers": [{"Key": "a", "VersionId": "2"}],
+                },
+                {"Versions": [{"Key": "c", "VersionId": "null"}]},
+            ]
+        )
+
+        result = s3._delete_all_object_versions(client, "bkt", 4)
+
+        batches = [
+            c.kwargs["Delete"]["Objects"] for c in client.delete_objects.call_args_list
+        ]
+        assert sorted(len(batch) for batch in batches) == [2, 2]
+        assert all(
+            c.kwargs["Delete"]["Quiet"] for c in client.delete_objects.call_args_list
+        )
+        assert result == {
+            "objects_deleted": 4,
+            "versions_deleted": 3,
+            "delete_markers_deleted": 1,
+            "errors": [],
+        }
+
+    def test_failed_keys_are_reported(self):
+        """Keys DeleteObjects reports as failed are not counted as deleted."""
+        client = self._client(
+            [
+                {
+                    "Versions": [{"Key": "a", "VersionId": "1"}],
+                    "DeleteMarkers": [{"Key": "b", "VersionId": "2"}],
+                }
+            ],
+            errors=[{"Key": "b", "VersionId": "2", "Message": "Access Denied"}],
+        )
+
+        result = s3._delete_all_object_versions(client, "bkt", 2)
+
+        assert result["versions_deleted"] == 1
+        assert result["delete_markers_deleted"] == 0
+        assert result["errors"] == ["Failed to delete b: Access Denied"]
+
+    def test_batches_are_deleted_while_listing(self, monkeypatch):
+        """Full batches are deleted before the listing finishes."""
+        monkeypatch.setattr(s3, "DELETE_OBJECTS_MAX_KEYS", 1)
+        client = self._client([])
+
+        def pages(**kwargs):
+            for i in range(3):
+                if i == 2:
+                    # The second flush waited on the first batch's delete
+                    assert client.delete_objects.call_count >= 1
+                yield {"Versions": [{"Key": f"k{i}", "VersionId": "1"}]}
+
+        client.get_paginator.return_value.paginate.side_effect = pages
+
+        result = s3._delete_all_object_versions(client, "bkt", 1)
+
+        assert client.delete_objects.call_count == 3
+        assert result["versions_deleted"] == 3
+
+
+# ---------------------------------------------------------------------------
+# Helper: _nuke_s3_bucket
+# ---------------------------------------------------------------------------
+
+
+class TestNukeS3Bucket:
+    """Unit tests for nuke-bucket's backup safety check."""
+
+    def _nuke(self, tmp_path, download_results):
+        auth = Mock(spec=AWSAuth)
+        client = auth.get_client.return_value
+        with (
+            patch.object(s3, "_download_s3_objects", return_value=download_results),
+            patch.object(s3, "_delete_all_object_versions") as mock_delete,
+        ):
+            mock_delete.return_value = {
+                "objects_deleted": 1,
+                "versions_deleted": 1,
+                "delete_markers_deleted": 0,
+                "errors": [],
+            }
+            result = s3._nuke_s3_bucket(
+                auth, "bkt", "us-east-1", True, str(tmp_path), False, 2
+            )
+        return result, client, mock_delete
+
+    @pytest.mark.parametrize(
+        "downloaded,errors",
+        [
+            (1, ["Failed to download b: boom"]),
+            (1, []),
+            (0, ["Download operation error"]),
+        ],
+    )
+    def test_incomplete_backup_aborts_before_deleting(
+        self, tmp_path, downloaded, errors
+    ):
+        """Nothing is deleted unless every object was backed up."""
+        result, client, mock_delete = self._nuke(
+            tmp_path,
+            {"objects_found": 2, "objects_downloaded": downloaded, "errors": errors},
+        )
+
+        mock_delete.assert_not_called()
+        client.delete_bucket.assert_not_called()
+        assert not result["bucket_deleted"]
+        assert "bucket was not deleted" in result["errors"][-1]
+
+    def test_complete_backup_deletes_bucket(self, tmp_path):
+        """The bucket is emptied and deleted once the backup is complete."""
+        result, client, mock_delete = self._nuke(
+            tmp_path, {"objects_found": 2, "objects_downloaded": 2, "errors": []}
+        )
+
+        mock_delete.assert_called_once()
+        client.delete_bucket.assert_called_once_with(Bucket="bkt")
+        assert result["bucket_deleted"]
+        assert result["errors"] == []
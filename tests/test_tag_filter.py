@@ -0,0 +1,170 @@
+"""Tests for tag filtering utilities."""
+
+from unittest.mock import Mock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from aws_cloud_utilities.core.tag_filter import TagFilter, _arn_resource_type
+
+
+class TestMatches:
+    """Unit tests for TagFilter.matches across tag formats."""
+
+    @pytest.mark.parametrize(
+        "resource",
+        [
+            {"Tags": [{"Key": "Env", "Value": "prod"}]},
+            {"Tags": [{"key": "Env", "value": "prod"}]},
+            {"Tags": {"Env": "prod"}},
+            {"TagList": [{"Key": "Env", "Value": "prod"}]},
+            {"Name": "web", "tag:Env": "prod"},
+            {"Name": "web", "Tag:Env": "prod"},
+        ],
+    )
+    def test_matches_every_format(self, resource):
+        """The key/value pair is found in each supported format."""
+        assert TagFilter("Env", "prod").matches(resource)
+        assert TagFilter("Env").matches(resource)
+        assert not TagFilter("Env", "dev").matches(resource)
+        assert not TagFilter("Owner").matches(resource)
+
+    def test_tags_field_takes_precedence_over_taglist(self):
+        """Only the Tags field is consulted when present."""
+        resource = {"Tags": [], "TagList": [{"Key": "Env", "Value": "prod"}]}
+
+        assert not TagFilter("Env", "prod").matches(resource)
+
+    def test_disabled_filter_matches_everything(self):
+        """Without a tag key every resource matches."""
+        assert TagFilter().matches({})
+
+    def test_filter_resources(self):
+        """filter_resources keeps only matching resources."""
+        resources = [
+            {"Id": 1, "Tags": [{"Key": "Env", "Value": "prod"}]},
+            {"Id": 2, "Tags": [{"Key": "Env", "Value": "dev"}]},
+            {"Id": 3},
+        ]
+
+        assert [
+            r["Id"] for r in TagFilter("Env", "prod").filter_resources(resources)
+        ] == [1]
+
+
+def _tagging_auth(arns=None, error=None):
+    """Build a mock AWSAuth whose Tagging API returns the given ARNs."""
+    paginator = Mock()
+    if error is not None:
+        paginator.paginate.side_effect = error
+    else:
+        paginator.paginate.return_value = [
+            {"ResourceTagMappingList": [{"ResourceARN": arn} for arn in arns]}
+        ]
+    client = Mock()
+    client.get_paginator.return_value = paginator
+    aws_auth = Mock()
+    aws_auth.get_client.return_value = client
+    return aws_auth
+
+
+class TestPrefilter:
+    """Unit tests for server-side ARN prefiltering."""
+
+    def test_prefilter_arns_is_memoized_per_region(self):
+        """The Tagging API is queried once per region."""
+        aws_auth = _tagging_auth(["arn:a"])
+        tag_filter = TagFilter("Env", "prod", aws_auth=aws_auth)
+
+        assert tag_filter.prefilter_arns(region="us-east-1") == frozenset({"arn:a"})
+        tag_filter.prefilter_arns(region="us-east-1")
+        tag_filter.prefilter_arns(region="eu-west-1")
+
+        assert aws_auth.get_client.call_count == 2
+
+    def test_filter_resources_uses_arn_membership(self):
+        """Resources are kept by ARN; ones without an ARN use local tags."""
+        aws_auth = _tagging_auth(["arn:keep"])
+        tag_filter = TagFilter("Env", "prod", aws_auth=aws_auth)
+        resources = [
+            {"Id": 1, "Arn": "arn:keep"},
+            {"Id": 2, "Arn": "arn:drop", "Tags": {"Env": "prod"}},
+            {"Id": 3, "Tags": {"Env": "prod"}},
+        ]
+
+        filtered = tag_filter.filter_resources(
+            resources, arn_key=lambda r: r.get("Arn"), region="us-east-1"
+        )
+
+        assert [r["Id"] for r in filtered] == [1, 3]
+
+    def test_filter_resources_falls_back_when_api_fails(self):
+        """A Tagging API error falls back to client-side matching."""
+        error = ClientError(
+            {"Error": {"Code": "AccessDeniedException", "Message": "no"}},
+            "GetResources",
+        )
+        tag_filter = TagFilter("Env", "prod", aws_auth=_tagging_auth(error=error))
+        resources = [{"Id": 1, "Arn": "arn:a", "Tags": {"Env": "prod"}}]
+
+        filtered = tag_filter.filter_resources(
+            resources, arn_key=lambda r: r.get("Arn")
+        )
+
+        assert filtered == resources
+
+
+class TestGetResourceArnsByTag:
+    """Unit tests for batched Tagging API lookups."""
+
+    @pytest.mark.parametrize(
+        "arn,expected",
+        [
+            ("arn:aws:ec2:us-east-1:123:instance/i-1", "ec2:instance"),
+            ("arn:aws:lambda:us-east-1:123:function:fn", "lambda:function"),
+            ("arn:aws:logs:us-east-1:123:log-group:/aws/x", "logs:log-group"),
+            ("arn:aws:s3:::bucket", "s3"),
+        ],
+    )
+    def test_arn_resource_type(self, arn, expected):
+        """The resource type is parsed from the ARN."""
+        assert _arn_resource_type(arn) == expected
+
+    def test_groups_by_type_and_batches_filters(self):
+        """Types are sent 100 per call and results grouped by type."""
+        aws_auth = _tagging_auth(
+            [
+                "arn:aws:ec2:us-east-1:123:instance/i-1",
+                "arn:aws:rds:us-east-1:123:db:main",
+            ]
+        )
+        tag_filter = TagFilter("Env", aws_auth=aws_auth)
+        types = [f"svc:type{i}" for i in range(150)]
+
+        result = tag_filter.get_resource_arns_by_tag(types, region="us-east-1")
+
+        paginate = aws_auth.get_client.return_value.get_paginator.return_value.paginate
+        assert [
+            len(c.kwargs["ResourceTypeFilters"]) for c in paginate.call_args_list
+        ] == [100, 50]
+        assert all(
+            c.kwargs["PaginationConfig"] == {"PageSize": 100}
+            for c in paginate.call_args_list
+        )
+        assert result["ec2:instance"] == {"arn:aws:ec2:us-east-1:123:instance/i-1"}
+        assert result["rds:db"] == {"arn:aws:rds:us-east-1:123:db:main"}
+
+    def test_results_are_cached_across_instances(self):
+        """Identical queries within the TTL share one Tagging API call."""
+        aws_auth = _tagging_auth(["arn:aws:ec2:us-east-1:123:instance/i-1"])
+
+        first = TagFilter("Env", "prod", aws_auth=aws_auth).get_resource_arns_by_tag(
+            ["rds:db", "ec2:instance"], region="us-east-1"
+        )
+        first["ec2:instance"].clear()
+        second = TagFilter("Env", "prod", aws_auth=aws_auth).get_resource_arns_by_tag(
+            ["ec2:instance", "rds:db"], region="us-east-1"
+        )
+
+        assert aws_auth.get_client.call_count == 1
+        assert second["ec2:instance"] == {"arn:aws:ec2:us-east-1:123:instance/i-1"}
@@ -0,0 +1,48 @@
+"""Tests for common utilities."""
+
+import json
+
+from aws_cloud_utilities.core.utils import format_output, print_output, save_to_file
+
+
+class TestCsvOutput:
+    """Unit tests for CSV formatting and saving."""
+
+    ROWS = [
+        {"Model": "titan", "Type": "Foundation"},
+        {"Model": "mine", "Type": "Custom", "Status": "Active"},
+    ]
+
+    def test_save_to_file_writes_union_of_columns(self, tmp_path):
+        """Rows with extra keys add columns; missing keys are left blank."""
+        path = tmp_path / "models.csv"
+
+        save_to_file(self.ROWS, path, "csv")
+
+        assert path.read_bytes().decode().split("\r\n") == [
+            "Model,Type,Status",
+            "titan,Foundation,",
+            "mine,Custom,Active",
+            "",
+        ]
+
+    def test_format_output_matches_saved_file(self, tmp_path):
+        """format_output produces the same CSV as save_to_file."""
+        path = tmp_path / "models.csv"
+        save_to_file(self.ROWS, path, "csv")
+
+        assert format_output(self.ROWS, "csv") == path.read_bytes().decode()
+
+
+class TestPrintOutput:
+    """Unit tests for printing formatted output."""
+
+    def test_piped_json_keeps_unicode(self, capsys):
+        """Piped JSON is raw UTF-8, as console.print_json emitted it."""
+        data = {"Name": "café ✓"}
+
+        print_output(data, "json")
+
+        out = capsys.readouterr().out
+        assert "café ✓" in out
+        assert json.loads(out) == data